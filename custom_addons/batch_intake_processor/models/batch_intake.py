@@ -2,10 +2,29 @@
 
 from odoo import models, fields, api, _
 from odoo.exceptions import UserError, ValidationError
+import base64
+import csv
+import io
+import itertools
 import logging
 
 _logger = logging.getLogger(__name__)
 
+# Number of applicants inserted per create() call
+APPLICANT_CHUNK_SIZE = 1000
+
+# Expected column mappings: accepted header names of each applicant field
+APPLICANT_COLUMN_MAP = {
+    'name': ['name', 'full name', 'student name', 'applicant name'],
+    'email': ['email', 'e-mail', 'email address'],
+    'phone': ['phone', 'mobile', 'contact', 'phone number'],
+    'age': ['age'],
+    'education_level': ['education', 'education level', 'qualification'],
+    'gpa': ['gpa', 'grade', 'marks'],
+    'nationality': ['nationality', 'country'],
+    'english_level': ['english', 'english level'],
+}
+
 
 class BatchIntake(models.Model):
     """
@@ -148,19 +167,39 @@ class BatchIntake(models.Model):
     
     @api.depends('applicant_ids.eligibility_status')
     def _compute_statistics(self):
-        """Calculate statistics"""
+        """
+        Calculate statistics.
+        Status counts of all saved batches come from one grouped query; only
+        the batches whose applicants changed are recomputed by the ORM.
+        """
+        counts = {}
+        if self.ids:
+            groups = self.env['batch.intake.applicant']._read_group(
+                [('batch_id', 'in', self.ids)],
+                ['batch_id', 'eligibility_status'],
+                ['__count'],
+            )
+            for batch, status, count in groups:
+                counts.setdefault(batch.id, {})[status] = count
+        
         for record in self:
-            total = len(record.applicant_ids)
-            eligible = len(record.applicant_ids.filtered(lambda a: a.eligibility_status == 'eligible'))
-            not_eligible = len(record.applicant_ids.filtered(lambda a: a.eligibility_status == 'not_eligible'))
-            pending = len(record.applicant_ids.filtered(lambda a: a.eligibility_status == 'pending'))
-            error = len(record.applicant_ids.filtered(lambda a: a.eligibility_status == 'error'))
+            if record.id:
+                status_counts = counts.get(record.id, {})
+            else:
+                # Unsaved batch (form onchange): count the applicants in memory
+                status_counts = {}
+                for applicant in record.applicant_ids:
+                    status = applicant.eligibility_status
+                    status_counts[status] = status_counts.get(status, 0) + 1
+            
+            total = sum(status_counts.values())
+            eligible = status_counts.get('eligible', 0)
             
             record.total_count = total
             record.eligible_count = eligible
-            record.not_eligible_count = not_eligible
-            record.pending_count = pending
-            record.error_count = error
+            record.not_eligible_count = status_counts.get('not_eligible', 0)
+            record.pending_count = status_counts.get('pending', 0)
+            record.error_count = status_counts.get('error', 0)
             record.eligibility_rate = (eligible / total * 100) if total > 0 else 0.0
     
     @api.model_create_multi
@@ -230,110 +269,97 @@ class BatchIntake(models.Model):
         }
     
     def _parse_and_create_applicants(self):
-        """Parse file and create applicant records"""
+        """
+        Parse file and create applicant records.
+        Rows are streamed from the file and inserted in chunks of
+        APPLICANT_CHUNK_SIZE, so memory use does not grow with the file.
+        """
         self.ensure_one()
         
-        import base64
-        import io
-        
-        file_content = base64.b64decode(self.file_data)
+        file_stream = io.BytesIO(base64.b64decode(self.file_data))
         
         if self.file_type in ['xlsx', 'xls']:
-            applicants_data = self._parse_excel(file_content)
+            rows = self._iter_excel_rows(file_stream)
         else:
-            applicants_data = self._parse_csv(file_content)
+            rows = self._iter_csv_rows(file_stream)
         
-        # Create applicant records
-        for data in applicants_data:
-            data['batch_id'] = self.id
-            self.env['batch.intake.applicant'].create(data)
+        Applicant = self.env['batch.intake.applicant']
+        applicants_data = self._iter_applicants_data(rows)
+        created_count = 0
+        while True:
+            vals_list = list(itertools.islice(applicants_data, APPLICANT_CHUNK_SIZE))
+            if not vals_list:
+                break
+            for data in vals_list:
+                data['batch_id'] = self.id
+            Applicant.create(vals_list)
+            created_count += len(vals_list)
+        
+        _logger.info(f'Batch {self.name}: created {created_count} applicants')
     
-    def _parse_excel(self, file_content):
-        """Parse Excel file"""
+    def _iter_excel_rows(self, file_stream):
+        """Yield the rows of the active sheet of an Excel file as tuples, header first"""
         import openpyxl
-        import io
-        
-        applicants = []
-        workbook = openpyxl.load_workbook(io.BytesIO(file_content))
-        sheet = workbook.active
         
-        # Get headers from first row
-        headers = []
-        for cell in sheet[1]:
-            headers.append(str(cell.value).lower().strip() if cell.value else '')
+        workbook = openpyxl.load_workbook(file_stream, read_only=True, data_only=True)
+        try:
+            yield from workbook.active.iter_rows(values_only=True)
+        finally:
+            workbook.close()
+    
+    def _iter_csv_rows(self, file_stream):
+        """Yield the rows of a CSV file as lists, header first"""
+        yield from csv.reader(io.TextIOWrapper(file_stream, encoding='utf-8', newline=''))
+    
+    def _iter_applicants_data(self, rows):
+        """
+        Yield applicant values for the data rows of ``rows``.
+        Header names are resolved to column positions once for the file.
+        """
+        rows = iter(rows)
+        headers = next(rows, None) or []
+        headers = [str(header).lower().strip() if header else '' for header in headers]
+        column_indexes = self._resolve_column_indexes(headers)
         
-        # Parse data rows
-        for row_num, row in enumerate(sheet.iter_rows(min_row=2, values_only=True), start=2):
+        for row_num, row in enumerate(rows, start=2):
             try:
-                applicant_data = self._parse_row(headers, row, row_num)
+                applicant_data = self._parse_row(column_indexes, row, row_num)
                 if applicant_data:
-                    applicants.append(applicant_data)
+                    yield applicant_data
             except Exception as e:
                 _logger.warning(f'Error parsing row {row_num}: {e}')
                 # Create error record
-                applicants.append({
+                yield {
                     'name': f'Row {row_num}',
                     'eligibility_status': 'error',
                     'validation_notes': f'Error parsing row: {str(e)}'
-                })
-        
-        return applicants
+                }
     
-    def _parse_csv(self, file_content):
-        """Parse CSV file"""
-        import csv
-        import io
-        
-        applicants = []
-        csv_file = io.StringIO(file_content.decode('utf-8'))
-        reader = csv.DictReader(csv_file)
-        
-        # Normalize headers
-        headers = [h.lower().strip() for h in reader.fieldnames] if reader.fieldnames else []
-        
-        for row_num, row in enumerate(reader, start=2):
-            try:
-                # Convert row keys to lowercase
-                normalized_row = {k.lower().strip(): v for k, v in row.items()}
-                applicant_data = self._parse_row(headers, list(normalized_row.values()), row_num)
-                if applicant_data:
-                    applicants.append(applicant_data)
-            except Exception as e:
-                _logger.warning(f'Error parsing row {row_num}: {e}')
-                applicants.append({
-                    'name': f'Row {row_num}',
-                    'eligibility_status': 'error',
-                    'validation_notes': f'Error parsing row: {str(e)}'
-                })
-        
-        return applicants
+    def _resolve_column_indexes(self, headers):
+        """
+        Map each applicant field to the positions of its accepted headers.
+        Positions are kept in APPLICANT_COLUMN_MAP order, the first non-empty
+        value of a row wins.
+        """
+        column_indexes = []
+        for field, possible_names in APPLICANT_COLUMN_MAP.items():
+            indexes = [headers.index(col_name) for col_name in possible_names if col_name in headers]
+            if indexes:
+                column_indexes.append((field, indexes))
+        return column_indexes
     
-    def _parse_row(self, headers, row_values, row_num):
+    def _parse_row(self, column_indexes, row_values, row_num):
         """Parse a single row into applicant data"""
-        # Expected column mappings
-        column_map = {
-            'name': ['name', 'full name', 'student name', 'applicant name'],
-            'email': ['email', 'e-mail', 'email address'],
-            'phone': ['phone', 'mobile', 'contact', 'phone number'],
-            'age': ['age'],
-            'education_level': ['education', 'education level', 'qualification'],
-            'gpa': ['gpa', 'grade', 'marks'],
-            'nationality': ['nationality', 'country'],
-            'english_level': ['english', 'english level'],
-        }
-        
         data = {}
         
         # Map columns
-        for field, possible_names in column_map.items():
-            for col_name in possible_names:
-                if col_name in headers:
-                    idx = headers.index(col_name)
-                    if idx < len(row_values):
-                        value = row_values[idx]
-                        if value is not None and str(value).strip():
-                            data[field] = str(value).strip()
-                            break
+        for field, indexes in column_indexes:
+            for idx in indexes:
+                if idx < len(row_values):
+                    value = row_values[idx]
+                    if value is not None and str(value).strip():
+                        data[field] = str(value).strip()
+                        break
         
         # Validate required fields
         if not data.get('name'):
@@ -347,9 +373,11 @@ class BatchIntake(models.Model):
         
         criteria = self.env['batch.intake.eligibility.criteria'].search([], limit=1)
         
-        for applicant in self.applicant_ids:
-            if applicant.eligibility_status != 'error':
-                applicant.check_eligibility(criteria)
+        applicants = self.env['batch.intake.applicant'].search([
+            ('batch_id', '=', self.id),
+            ('eligibility_status', '!=', 'error'),
+        ])
+        applicants.check_eligibility_batch(criteria)
     
     def action_view_applicants(self):
         """View all applicants"""
@@ -103,10 +103,49 @@ class BatchIntakeApplicant(models.Model):
         If no criteria provided, use default rules.
         """
         self.ensure_one()
+        self.check_eligibility_batch(criteria)
+    
+    def check_eligibility_batch(self, criteria=None):
+        """
+        Check eligibility of all applicants in the recordset.
+        The criteria are loaded once and every applicant is evaluated in memory.
+        Applicants with identical check results are updated with one write,
+        and applicants with identical validation notes with another.
+        """
+        if not self:
+            return
         
         if not criteria:
             criteria = self.env['batch.intake.eligibility.criteria'].search([], limit=1)
         
+        # Group applicants by their resulting check and status values
+        groups = {}
+        notes_groups = {}
+        for applicant in self:
+            vals = applicant._evaluate_eligibility(criteria)
+            notes_groups.setdefault(vals.pop('validation_notes'), []).append(applicant.id)
+            groups.setdefault(tuple(sorted(vals.items())), []).append(applicant.id)
+        
+        status_counts = {}
+        for vals, applicant_ids in groups.items():
+            vals = dict(vals)
+            self.browse(applicant_ids).write(vals)
+            status = vals['eligibility_status']
+            status_counts[status] = status_counts.get(status, 0) + len(applicant_ids)
+        
+        for notes, applicant_ids in notes_groups.items():
+            self.browse(applicant_ids).write({'validation_notes': notes})
+        
+        _logger.info(f'Eligibility check for {len(self)} applicants ({len(groups) + len(notes_groups)} writes): {status_counts}')
+    
+    def _evaluate_eligibility(self, criteria):
+        """
+        Evaluate the applicant against the criteria without writing.
+        Returns the values of the eligibility fields to update.
+        """
+        self.ensure_one()
+        
+        vals = {}
         validation_notes = []
         checks_passed = 0
         total_checks = 0
@@ -115,72 +154,72 @@ class BatchIntakeApplicant(models.Model):
         if criteria and criteria.min_age:
             total_checks += 1
             if self.age and self.age >= criteria.min_age:
-                self.age_check = True
+                vals['age_check'] = True
                 checks_passed += 1
                 validation_notes.append(f'✓ Age ({self.age}) meets minimum requirement ({criteria.min_age})')
             else:
-                self.age_check = False
+                vals['age_check'] = False
                 validation_notes.append(f'✗ Age ({self.age or "N/A"}) below minimum ({criteria.min_age})')
         
         if criteria and criteria.max_age:
             if self.age and self.age <= criteria.max_age:
                 validation_notes.append(f'✓ Age ({self.age}) within maximum limit ({criteria.max_age})')
             else:
-                self.age_check = False
+                vals['age_check'] = False
                 validation_notes.append(f'✗ Age ({self.age or "N/A"}) exceeds maximum ({criteria.max_age})')
         
         # Education Check
         if criteria and criteria.required_education_level:
             total_checks += 1
             if self.education_level and criteria.required_education_level.lower() in self.education_level.lower():
-                self.education_check = True
+                vals['education_check'] = True
                 checks_passed += 1
                 validation_notes.append(f'✓ Education level ({self.education_level}) meets requirement')
             else:
-                self.education_check = False
+                vals['education_check'] = False
                 validation_notes.append(f'✗ Education level ({self.education_level or "N/A"}) does not meet requirement ({criteria.required_education_level})')
         
         # GPA Check
         if criteria and criteria.min_gpa:
             total_checks += 1
             if self.gpa and self.gpa >= criteria.min_gpa:
-                self.gpa_check = True
+                vals['gpa_check'] = True
                 checks_passed += 1
                 validation_notes.append(f'✓ GPA ({self.gpa}) meets minimum ({criteria.min_gpa})')
             else:
-                self.gpa_check = False
+                vals['gpa_check'] = False
                 validation_notes.append(f'✗ GPA ({self.gpa or "N/A"}) below minimum ({criteria.min_gpa})')
         
         # English Level Check
         if criteria and criteria.required_english_level:
             total_checks += 1
             if self.english_level and criteria.required_english_level.lower() in self.english_level.lower():
-                self.english_check = True
+                vals['english_check'] = True
                 checks_passed += 1
                 validation_notes.append(f'✓ English level ({self.english_level}) meets requirement')
             else:
-                self.english_check = False
+                vals['english_check'] = False
                 validation_notes.append(f'✗ English level ({self.english_level or "N/A"}) does not meet requirement ({criteria.required_english_level})')
         
         # Calculate score and determine eligibility
         if total_checks > 0:
-            self.eligibility_score = (checks_passed / total_checks) * 100
+            eligibility_score = (checks_passed / total_checks) * 100
+            vals['eligibility_score'] = eligibility_score
             
             # Determine eligibility based on score
             required_pass_rate = criteria.required_pass_rate if criteria else 80.0
-            if self.eligibility_score >= required_pass_rate:
-                self.eligibility_status = 'eligible'
-                validation_notes.insert(0, f'✓✓✓ ELIGIBLE - Score: {self.eligibility_score:.1f}% (Required: {required_pass_rate}%)')
+            if eligibility_score >= required_pass_rate:
+                vals['eligibility_status'] = 'eligible'
+                validation_notes.insert(0, f'✓✓✓ ELIGIBLE - Score: {eligibility_score:.1f}% (Required: {required_pass_rate}%)')
             else:
-                self.eligibility_status = 'not_eligible'
-                validation_notes.insert(0, f'✗✗✗ NOT ELIGIBLE - Score: {self.eligibility_score:.1f}% (Required: {required_pass_rate}%)')
+                vals['eligibility_status'] = 'not_eligible'
+                validation_notes.insert(0, f'✗✗✗ NOT ELIGIBLE - Score: {eligibility_score:.1f}% (Required: {required_pass_rate}%)')
         else:
-            self.eligibility_status = 'pending'
+            vals['eligibility_status'] = 'pending'
             validation_notes.insert(0, 'No eligibility criteria configured')
         
-        self.validation_notes = '\n'.join(validation_notes)
-        
-        _logger.info(f'Eligibility check for {self.name}: {self.eligibility_status} ({self.eligibility_score:.1f}%)')
+        vals['validation_notes'] = '\n'.join(validation_notes)
+        return vals
     
     def action_mark_eligible(self):
         """Manually mark as eligible"""
@@ -200,6 +239,5 @@ class BatchIntakeApplicant(models.Model):
     
     def action_recheck_eligibility(self):
         """Re-run eligibility check"""
-        for record in self:
-            record.check_eligibility()
+        self.check_eligibility_batch()
 
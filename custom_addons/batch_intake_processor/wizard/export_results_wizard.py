@@ -2,8 +2,26 @@
 
 from odoo import models, fields, api, _
 from odoo.exceptions import UserError
-import base64
+import csv
 import io
+import tempfile
+
+# Number of applicants read per search_read() call during an export
+EXPORT_CHUNK_SIZE = 2000
+
+# Exported applicant fields, in column order
+EXPORT_COLUMNS = [
+    ('name', 'Name'),
+    ('email', 'Email'),
+    ('phone', 'Phone'),
+    ('age', 'Age'),
+    ('nationality', 'Nationality'),
+    ('education_level', 'Education'),
+    ('gpa', 'GPA'),
+    ('english_level', 'English Level'),
+    ('eligibility_status', 'Eligibility Status'),
+    ('eligibility_score', 'Score'),
+]
 
 
 class ExportResultsWizard(models.TransientModel):
@@ -37,8 +55,15 @@ class ExportResultsWizard(models.TransientModel):
         default=True
     )
     
+    exported_attachment_id = fields.Many2one(
+        'ir.attachment',
+        string='Exported Attachment',
+        readonly=True
+    )
+    
     exported_file = fields.Binary(
         string='Exported File',
+        related='exported_attachment_id.datas',
         readonly=True
     )
     
@@ -52,6 +77,13 @@ class ExportResultsWizard(models.TransientModel):
         ('done', 'Done')
     ], default='draft')
     
+    def unlink(self):
+        """Remove the exported files with the wizards, including when they are vacuumed"""
+        attachments = self.exported_attachment_id
+        result = super(ExportResultsWizard, self).unlink()
+        attachments.sudo().exists().unlink()
+        return result
+    
     def action_export(self):
         """Export results"""
         self.ensure_one()
@@ -61,19 +93,29 @@ class ExportResultsWizard(models.TransientModel):
         if self.filter_status != 'all':
             domain.append(('eligibility_status', '=', self.filter_status))
         
-        applicants = self.env['batch.intake.applicant'].search(domain)
-        
-        if not applicants:
+        if not self.env['batch.intake.applicant'].search_count(domain):
             raise UserError(_('No applicants found matching the filter criteria.'))
         
-        # Generate export file
-        if self.export_format == 'xlsx':
-            file_data, filename = self._export_excel(applicants)
-        else:
-            file_data, filename = self._export_csv(applicants)
+        # Generate export file in a temporary file, then store it as an attachment.
+        # Rows are streamed, so only the finished file is ever held in memory:
+        # ir.attachment takes it as one bytes value, which bounds the export to
+        # what the worker can hold (about the file size, twice at peak)
+        with tempfile.TemporaryFile() as output:
+            if self.export_format == 'xlsx':
+                filename, mimetype = self._export_excel(domain, output)
+            else:
+                filename, mimetype = self._export_csv(domain, output)
+            output.seek(0)
+            attachment = self.env['ir.attachment'].create({
+                'name': filename,
+                'raw': output.read(),
+                'mimetype': mimetype,
+                'res_model': self._name,
+                'res_id': self.id,
+            })
         
         self.write({
-            'exported_file': base64.b64encode(file_data),
+            'exported_attachment_id': attachment.id,
             'exported_filename': filename,
             'state': 'done'
         })
@@ -86,109 +128,105 @@ class ExportResultsWizard(models.TransientModel):
             'target': 'new',
         }
     
-    def _export_excel(self, applicants):
-        """Export to Excel"""
+    def _export_headers(self):
+        """Return the exported field names and column headers"""
+        columns = list(EXPORT_COLUMNS)
+        if self.include_validation_notes:
+            columns.append(('validation_notes', 'Validation Notes'))
+        return [field for field, _header in columns], [header for _field, header in columns]
+    
+    def _iter_export_rows(self, domain, field_names):
+        """
+        Yield the exported values of the applicants matching ``domain``.
+        Applicants are read in id order, EXPORT_CHUNK_SIZE at a time.
+        """
+        Applicant = self.env['batch.intake.applicant']
+        status_labels = dict(Applicant._fields['eligibility_status'].selection)
+        last_id = 0
+        while True:
+            applicants = Applicant.search_read(
+                domain + [('id', '>', last_id)], field_names, order='id', limit=EXPORT_CHUNK_SIZE
+            )
+            if not applicants:
+                return
+            for applicant in applicants:
+                row = []
+                for field in field_names:
+                    if field == 'eligibility_status':
+                        row.append(status_labels.get(applicant[field]))
+                    elif field == 'eligibility_score':
+                        row.append(applicant[field])
+                    else:
+                        row.append(applicant[field] or '')
+                yield applicant['eligibility_status'], row
+            last_id = applicants[-1]['id']
+            # Keep memory bounded: drop the chunk from the record cache
+            Applicant.invalidate_model(field_names)
+    
+    def _export_excel(self, domain, output):
+        """Export to Excel, writing rows to ``output`` as they are read"""
         import openpyxl
+        from openpyxl.cell import WriteOnlyCell
         from openpyxl.styles import Font, PatternFill, Alignment
+        from openpyxl.utils import get_column_letter
         
-        workbook = openpyxl.Workbook()
-        sheet = workbook.active
-        sheet.title = 'Batch Results'
+        workbook = openpyxl.Workbook(write_only=True)
+        sheet = workbook.create_sheet('Batch Results')
         
-        # Headers
-        headers = ['Name', 'Email', 'Phone', 'Age', 'Nationality', 'Education', 'GPA', 'English Level', 
-                   'Eligibility Status', 'Score']
-        if self.include_validation_notes:
-            headers.append('Validation Notes')
+        field_names, headers = self._export_headers()
+        
+        # Column widths must be set before rows are written (no auto-size pass)
+        for col_num, field in enumerate(field_names, 1):
+            width = 50 if field == 'validation_notes' else max(len(headers[col_num - 1]) + 2, 15)
+            sheet.column_dimensions[get_column_letter(col_num)].width = width
         
         # Style headers
         header_fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
         header_font = Font(bold=True, color='FFFFFF')
-        
-        for col_num, header in enumerate(headers, 1):
-            cell = sheet.cell(row=1, column=col_num, value=header)
+        header_cells = []
+        for header in headers:
+            cell = WriteOnlyCell(sheet, value=header)
             cell.fill = header_fill
             cell.font = header_font
             cell.alignment = Alignment(horizontal='center')
+            header_cells.append(cell)
+        sheet.append(header_cells)
+        
+        # Color code status
+        status_fills = {
+            'eligible': PatternFill(start_color='C6EFCE', end_color='C6EFCE', fill_type='solid'),
+            'not_eligible': PatternFill(start_color='FFC7CE', end_color='FFC7CE', fill_type='solid'),
+        }
+        status_index = field_names.index('eligibility_status')
         
         # Data rows
-        for row_num, applicant in enumerate(applicants, 2):
-            sheet.cell(row=row_num, column=1, value=applicant.name)
-            sheet.cell(row=row_num, column=2, value=applicant.email or '')
-            sheet.cell(row=row_num, column=3, value=applicant.phone or '')
-            sheet.cell(row=row_num, column=4, value=applicant.age or '')
-            sheet.cell(row=row_num, column=5, value=applicant.nationality or '')
-            sheet.cell(row=row_num, column=6, value=applicant.education_level or '')
-            sheet.cell(row=row_num, column=7, value=applicant.gpa or '')
-            sheet.cell(row=row_num, column=8, value=applicant.english_level or '')
-            sheet.cell(row=row_num, column=9, value=dict(applicant._fields['eligibility_status'].selection).get(applicant.eligibility_status))
-            sheet.cell(row=row_num, column=10, value=applicant.eligibility_score)
-            
-            if self.include_validation_notes:
-                sheet.cell(row=row_num, column=11, value=applicant.validation_notes or '')
-            
-            # Color code status
-            status_cell = sheet.cell(row=row_num, column=9)
-            if applicant.eligibility_status == 'eligible':
-                status_cell.fill = PatternFill(start_color='C6EFCE', end_color='C6EFCE', fill_type='solid')
-            elif applicant.eligibility_status == 'not_eligible':
-                status_cell.fill = PatternFill(start_color='FFC7CE', end_color='FFC7CE', fill_type='solid')
-        
-        # Auto-size columns
-        for column in sheet.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(cell.value)
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            sheet.column_dimensions[column_letter].width = adjusted_width
-        
-        # Save to bytes
-        output = io.BytesIO()
+        for status, row in self._iter_export_rows(domain, field_names):
+            if status in status_fills:
+                status_cell = WriteOnlyCell(sheet, value=row[status_index])
+                status_cell.fill = status_fills[status]
+                row[status_index] = status_cell
+            sheet.append(row)
+        
         workbook.save(output)
-        output.seek(0)
         
         filename = f'batch_{self.batch_id.name}_results.xlsx'
-        return output.read(), filename
+        return filename, 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
     
-    def _export_csv(self, applicants):
-        """Export to CSV"""
-        import csv
-        
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Headers
-        headers = ['Name', 'Email', 'Phone', 'Age', 'Nationality', 'Education', 'GPA', 'English Level', 
-                   'Eligibility Status', 'Score']
-        if self.include_validation_notes:
-            headers.append('Validation Notes')
+    def _export_csv(self, domain, output):
+        """Export to CSV, writing rows to ``output`` as they are read"""
+        text_output = io.TextIOWrapper(output, encoding='utf-8', newline='')
+        writer = csv.writer(text_output)
         
+        field_names, headers = self._export_headers()
         writer.writerow(headers)
         
         # Data rows
-        for applicant in applicants:
-            row = [
-                applicant.name,
-                applicant.email or '',
-                applicant.phone or '',
-                applicant.age or '',
-                applicant.nationality or '',
-                applicant.education_level or '',
-                applicant.gpa or '',
-                applicant.english_level or '',
-                dict(applicant._fields['eligibility_status'].selection).get(applicant.eligibility_status),
-                applicant.eligibility_score
-            ]
-            if self.include_validation_notes:
-                row.append(applicant.validation_notes or '')
-            
+        for _status, row in self._iter_export_rows(domain, field_names):
             writer.writerow(row)
         
+        # Hand the binary file back to the caller
+        text_output.flush()
+        text_output.detach()
+        
         filename = f'batch_{self.batch_id.name}_results.csv'
-        return output.getvalue().encode('utf-8'), filename
-
+        return filename, 'text/csv'
@@ -3,3 +3,4 @@
 from . import main
 from . import student_portal
 from . import public_demo_portal
+from . import training_dashboard
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+
+import logging
+from datetime import timezone
+
+from werkzeug.http import http_date, quote_etag
+
+from odoo import http
+from odoo.http import request
+
+_logger = logging.getLogger(__name__)
+
+
+class TrainingDashboardController(http.Controller):
+    """Read endpoint serving the precomputed training dashboard data"""
+
+    @http.route(['/grants/training_dashboard/data',
+                 '/grants/training_dashboard/<int:dashboard_id>/data'],
+                type='http', auth='user', methods=['GET'])
+    def training_dashboard_data(self, dashboard_id=None, **kw):
+        """Return the dashboard payload, or 304 when the client copy is current"""
+        # Fetch one column at a time: the version first, the payload only if needed
+        Dashboard = request.env['gr.training.dashboard'].with_context(prefetch_fields=False)
+        if dashboard_id:
+            dashboard = Dashboard.browse(dashboard_id).exists()
+        else:
+            dashboard = Dashboard.search([], limit=1)
+        if not dashboard:
+            raise request.not_found()
+
+        # Editing the date range recomputes the payload without touching last_update
+        last_update = max(filter(None, (dashboard.last_update, dashboard.write_date)))
+        last_update = last_update.replace(microsecond=0, tzinfo=timezone.utc)
+        etag = '%s-%d' % (dashboard.id, last_update.timestamp())
+        headers = [
+            ('ETag', quote_etag(etag)),
+            ('Last-Modified', http_date(last_update)),
+            ('Cache-Control', 'private, no-cache'),
+        ]
+
+        httprequest = request.httprequest
+        if httprequest.if_none_match:
+            not_modified = httprequest.if_none_match.contains(etag)
+        else:
+            not_modified = bool(httprequest.if_modified_since and httprequest.if_modified_since >= last_update)
+        if not_modified:
+            return request.make_response(b'', headers=headers, status=304)
+
+        payload = dashboard.analytics_payload or dashboard._build_analytics_payload()
+        return request.make_json_response(payload, headers=headers)
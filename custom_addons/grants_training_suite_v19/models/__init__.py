@@ -38,6 +38,8 @@ from . import training_program
 
 # Model 10: Progress Tracker
 from . import progress_tracker
+from . import elearning_progress_change
+from . import slide_channel_partner
 
 # Phase 5: Enhanced Course Features
 # Model: Course Category
@@ -49,6 +51,7 @@ from . import course_review
 # Phase 3: Advanced Analytics Models
 # Model 11: Training Dashboard
 from . import training_dashboard
+from . import training_analytics_snapshot
 
 # Model 12: Notification System
 from . import notification_system
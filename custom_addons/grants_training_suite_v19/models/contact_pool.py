@@ -1,12 +1,15 @@
 # -*- coding: utf-8 -*-
 
 import logging
-from datetime import datetime, timedelta
+from datetime import timedelta
 from odoo import models, fields, api, _
 from odoo.exceptions import UserError, ValidationError
 
 _logger = logging.getLogger(__name__)
 
+# Contacts without an activity due in this many days are counted as idle
+IDLE_CONTACT_DAYS = 30
+
 
 class ContactPool(models.Model):
     _name = 'contact.pool'
@@ -77,14 +80,14 @@ class ContactPool(models.Model):
     last_activity_date = fields.Datetime(
         string='Last Activity Date',
         compute='_compute_pool_activities',
-        store=False,
+        store=True,
         help='Most recent activity date from contacts in this pool'
     )
 
     idle_contacts_count = fields.Integer(
         string='Idle Contacts',
         compute='_compute_pool_activities',
-        store=False,
+        store=True,
         help='Number of contacts with no activity in the last 30 days'
     )
 
@@ -92,21 +95,21 @@ class ContactPool(models.Model):
     leads_distributed_count = fields.Integer(
         string='Leads Distributed',
         compute='_compute_pool_metrics',
-        store=False,
+        store=True,
         help='Total number of leads from contacts in this pool'
     )
 
     leads_won_count = fields.Integer(
         string='Won Leads',
         compute='_compute_pool_metrics',
-        store=False,
+        store=True,
         help='Number of won leads from contacts in this pool'
     )
 
     conversion_rate = fields.Float(
         string='Conversion Rate (%)',
         compute='_compute_pool_metrics',
-        store=False,
+        store=True,
         digits=(16, 2),
         help='Percentage of leads converted to won'
     )
@@ -114,7 +117,7 @@ class ContactPool(models.Model):
     average_days_to_convert = fields.Float(
         string='Avg Days to Convert',
         compute='_compute_pool_metrics',
-        store=False,
+        store=True,
         digits=(16, 1),
         help='Average number of days to convert a lead'
     )
@@ -127,95 +130,84 @@ class ContactPool(models.Model):
         for pool in self:
             pool.contact_count = len(pool.contact_ids)
 
-    @api.depends('contact_ids')
+    @api.depends('contact_ids', 'contact_ids.activity_ids.active', 'contact_ids.activity_ids.date_deadline')
     def _compute_pool_activities(self):
         """Compute activity-related metrics for the pool"""
+        # Last activity per contact, then aggregated per pool, in one query
+        # for all pools. The stored values are recomputed when the activities
+        # of the pool contacts change, and daily for the idle cutoff.
+        stats = {}
+        if self.ids:
+            self.env['res.partner'].flush_model(['pool_id', 'active'])
+            self.env['mail.activity'].flush_model(['res_model', 'res_id', 'active', 'date_deadline'])
+            cutoff_date = fields.Date.today() - timedelta(days=IDLE_CONTACT_DAYS)
+            self.env.cr.execute("""
+                SELECT partner.pool_id,
+                       max(activity.last_deadline),
+                       count(*) FILTER (WHERE activity.last_deadline IS NULL
+                                           OR activity.last_deadline < %s)
+                  FROM res_partner partner
+             LEFT JOIN (SELECT res_id, max(date_deadline) AS last_deadline
+                          FROM mail_activity
+                         WHERE res_model = 'res.partner'
+                           AND active
+                      GROUP BY res_id) activity ON activity.res_id = partner.id
+                 WHERE partner.pool_id IN %s
+                   AND partner.active
+              GROUP BY partner.pool_id
+            """, (cutoff_date, tuple(self.ids)))
+            stats = {pool_id: (last_deadline, idle_count) for pool_id, last_deadline, idle_count in self.env.cr.fetchall()}
+        
         for pool in self:
-            # Get all contacts in the pool
-            contacts = pool.contact_ids
-            
-            # Get most recent activity date from all contacts
-            if contacts:
-                activities = self.env['mail.activity'].search([
-                    ('res_model', '=', 'res.partner'),
-                    ('res_id', 'in', contacts.ids)
-                ], order='date_deadline desc', limit=1)
-                
-                pool.last_activity_date = activities.date_deadline if activities else False
-                
-                # Count idle contacts (no activity in last 30 days)
-                cutoff_date = datetime.now() - timedelta(days=30)
-                
-                idle_count = 0
-                for contact in contacts:
-                    contact_activities = self.env['mail.activity'].search([
-                        ('res_model', '=', 'res.partner'),
-                        ('res_id', '=', contact.id),
-                        ('date_deadline', '>=', cutoff_date)
-                    ], limit=1)
-                    if not contact_activities:
-                        idle_count += 1
-                
-                pool.idle_contacts_count = idle_count
-            else:
-                pool.last_activity_date = False
-                pool.idle_contacts_count = 0
+            last_deadline, idle_count = stats.get(pool.id, (False, 0))
+            pool.last_activity_date = last_deadline or False
+            pool.idle_contacts_count = idle_count
 
-    @api.depends('contact_ids')
+    @api.depends('contact_ids', 'contact_ids.opportunity_ids.active',
+                 'contact_ids.opportunity_ids.probability', 'contact_ids.opportunity_ids.date_closed')
     def _compute_pool_metrics(self):
         """Compute pool utilization metrics"""
+        # Lead counts and conversion days aggregated per pool in one query for
+        # all pools, recomputed when the leads of the pool contacts change
+        stats = {}
+        if self.ids:
+            self.env['res.partner'].flush_model(['pool_id'])
+            self.env['crm.lead'].flush_model(['partner_id', 'active', 'probability', 'date_closed'])
+            self.env.cr.execute("""
+                SELECT partner.pool_id,
+                       count(*),
+                       count(*) FILTER (WHERE lead.probability = 100),
+                       avg(extract(day FROM coalesce(lead.date_closed, lead.write_date) - lead.create_date))
+                           FILTER (WHERE lead.probability = 100 AND lead.create_date IS NOT NULL)
+                  FROM crm_lead lead
+                  JOIN res_partner partner ON partner.id = lead.partner_id
+                 WHERE partner.pool_id IN %s
+                   AND lead.active
+              GROUP BY partner.pool_id
+            """, (tuple(self.ids),))
+            stats = {pool_id: values for pool_id, *values in self.env.cr.fetchall()}
+        
         for pool in self:
-            # Get all contacts in the pool
-            contacts = pool.contact_ids
+            leads_count, won_count, average_days = stats.get(pool.id, (0, 0, None))
+            pool.leads_distributed_count = leads_count
+            pool.leads_won_count = won_count
             
-            if contacts:
-                # Get all leads linked to pool contacts
-                leads = self.env['crm.lead'].search([
-                    ('partner_id', 'in', contacts.ids)
-                ])
-                
-                pool.leads_distributed_count = len(leads)
-                
-                # Get won leads
-                won_leads = leads.filtered(lambda l: l.probability == 100 or getattr(l, 'is_won', False))
-                pool.leads_won_count = len(won_leads)
-                
-                # Calculate conversion rate
-                if pool.leads_distributed_count > 0:
-                    pool.conversion_rate = (pool.leads_won_count / pool.leads_distributed_count) * 100
-                else:
-                    pool.conversion_rate = 0.0
-                
-                # Calculate average days to convert
-                if won_leads:
-                    total_days = 0
-                    count = 0
-                    for lead in won_leads:
-                        if lead.create_date:
-                            # Use date_closed if available, otherwise use write_date as approximation
-                            close_date = getattr(lead, 'date_closed', False) or lead.write_date or datetime.now()
-                            if isinstance(close_date, str):
-                                close_date = fields.Datetime.from_string(close_date)
-                            elif isinstance(close_date, datetime):
-                                pass
-                            else:
-                                close_date = datetime.now()
-                            
-                            create_dt = lead.create_date
-                            if isinstance(create_dt, str):
-                                create_dt = fields.Datetime.from_string(create_dt)
-                            
-                            delta = close_date - create_dt
-                            total_days += delta.days
-                            count += 1
-                    pool.average_days_to_convert = total_days / count if count > 0 else 0.0
-                else:
-                    pool.average_days_to_convert = 0.0
+            # Calculate conversion rate
+            if leads_count > 0:
+                pool.conversion_rate = (won_count / leads_count) * 100
             else:
-                pool.leads_distributed_count = 0
-                pool.leads_won_count = 0
                 pool.conversion_rate = 0.0
-                pool.average_days_to_convert = 0.0
+            
+            # Average days to convert, from date_closed or write_date as approximation
+            pool.average_days_to_convert = float(average_days or 0.0)
+
+    @api.model
+    def _cron_refresh_idle_contacts(self):
+        """Recompute the idle contacts of all pools as the idle cutoff moves"""
+        pools = self.search([])
+        self.env.add_to_compute(self._fields['idle_contacts_count'], pools)
+        pools.flush_recordset(['last_activity_date', 'idle_contacts_count'])
+        _logger.info('Idle contacts refreshed for %d contact pools', len(pools))
 
     @api.constrains('name')
     def _check_name(self):
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, api, _
+import logging
+import time
+from datetime import timedelta
+
+_logger = logging.getLogger(__name__)
+
+# Number of logged changes applied to the trackers per micro-batch
+CHANGE_BATCH_SIZE = 500
+
+# Delay before applying logged changes, so bursts are applied together
+CHANGE_APPLY_DELAY_SECONDS = 30
+
+
+class ElearningProgressChange(models.Model):
+    """Log of eLearning enrollments whose completion changed.
+
+    Rows are queued when ``slide.channel.partner.completion`` is written and
+    applied to the progress trackers in micro-batches by a triggered cron,
+    which reads the current completion of the enrollments: several changes of
+    one enrollment are applied once.
+    """
+    _name = 'gr.elearning.progress.change'
+    _description = 'eLearning Progress Change'
+    _order = 'id'
+    _log_access = False
+
+    enrollment_id = fields.Many2one(
+        'slide.channel.partner',
+        string='eLearning Enrollment',
+        required=True,
+        index=True,
+        ondelete='cascade'
+    )
+
+    @api.model
+    def _log_changes(self, enrollments):
+        """Queue the enrollments whose completion changed and schedule their application."""
+        self.sudo().create([{'enrollment_id': enrollment.id} for enrollment in enrollments])
+        cron = self.env.ref('grants_training_suite_v19.ir_cron_apply_elearning_progress_changes', raise_if_not_found=False)
+        if cron:
+            cron.sudo()._trigger(at=fields.Datetime.now() + timedelta(seconds=CHANGE_APPLY_DELAY_SECONDS))
+
+    @api.model
+    def _cron_apply_changes(self, time_budget=240):
+        """Apply the logged changes to the progress trackers, committing after each micro-batch.
+
+        The run stops when ``time_budget`` seconds are spent; the cron is then
+        re-triggered for the remaining changes.
+        """
+        deadline = time.monotonic() + time_budget
+        Change = self.sudo()
+        applied_count = synced_count = 0
+        
+        while time.monotonic() < deadline:
+            changes = Change.search([], limit=CHANGE_BATCH_SIZE)
+            if not changes:
+                break
+            
+            trackers = self.env['gr.progress.tracker'].sudo().search([
+                ('elearning_enrollment_id', 'in', changes.enrollment_id.ids),
+                ('status', 'in', ['not_started', 'in_progress'])
+            ])
+            result = trackers._sync_elearning_progress()
+            changes.unlink()
+            # Tracker updates and the consumed changes are committed together
+            self.env.cr.commit()
+            
+            applied_count += len(changes)
+            synced_count += result['sync_count']
+        
+        if applied_count:
+            _logger.info('Applied %d eLearning progress changes: %d trackers updated', applied_count, synced_count)
+        
+        if Change.search_count([], limit=1):
+            self.env.ref('grants_training_suite_v19.ir_cron_apply_elearning_progress_changes')._trigger()
@@ -1,16 +1,342 @@
 # -*- coding: utf-8 -*-
 
 import base64
+import contextlib
 import csv
+import gzip
 import io
+import itertools
 import json
 import logging
-from datetime import datetime
+import re
+import tempfile
+import time
+from datetime import date, datetime
 from odoo import models, fields, api, _
 from odoo.exceptions import UserError, ValidationError
 
 _logger = logging.getLogger(__name__)
 
+# Number of rows written per create()/search() call during bulk student import
+IMPORT_CHUNK_SIZE = 500
+
+# Batches above this number of records are processed by the background job
+LARGE_BATCH_THRESHOLD = 1000
+
+# Number of rows validated per column pass
+VALIDATION_CHUNK_SIZE = 10000
+
+# Number of row-level events kept by the import telemetry
+IMPORT_EVENT_SAMPLE_SIZE = 20
+
+# Trailing digits compared when matching phone numbers, so that the local
+# (05...) and international (+9665...) forms of a number match
+PHONE_MATCH_DIGITS = 9
+
+# Accepted formats of the date columns of an intake file, in order of preference
+DATE_COLUMN_FORMATS = {
+    'birth_date': ['%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y'],
+    'certificate_date': ['%Y-%m-%d'],
+}
+
+# Number of distinct values sampled to infer the format of a date column
+DATE_SAMPLE_SIZE = 200
+
+# Compiled regular expressions of the date formats, shared by all parsers
+_DATE_FORMAT_CACHE = {}
+
+
+class _DateColumnParser(object):
+    """Parse the values of one date column with a format inferred once.
+
+    The dominant format is inferred from a sample of the column (or given
+    explicitly) and compiled to a regular expression; the other accepted
+    formats are only tried for values it does not match. A value it matches
+    is only checked against the formats sharing its layout (such as
+    DD/MM/YYYY and MM/DD/YYYY), to detect ambiguous values. Results are
+    cached per distinct value, and invalid or ambiguous values are collected
+    so they can be reported once for the whole column; ``ambiguous`` maps
+    each value matching several formats to the format it was read with.
+    """
+
+    _directives = {'%Y': r'(\d{4})', '%m': r'(\d{1,2})', '%d': r'(\d{1,2})'}
+
+    def __init__(self, formats, sample=(), date_format=None):
+        self.formats = list(formats)
+        if date_format not in self.formats:
+            date_format = self._infer_format(sample)
+        self.date_format = date_format
+        self.ordered_formats = [date_format] + [fmt for fmt in self.formats if fmt != date_format]
+        layout = self._get_compiled(date_format)[0].pattern
+        self._same_layout_formats = [fmt for fmt in self.ordered_formats[1:]
+                                     if self._get_compiled(fmt)[0].pattern == layout]
+        self.invalid = set()
+        self.ambiguous = {}
+        self._cache = {}
+
+    def __call__(self, value):
+        """Return the ``date`` for ``value``, or None if it is empty or invalid."""
+        if not value:
+            return None
+        if value not in self._cache:
+            self._cache[value] = self._parse(value)
+        return self._cache[value]
+
+    def _parse(self, value):
+        result = self._parse_with(self.date_format, value)
+        if result:
+            formats = self._same_layout_formats
+            parsed = [(self.date_format, result)]
+        else:
+            formats = self.ordered_formats[1:]
+            parsed = []
+        for fmt in formats:
+            result = self._parse_with(fmt, value)
+            if result:
+                parsed.append((fmt, result))
+        if not parsed:
+            self.invalid.add(value)
+            return None
+        if len({result for _fmt, result in parsed}) > 1:
+            self.ambiguous[value] = parsed[0][0]
+        return parsed[0][1]
+
+    @classmethod
+    def _compile(cls, date_format):
+        pattern = re.escape(date_format)
+        order = []
+        for directive, group in cls._directives.items():
+            escaped = re.escape(directive)
+            if escaped in pattern:
+                pattern = pattern.replace(escaped, group)
+                order.append((date_format.index(directive), directive))
+        return re.compile(pattern), [directive for _position, directive in sorted(order)]
+
+    @classmethod
+    def _get_compiled(cls, date_format):
+        compiled = _DATE_FORMAT_CACHE.get(date_format)
+        if compiled is None:
+            compiled = _DATE_FORMAT_CACHE[date_format] = cls._compile(date_format)
+        return compiled
+
+    def _parse_with(self, date_format, value):
+        regex, directives = self._get_compiled(date_format)
+        match = regex.fullmatch(value)
+        if not match:
+            return None
+        parts = dict(zip(directives, (int(group) for group in match.groups())))
+        try:
+            return date(parts['%Y'], parts['%m'], parts['%d'])
+        except ValueError:
+            return None
+
+    def _infer_format(self, sample):
+        """Return the accepted format parsing most of the sampled values."""
+        counts = dict.fromkeys(self.formats, 0)
+        for value in sample:
+            for fmt in self.formats:
+                if self._parse_with(fmt, value):
+                    counts[fmt] += 1
+        # max() keeps the first format on ties, i.e. the preferred one
+        return max(self.formats, key=lambda fmt: counts[fmt])
+
+    @staticmethod
+    def label(date_format):
+        return date_format.replace('%Y', 'YYYY').replace('%m', 'MM').replace('%d', 'DD')
+
+
+class _ValidationColumns(object):
+    """Column operations of the intake validation engine.
+
+    Columns and masks are lists aligned with the rows of one chunk, so each
+    rule is a single list pass instead of a per-row chain of checks.
+    """
+
+    def __init__(self, records):
+        self.records = records
+        self.size = len(records)
+
+    def raw(self, field):
+        return ['' if record.get(field) is None else str(record.get(field)) for record in self.records]
+
+    def strip(self, column):
+        return [value.strip() for value in column]
+
+    def lower(self, column):
+        return [value.lower() for value in column]
+
+    def map(self, column, function):
+        # Each distinct value is computed once
+        results = {}
+        for value in column:
+            if value not in results:
+                results[value] = function(value)
+        return [results[value] for value in column]
+
+    def is_empty(self, column):
+        return [not value for value in column]
+
+    def is_in(self, column, values):
+        values = set(values)
+        return [value in values for value in column]
+
+    def not_in(self, column, values):
+        values = set(values)
+        return [bool(value) and value not in values for value in column]
+
+    def invalid_email(self, column):
+        return [bool(value) and ('@' not in value or '.' not in value.rsplit('@', 1)[-1]) for value in column]
+
+    def duplicated(self, column, candidates, seen):
+        """Flag candidate values already in ``seen`` or earlier in the column, and record the new ones."""
+        flags = []
+        for value, candidate in zip(column, candidates):
+            if candidate and value in seen:
+                flags.append(True)
+            else:
+                if candidate:
+                    seen.add(value)
+                flags.append(False)
+        return flags
+
+    def both(self, mask, other):
+        return [flag and other_flag for flag, other_flag in zip(mask, other)]
+
+    def negate(self, mask):
+        return [not flag for flag in mask]
+
+    def positions(self, mask):
+        return [position for position, flag in enumerate(mask) if flag]
+
+
+class _DuplicateIndex(object):
+    """Normalized identity keys of the students known to an intake import.
+
+    A student is identified by its lowercased email, its phone number and its
+    name together with its birth date. Each key maps to the first target
+    added for it: an existing ``gr.student`` or a row queued for creation.
+    """
+
+    labels = {'email': 'email', 'phone': 'phone', 'name_birth_date': 'name and birth date'}
+
+    def __init__(self):
+        self._targets = {}
+        self._keys_by_target = {}
+
+    def __contains__(self, key):
+        return key in self._targets
+
+    @staticmethod
+    def keys(email, phone, name, birth_date):
+        """Return the ``(kind, value)`` keys of a student, most reliable first."""
+        keys = []
+        email = (email or '').strip().lower()
+        if email:
+            keys.append(('email', email))
+        digits = re.sub(r'\D', '', phone or '')
+        if len(digits) >= PHONE_MATCH_DIGITS:
+            keys.append(('phone', digits[-PHONE_MATCH_DIGITS:]))
+        name = ' '.join((name or '').lower().split())
+        if name and birth_date:
+            keys.append(('name_birth_date', f'{name}|{birth_date.isoformat()}'))
+        return keys
+
+    def match(self, keys):
+        """Return ``(kind, target)`` for the first known key, or ``(None, None)``."""
+        for key in keys:
+            if key in self._targets:
+                return key[0], self._targets[key]
+        return None, None
+
+    def add(self, keys, target):
+        for key in keys:
+            if key not in self._targets:
+                self._targets[key] = target
+                self._keys_by_target.setdefault(id(target), []).append(key)
+
+    def replace(self, target, new_target=None):
+        """Point the keys held by ``target`` to ``new_target``, or drop them."""
+        for key in self._keys_by_target.pop(id(target), []):
+            if new_target is None:
+                del self._targets[key]
+            else:
+                self._targets[key] = new_target
+
+
+class _ImportTelemetry(object):
+    """Counts, stage timings and sampled row events of one student import.
+
+    One summary line is logged per chunk and one for the whole import. Row
+    events are kept up to ``sample_size`` and logged one by one only when
+    the module logger is at DEBUG level.
+    """
+
+    def __init__(self, batch_name, sample_size=IMPORT_EVENT_SAMPLE_SIZE):
+        self.batch_name = batch_name
+        self.sample_size = sample_size
+        self.debug = _logger.isEnabledFor(logging.DEBUG)
+        self.counts = dict.fromkeys(['rows', 'created', 'updated', 'skipped', 'errors'], 0)
+        self.timings = {}
+        self.events = []
+        self.event_count = 0
+        self._started = time.monotonic()
+        self._chunk_counts = dict(self.counts)
+        self._chunk_started = self._started
+
+    def count(self, key, number=1):
+        self.counts[key] += number
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """Add the time spent in the ``with`` block to the ``name`` stage."""
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + time.monotonic() - started
+
+    def iterate(self, name, iterable):
+        """Yield the items of ``iterable``, timing each step as the ``name`` stage."""
+        iterator = iter(iterable)
+        while True:
+            with self.stage(name):
+                item = next(iterator, self)
+            if item is self:
+                return
+            yield item
+
+    def event(self, kind, row_number, message, record=None):
+        """Record a row-level event; only a bounded sample is kept."""
+        self.event_count += 1
+        if len(self.events) < self.sample_size:
+            self.events.append((kind, row_number, message))
+        if self.debug:
+            _logger.debug('Batch %s row %d %s: %s %s', self.batch_name, row_number, kind, message,
+                          record if record is not None else '')
+
+    def flush_chunk(self):
+        """Log one summary line for the rows counted since the previous flush."""
+        now = time.monotonic()
+        delta = {key: self.counts[key] - self._chunk_counts[key] for key in self.counts}
+        _logger.info('Batch %s: imported %d rows in %.2fs (%d created, %d updated, %d skipped, %d errors)',
+                     self.batch_name, delta['rows'], now - self._chunk_started,
+                     delta['created'], delta['updated'], delta['skipped'], delta['errors'])
+        self._chunk_counts = dict(self.counts)
+        self._chunk_started = now
+
+    def log_summary(self):
+        """Log the totals, the time per stage and the sampled events of the import."""
+        stages = ', '.join(f'{name} {seconds:.2f}s' for name, seconds in self.timings.items())
+        _logger.info('Student import completed for batch %s: %d rows, %d created, %d updated, %d skipped, '
+                     '%d errors in %.2fs (%s)', self.batch_name, self.counts['rows'], self.counts['created'],
+                     self.counts['updated'], self.counts['skipped'], self.counts['errors'],
+                     time.monotonic() - self._started, stages)
+        if self.events:
+            sample = '; '.join(f'row {row_number} {kind}: {message}' for kind, row_number, message in self.events)
+            _logger.warning('Batch %s: %d row events, first %d: %s',
+                            self.batch_name, self.event_count, len(self.events), sample)
+
+
 class IntakeBatch(models.Model):
     _name = 'gr.intake.batch'
     _description = 'Grants Training Intake Batch'
@@ -46,6 +372,27 @@ class IntakeBatch(models.Model):
         ('xlsx', 'Excel File'),
     ], string='File Type', compute='_compute_file_type', store=True)
     
+    # Parsed Rows Cache
+    row_cache_id = fields.Many2one(
+        'ir.attachment',
+        string='Parsed Rows Cache',
+        copy=False,
+        ondelete='set null',
+        help='Compressed, normalized copy of the file rows written by the first full parse'
+    )
+    
+    row_cache_checksum = fields.Char(
+        string='Parsed Rows Checksum',
+        copy=False,
+        help='Checksum of the uploaded file the parsed rows cache was built from'
+    )
+    
+    date_formats = fields.Char(
+        string='Detected Date Formats',
+        copy=False,
+        help='JSON mapping of each date column to the format detected in the uploaded file'
+    )
+    
     # Column Mapping Fields
     column_mapping = fields.Text(
         string='Column Mapping',
@@ -124,6 +471,29 @@ class IntakeBatch(models.Model):
         ('failed', 'Failed'),
     ], string='Processing Progress', default='pending')
     
+    # Background Processing Fields
+    processing_job_state = fields.Selection([
+        ('none', 'Not Queued'),
+        ('queued', 'Queued'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ], string='Background Job', default='none', copy=False,
+       help='State of the background job processing this batch in chunks')
+    
+    processing_chunk_size = fields.Integer(
+        string='Chunk Size',
+        default=IMPORT_CHUNK_SIZE,
+        help='Number of rows committed per chunk by the background job'
+    )
+    
+    processing_checkpoint = fields.Integer(
+        string='Rows Committed',
+        default=0,
+        copy=False,
+        help='Number of file rows already committed by the background job; processing resumes from here'
+    )
+    
     # Processing Fields
     total_records = fields.Integer(
         string='Total Records',
@@ -165,6 +535,17 @@ class IntakeBatch(models.Model):
         help='Number of existing students updated'
     )
     
+    skipped_students_count = fields.Integer(
+        string='Rows Merged',
+        default=0,
+        help='Number of rows merged into another row of the file with the same email'
+    )
+    
+    possible_duplicates = fields.Text(
+        string='Possible Duplicates',
+        help='Imported rows matching another student by phone or by name and birth date'
+    )
+    
     import_errors = fields.Text(
         string='Import Errors',
         help='Details of errors during student creation'
@@ -367,7 +748,8 @@ class IntakeBatch(models.Model):
             else:
                 record.success_rate = 0.0
     
-    @api.depends('state', 'upload_progress', 'mapping_progress', 'validation_progress', 'processing_progress')
+    @api.depends('state', 'upload_progress', 'mapping_progress', 'validation_progress', 'processing_progress',
+                 'processing_checkpoint', 'total_records')
     def _compute_progress_percentage(self):
         """Compute overall progress percentage."""
         for record in self:
@@ -382,7 +764,11 @@ class IntakeBatch(models.Model):
             }
             
             # Base progress from state
-            if record.state in stage_values:
+            if record.state == 'validated' and record.processing_progress == 'in_progress' and record.total_records:
+                # Background job running: processing stage advances with committed rows
+                done_ratio = min(record.processing_checkpoint / record.total_records, 1.0)
+                progress = stage_values['validated'] + 25.0 * done_ratio
+            elif record.state in stage_values:
                 progress = stage_values[record.state]
             elif record.state == 'error':
                 # If error, show progress up to the failed stage
@@ -401,7 +787,8 @@ class IntakeBatch(models.Model):
             
             record.progress_percentage = progress
     
-    @api.depends('state', 'upload_progress', 'mapping_progress', 'validation_progress', 'processing_progress')
+    @api.depends('state', 'upload_progress', 'mapping_progress', 'validation_progress', 'processing_progress',
+                 'processing_job_state', 'processing_checkpoint', 'total_records')
     def _compute_current_stage(self):
         """Compute current stage description."""
         for record in self:
@@ -411,6 +798,9 @@ class IntakeBatch(models.Model):
                 record.current_stage = 'File Uploaded - Ready for Mapping'
             elif record.state == 'mapping':
                 record.current_stage = 'Column Mapping Required'
+            elif record.state == 'validated' and record.processing_job_state in ['queued', 'running']:
+                record.current_stage = 'Processing in Background (%d/%d rows)' % (
+                    record.processing_checkpoint, record.total_records)
             elif record.state == 'validated':
                 record.current_stage = 'File Validated - Ready for Processing'
             elif record.state == 'processed':
@@ -486,6 +876,13 @@ class IntakeBatch(models.Model):
         
         return super(IntakeBatch, self).create(vals_list)
     
+    def write(self, vals):
+        """Override write to drop the parsed rows cache when the file changes."""
+        if 'file_data' in vals:
+            self._clear_row_cache()
+            vals = dict(vals, date_formats=False)
+        return super(IntakeBatch, self).write(vals)
+    
     def action_upload_file(self):
         """Action to upload and validate file."""
         self.ensure_one()
@@ -509,12 +906,11 @@ class IntakeBatch(models.Model):
             # Set upload progress to in_progress
             self.upload_progress = 'in_progress'
             
-            # Parse file and count records
-            records = self._parse_file()
-            self.total_records = len(records)
+            # Stream the file and count records
+            self.total_records = sum(1 for _record in self._iter_file_rows())
             
             # Validate that we have records
-            if not records:
+            if not self.total_records:
                 self.upload_progress = 'failed'
                 raise UserError(_('No records found in the uploaded file. Please check the file format and content.'))
             
@@ -561,11 +957,7 @@ class IntakeBatch(models.Model):
                 return self.action_process_with_mapping()
             else:
                 # Legacy direct validation (for backward compatibility)
-                records = self._parse_file()
-                self.total_records = len(records)
-                
-                # Validate records
-                errors = self._validate_records(records)
+                errors = self._validate_records(self._iter_file_rows())
                 
                 if errors:
                     self.validation_errors = '\n'.join(errors)
@@ -615,14 +1007,9 @@ class IntakeBatch(models.Model):
             # Set processing progress to in_progress
             self.processing_progress = 'in_progress'
             
-            # Parse file again
-            _logger.info('Parsing file for batch %s', self.name)
-            records = self._parse_file()
-            _logger.info('File parsed successfully: %d records found', len(records))
-            
-            # Create students
+            # Stream the file rows straight into student creation
             _logger.info('Creating students for batch %s', self.name)
-            created_students = self._create_students(records)
+            created_students = self._create_students(self._iter_import_rows())
             
             # Update counters and progress
             self.processed_records = len(created_students) + self.updated_students_count
@@ -644,7 +1031,7 @@ class IntakeBatch(models.Model):
                 success_message += f" {error_count} errors encountered."
             
             success_details = {
-                'total_records': len(records),
+                'total_records': self.total_records,
                 'students_created': self.created_students_count,
                 'students_updated': self.updated_students_count,
                 'errors': error_count,
@@ -693,369 +1080,259 @@ class IntakeBatch(models.Model):
             raise UserError(_('Error processing file: %s') % str(e))
     
     def _parse_file(self):
-        """Parse the uploaded file and return records."""
+        """Parse the uploaded file and return all records as a list."""
+        return list(self._iter_file_rows())
+    
+    def _iter_file_rows(self):
+        """Yield the rows of the uploaded file one by one as dictionaries.
+
+        The first full pass parses the file and writes the parsed rows cache;
+        later passes read that cache instead of parsing the file again.
+        """
         if not self.file_data:
-            return []
+            return
+        
+        source = self._get_file_attachment()
+        if source.checksum and self.row_cache_id and self.row_cache_checksum == source.checksum:
+            yield from self._iter_row_cache()
+        elif source.checksum:
+            yield from self._iter_rows_building_cache(source.checksum)
+        else:
+            yield from self._iter_source_rows()
+    
+    def _iter_source_rows(self):
+        """Parse the uploaded file itself and yield its rows.
+
+        The file is read incrementally from the filestore, so memory use does
+        not grow with the number of rows.
+        """
+        _logger.info('Parsing file: filename=%s, file_type=%s', self.filename, self.file_type)
+        
+        filename = (self.filename or '').lower()
+        if self.file_type == 'csv':
+            parser = self._iter_csv_rows
+        elif self.file_type == 'xlsx' and filename.endswith('.xlsx'):
+            parser = self._iter_xlsx_rows
+        elif self.file_type == 'xlsx' and filename.endswith('.xls'):
+            parser = self._iter_xls_rows
+        else:
+            _logger.error('Unsupported file type: %s (filename: %s)', self.file_type, self.filename)
+            raise UserError(_('Unsupported file type: %s') % self.file_type)
         
         try:
-            # Decode file data
-            file_data = base64.b64decode(self.file_data)
-            
-            _logger.info('Parsing file: filename=%s, file_type=%s', self.filename, self.file_type)
-            
-            if self.file_type == 'csv':
-                return self._parse_csv(file_data)
-            elif self.file_type == 'xlsx':
-                return self._parse_excel(file_data)
-            else:
-                _logger.error('Unsupported file type: %s (filename: %s)', self.file_type, self.filename)
-                raise UserError(_('Unsupported file type: %s') % self.file_type)
-                
+            with self._open_file_stream() as stream:
+                yield from parser(stream)
+        except UserError:
+            raise
         except Exception as e:
             _logger.error('Error parsing file: %s', str(e))
             raise UserError(_('Error parsing file: %s') % str(e))
     
-    def _parse_csv(self, file_data):
-        """Parse CSV file and return records."""
+    def _open_file_stream(self):
+        """Open the uploaded file as a binary stream, straight from the filestore when possible."""
+        self.ensure_one()
+        attachment = self._get_file_attachment()
+        if attachment.store_fname:
+            return open(attachment._full_path(attachment.store_fname), 'rb')
+        # Database storage (or pending cache value): decode the base64 content
+        return io.BytesIO(base64.b64decode(self.file_data))
+    
+    def _get_file_attachment(self):
+        """Return the ``ir.attachment`` holding the uploaded file."""
+        self.ensure_one()
+        return self.env['ir.attachment'].sudo().search([
+            ('res_model', '=', self._name),
+            ('res_id', '=', self.id),
+            ('res_field', '=', 'file_data'),
+        ], limit=1)
+    
+    # ===== PARSED ROWS CACHE METHODS =====
+    
+    def _iter_rows_building_cache(self, checksum):
+        """Yield the parsed file rows and store them as the rows cache once fully read.
+
+        The cache is gzip-compressed JSON lines: the header on the first line,
+        then one list of values per row. Consumers that stop early (previews)
+        leave no cache behind.
+        """
+        headers = None
+        with tempfile.TemporaryFile() as buffer:
+            with gzip.GzipFile(fileobj=buffer, mode='wb') as cache_file:
+                for record in self._iter_source_rows():
+                    if headers is None:
+                        headers = list(record)
+                        cache_file.write(self._dump_cache_line(headers))
+                    cache_file.write(self._dump_cache_line([record.get(header, '') for header in headers]))
+                    yield record
+            
+            buffer.seek(0)
+            self._store_row_cache(buffer.read(), checksum)
+    
+    def _dump_cache_line(self, values):
+        """Encode one rows cache line."""
+        return json.dumps(values, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+    
+    def _store_row_cache(self, content, checksum):
+        """Replace the rows cache with ``content`` built from the file with ``checksum``."""
+        self.ensure_one()
+        old_cache = self.row_cache_id
+        cache = self.env['ir.attachment'].sudo().create({
+            'name': '%s-rows.jsonl.gz' % self.name,
+            'type': 'binary',
+            'raw': content,
+            'mimetype': 'application/gzip',
+            'res_model': self._name,
+            'res_id': self.id,
+        })
+        # Bypass write() so that storing the cache is not seen as a file change
+        super(IntakeBatch, self).write({'row_cache_id': cache.id, 'row_cache_checksum': checksum})
+        old_cache.unlink()
+        _logger.info('Parsed rows cache stored for batch %s (%d bytes)', self.name, len(content))
+    
+    def _iter_row_cache(self):
+        """Yield the rows stored in the rows cache."""
+        cache = self.row_cache_id.sudo()
+        if cache.store_fname:
+            cache_file = gzip.open(cache._full_path(cache.store_fname), 'rb')
+        else:
+            cache_file = gzip.GzipFile(fileobj=io.BytesIO(cache.raw), mode='rb')
+        with cache_file:
+            headers = None
+            for line in cache_file:
+                values = json.loads(line)
+                if headers is None:
+                    headers = values
+                    continue
+                yield dict(zip(headers, values))
+    
+    def _clear_row_cache(self):
+        """Delete the parsed rows cache of the batches."""
+        caches = self.sudo().row_cache_id
+        if caches:
+            super(IntakeBatch, self).write({'row_cache_id': False, 'row_cache_checksum': False})
+            caches.unlink()
+    
+    def _normalize_cell_value(self, value):
+        """Convert a spreadsheet cell value to the string form used by CSV rows."""
+        if value is None:
+            return ''
+        if isinstance(value, datetime):
+            if value.hour or value.minute or value.second:
+                return value.isoformat(sep=' ')
+            return value.date().isoformat()
+        if isinstance(value, date):
+            return value.isoformat()
+        if isinstance(value, float) and value.is_integer():
+            return str(int(value))
+        return str(value)
+    
+    def _iter_csv_rows(self, stream):
+        """Yield CSV rows, decoding the stream incrementally."""
+        text_stream = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
         try:
-            # Convert bytes to string
-            file_content = file_data.decode('utf-8')
-            _logger.info('CSV content length: %d characters', len(file_content))
-            
-            # Parse CSV
-            csv_reader = csv.DictReader(io.StringIO(file_content))
-            records = list(csv_reader)
-            
-            _logger.info('CSV parsed successfully: %d records found', len(records))
-            if records:
-                _logger.info('CSV headers: %s', list(records[0].keys()))
-                # Debug: Log the first record to see what data is being parsed
-                _logger.info('First record data: %s', records[0])
-            
-            return records
-            
-        except Exception as e:
-            _logger.error('Error parsing CSV: %s', str(e))
+            yield from csv.DictReader(text_stream)
+        except UnicodeDecodeError as e:
             raise UserError(_('Error parsing CSV file: %s') % str(e))
+        finally:
+            text_stream.detach()
     
-    def _parse_excel(self, file_data):
-        """Parse Excel file and return records."""
+    def _iter_xlsx_rows(self, stream):
+        """Yield .xlsx rows using openpyxl in read-only mode."""
         try:
-            # Determine file format and choose appropriate parser
-            if self.filename.endswith('.xlsx'):
-                # For .xlsx files, try pandas with openpyxl first
-                try:
-                    import pandas as pd
-                    _logger.info('Parsing .xlsx file using pandas with openpyxl')
-                    
-                    excel_file = io.BytesIO(file_data)
-                    df = pd.read_excel(excel_file, engine='openpyxl')
-                    records = df.fillna('').to_dict('records')
-                    
-                    _logger.info('Excel parsed successfully: %d records found', len(records))
-                    if records:
-                        _logger.info('Excel headers: %s', list(records[0].keys()))
-                    
-                    return records
-                    
-                except ImportError:
-                    raise UserError(_('Excel .xlsx files require pandas and openpyxl libraries. Please install: pip install pandas openpyxl'))
-                except Exception as e:
-                    raise UserError(_('Error parsing .xlsx file with pandas: %s') % str(e))
-                    
-            elif self.filename.endswith('.xls'):
-                # For .xls files, try pandas with xlrd first, then fallback to xlrd only
-                try:
-                    import pandas as pd
-                    _logger.info('Parsing .xls file using pandas with xlrd')
-                    
-                    excel_file = io.BytesIO(file_data)
-                    df = pd.read_excel(excel_file, engine='xlrd')
-                    records = df.fillna('').to_dict('records')
-                    
-                    _logger.info('Excel parsed successfully: %d records found', len(records))
-                    if records:
-                        _logger.info('Excel headers: %s', list(records[0].keys()))
-                    
-                    return records
-                    
-                except ImportError:
-                    # Fallback to xlrd only
-                    _logger.warning('pandas not available, falling back to xlrd only')
-                    return self._parse_excel_xlrd(file_data)
-                except Exception as e:
-                    _logger.warning('pandas failed, falling back to xlrd: %s', str(e))
-                    return self._parse_excel_xlrd(file_data)
-            else:
-                raise UserError(_('Unsupported Excel format. Please use .xlsx or .xls files.'))
-
-        except UserError:
-            # Re-raise UserError as-is
-            raise
-        except Exception as e:
-            _logger.error('Unexpected error parsing Excel: %s', str(e))
-            raise UserError(_('Error parsing Excel file: %s') % str(e))
-    
-    def _parse_excel_xlrd(self, file_data):
-        """Parse Excel file using xlrd (fallback method)."""
+            import openpyxl
+        except ImportError:
+            raise UserError(_('Excel .xlsx files require the openpyxl library. Please install: pip install openpyxl'))
+        
+        workbook = openpyxl.load_workbook(stream, read_only=True, data_only=True)
+        try:
+            rows = workbook.worksheets[0].iter_rows(values_only=True)
+            headers = [self._normalize_cell_value(value).strip() for value in next(rows, ())]
+            for values in rows:
+                record = {
+                    header: self._normalize_cell_value(value)
+                    for header, value in zip(headers, values) if header
+                }
+                # Read-only sheets may report trailing blank rows
+                if any(record.values()):
+                    yield record
+        finally:
+            workbook.close()
+    
+    def _iter_xls_rows(self, stream):
+        """Yield legacy .xls rows using xlrd with on-demand sheet loading."""
         try:
             import xlrd
-            
-            # Create a BytesIO object from the file data
-            excel_file = io.BytesIO(file_data)
-            
-            # Open workbook
-            workbook = xlrd.open_workbook(file_contents=excel_file.read())
-            sheet = workbook.sheet_by_index(0)  # Use first sheet
-            
-            # Get headers from first row
-            headers = [str(cell.value) for cell in sheet.row(0)]
-            _logger.info('Excel headers (xlrd): %s', headers)
-            
-            # Convert rows to dictionaries
-            records = []
-            for row_idx in range(1, sheet.nrows):  # Skip header row
-                row_data = {}
-                for col_idx, header in enumerate(headers):
-                    cell_value = sheet.cell(row_idx, col_idx).value
-                    # Convert cell value to string, handle empty cells
-                    row_data[header] = str(cell_value) if cell_value else ''
-                records.append(row_data)
-            
-            _logger.info('Excel parsed successfully (xlrd): %d records found', len(records))
-            return records
-            
-        except Exception as e:
-            _logger.error('Error parsing Excel with xlrd: %s', str(e))
-            raise UserError(_('Error parsing Excel file with xlrd: %s') % str(e))
+        except ImportError:
+            raise UserError(_('Excel .xls files require the xlrd library. Please install: pip install xlrd'))
+        
+        workbook = xlrd.open_workbook(file_contents=stream.read(), on_demand=True)
+        try:
+            sheet = workbook.sheet_by_index(0)
+            if not sheet.nrows:
+                return
+            headers = [self._normalize_cell_value(cell.value).strip() for cell in sheet.row(0)]
+            for row_idx in range(1, sheet.nrows):
+                record = {}
+                for header, cell in zip(headers, sheet.row(row_idx)):
+                    if not header:
+                        continue
+                    value = cell.value
+                    if cell.ctype == xlrd.XL_CELL_DATE:
+                        value = xlrd.xldate_as_datetime(value, workbook.datemode)
+                    record[header] = self._normalize_cell_value(value)
+                yield record
+        finally:
+            workbook.release_resources()
+    
+    def _iter_import_rows(self):
+        """Yield file rows with the saved column mapping applied, if any."""
+        mapping = json.loads(self.column_mapping) if self.column_mapping else None
+        for record in self._iter_file_rows():
+            yield self._apply_column_mapping(record, mapping) if mapping else record
+    
+    def _apply_column_mapping(self, record, mapping):
+        """Return ``record`` keyed by student field according to ``mapping``."""
+        return {
+            field: record[column]
+            for field, column in mapping.items()
+            if column and column in record
+        }
+    
+    def _split_into_chunks(self, rows, size):
+        """Yield lists of at most ``size`` rows from the ``rows`` iterable."""
+        rows = iter(rows)
+        while True:
+            chunk = list(itertools.islice(rows, size))
+            if not chunk:
+                return
+            yield chunk
     
     def _validate_records(self, records):
         """Validate records and return list of errors with detailed feedback."""
-        errors = []
-        warnings = []
+        result = self._run_validation_engine(records)
         
-        # Required fields (updated for Phase 1.1 enhancements)
-        required_fields = ['name', 'name_arabic', 'name_english', 'email']
-        optional_fields = ['phone', 'birth_date', 'gender', 'nationality', 'native_language', 'english_level', 'has_certificate']
-        
-        # Track duplicate emails and names
-        email_set = set()
-        name_set = set()
-        
-        for i, record in enumerate(records, 1):
-            # Check required fields
-            for field in required_fields:
-                if not record.get(field) or str(record.get(field)).strip() == '':
-                    errors.append(f'Row {i}: Missing required field "{field}"')
-            
-            # Validate email format and uniqueness
-            email = record.get('email', '').strip()
-            if email:
-                if '@' not in email or '.' not in email.split('@')[-1]:
-                    errors.append(f'Row {i}: Invalid email format "{email}"')
-                elif email.lower() in email_set:
-                    errors.append(f'Row {i}: Duplicate email address "{email}"')
-                else:
-                    email_set.add(email.lower())
-            
-            # Validate name uniqueness (warning, not error)
-            name = record.get('name', '').strip()
-            if name:
-                if name in name_set:
-                    warnings.append(f'Row {i}: Duplicate name "{name}" (may be intentional)')
-                else:
-                    name_set.add(name)
-            
-            # Validate birth_date format if provided
-            birth_date = record.get('birth_date', '').strip()
-            if birth_date:
-                try:
-                    # Try to parse common date formats
-                    datetime.strptime(birth_date, '%Y-%m-%d')
-                except ValueError:
-                    try:
-                        datetime.strptime(birth_date, '%d/%m/%Y')
-                    except ValueError:
-                        try:
-                            datetime.strptime(birth_date, '%m/%d/%Y')
-                        except ValueError:
-                            errors.append(f'Row {i}: Invalid date format for birth_date "{birth_date}". Use YYYY-MM-DD format.')
-            
-            # Validate gender if provided
-            gender = record.get('gender', '').strip().lower()
-            if gender and gender not in ['male', 'female', 'm', 'f']:
-                errors.append(f'Row {i}: Invalid gender "{record.get("gender")}". Use "male", "female", "m", or "f".')
-            
-            # Validate english_level if provided
-            english_level = record.get('english_level', '').strip().lower()
-            valid_levels = ['beginner', 'elementary', 'intermediate', 'upper_intermediate', 'advanced']
-            if english_level and english_level not in valid_levels:
-                errors.append(f'Row {i}: Invalid english_level "{record.get("english_level")}". Valid options: {", ".join(valid_levels)}')
-            
-            # Validate has_certificate if provided
-            has_cert = record.get('has_certificate', '').strip().lower()
-            if has_cert and has_cert not in ['true', 'false', 'yes', 'no', '1', '0']:
-                errors.append(f'Row {i}: Invalid has_certificate value "{record.get("has_certificate")}". Use "true"/"false" or "yes"/"no".')
-            
-            # Validate certificate consistency
-            if has_cert in ['true', 'yes', '1']:
-                cert_type = record.get('certificate_type', '').strip()
-                cert_date = record.get('certificate_date', '').strip()
-                if not cert_type and not cert_date:
-                    warnings.append(f'Row {i}: Has certificate is true but no certificate details provided')
-                elif cert_date:
-                    try:
-                        datetime.strptime(cert_date, '%Y-%m-%d')
-                    except ValueError:
-                        errors.append(f'Row {i}: Invalid certificate_date format "{cert_date}". Use YYYY-MM-DD format.')
-            
-            # Validate birth date reasonableness (warning)
-            if birth_date:
-                try:
-                    parsed_date = datetime.strptime(birth_date, '%Y-%m-%d')
-                    current_year = datetime.now().year
-                    if parsed_date.year < 1900 or parsed_date.year > current_year:
-                        warnings.append(f'Row {i}: Birth date "{birth_date}" seems unusual')
-                except ValueError:
-                    pass  # Already handled above
+        # Records may be a stream: keep the number of rows actually seen
+        self.total_records = result['row_count']
         
         # Store warnings for later reference (Phase 2.3 enhancement)
-        if warnings:
-            self.validation_warnings = '\n'.join(warnings)
+        if result['warnings']:
+            self.validation_warnings = '\n'.join(result['warnings'])
         else:
             self.validation_warnings = False
         
-        return errors
+        return result['errors']
     
     def _validate_records_with_details(self, records):
         """Validate records and return detailed error information for failed records management."""
-        errors = []
-        warnings = []
-        failed_records = []
+        result = self._run_validation_engine(records)
+        failed_records = result['failed_records']
         
-        # Required fields (updated for Phase 1.1 enhancements)
-        required_fields = ['name', 'name_arabic', 'name_english', 'email']
-        optional_fields = ['phone', 'birth_date', 'gender', 'nationality', 'native_language', 'english_level', 'has_certificate']
-        
-        # Track duplicate emails and names
-        email_set = set()
-        name_set = set()
-        
-        for i, record in enumerate(records, 1):
-            record_errors = []
-            record_warnings = []
-            
-            # Check required fields
-            for field in required_fields:
-                if not record.get(field) or str(record.get(field)).strip() == '':
-                    error_msg = f'Missing required field "{field}"'
-                    errors.append(f'Row {i}: {error_msg}')
-                    record_errors.append(error_msg)
-            
-            # Validate email format and uniqueness
-            email = record.get('email', '').strip()
-            if email:
-                if '@' not in email or '.' not in email.split('@')[-1]:
-                    error_msg = f'Invalid email format "{email}"'
-                    errors.append(f'Row {i}: {error_msg}')
-                    record_errors.append(error_msg)
-                elif email.lower() in email_set:
-                    error_msg = f'Duplicate email address "{email}"'
-                    errors.append(f'Row {i}: {error_msg}')
-                    record_errors.append(error_msg)
-                else:
-                    email_set.add(email.lower())
-            
-            # Validate name uniqueness (warning, not error)
-            name = record.get('name', '').strip()
-            if name:
-                if name in name_set:
-                    warning_msg = f'Duplicate name "{name}" (may be intentional)'
-                    warnings.append(f'Row {i}: {warning_msg}')
-                    record_warnings.append(warning_msg)
-                else:
-                    name_set.add(name)
-            
-            # Validate birth_date format if provided
-            birth_date = record.get('birth_date', '').strip()
-            if birth_date:
-                try:
-                    # Try to parse common date formats
-                    datetime.strptime(birth_date, '%Y-%m-%d')
-                except ValueError:
-                    try:
-                        datetime.strptime(birth_date, '%d/%m/%Y')
-                    except ValueError:
-                        try:
-                            datetime.strptime(birth_date, '%m/%d/%Y')
-                        except ValueError:
-                            error_msg = f'Invalid date format for birth_date "{birth_date}". Use YYYY-MM-DD format.'
-                            errors.append(f'Row {i}: {error_msg}')
-                            record_errors.append(error_msg)
-            
-            # Validate gender if provided
-            gender = record.get('gender', '').strip().lower()
-            if gender and gender not in ['male', 'female', 'm', 'f']:
-                error_msg = f'Invalid gender "{record.get("gender")}". Use "male", "female", "m", or "f".'
-                errors.append(f'Row {i}: {error_msg}')
-                record_errors.append(error_msg)
-            
-            # Validate english_level if provided
-            english_level = record.get('english_level', '').strip().lower()
-            valid_levels = ['beginner', 'elementary', 'intermediate', 'upper_intermediate', 'advanced']
-            if english_level and english_level not in valid_levels:
-                error_msg = f'Invalid english_level "{record.get("english_level")}". Valid options: {", ".join(valid_levels)}'
-                errors.append(f'Row {i}: {error_msg}')
-                record_errors.append(error_msg)
-            
-            # Validate has_certificate if provided
-            has_cert = record.get('has_certificate', '').strip().lower()
-            if has_cert and has_cert not in ['true', 'false', 'yes', 'no', '1', '0']:
-                error_msg = f'Invalid has_certificate value "{record.get("has_certificate")}". Use "true"/"false" or "yes"/"no".'
-                errors.append(f'Row {i}: {error_msg}')
-                record_errors.append(error_msg)
-            
-            # Validate certificate consistency
-            if has_cert in ['true', 'yes', '1']:
-                cert_type = record.get('certificate_type', '').strip()
-                cert_date = record.get('certificate_date', '').strip()
-                if not cert_type and not cert_date:
-                    warning_msg = f'Has certificate is true but no certificate details provided'
-                    warnings.append(f'Row {i}: {warning_msg}')
-                    record_warnings.append(warning_msg)
-                elif cert_date:
-                    try:
-                        datetime.strptime(cert_date, '%Y-%m-%d')
-                    except ValueError:
-                        error_msg = f'Invalid certificate_date format "{cert_date}". Use YYYY-MM-DD format.'
-                        errors.append(f'Row {i}: {error_msg}')
-                        record_errors.append(error_msg)
-            
-            # Validate birth date reasonableness (warning)
-            if birth_date:
-                try:
-                    parsed_date = datetime.strptime(birth_date, '%Y-%m-%d')
-                    current_year = datetime.now().year
-                    if parsed_date.year < 1900 or parsed_date.year > current_year:
-                        warning_msg = f'Birth date "{birth_date}" seems unusual'
-                        warnings.append(f'Row {i}: {warning_msg}')
-                        record_warnings.append(warning_msg)
-                except ValueError:
-                    pass  # Already handled above
-            
-            # Store failed record if it has errors
-            if record_errors:
-                failed_records.append({
-                    'row_number': i,
-                    'data': record,
-                    'errors': record_errors,
-                    'warnings': record_warnings,
-                    'status': 'failed'
-                })
+        # Records may be a stream: keep the number of rows actually seen
+        self.total_records = result['row_count']
         
         # Store warnings for later reference
-        if warnings:
-            self.validation_warnings = '\n'.join(warnings)
+        if result['warnings']:
+            self.validation_warnings = '\n'.join(result['warnings'])
         else:
             self.validation_warnings = False
         
@@ -1072,7 +1349,170 @@ class IntakeBatch(models.Model):
         else:
             self.failed_records_data = False
         
-        return errors
+        return result['errors']
+    
+    # ===== COLUMNAR VALIDATION ENGINE =====
+    
+    def _run_validation_engine(self, records):
+        """Validate ``records`` column by column, one chunk of rows at a time.
+
+        Each rule runs over a whole column of the chunk, and distinct date
+        values are parsed only once. Returns a dict with the row-prefixed
+        ``errors`` and ``warnings``, the ``failed_records`` used by the
+        correction wizard and the ``row_count``.
+        """
+        errors = []
+        warnings = []
+        failed_records = []
+        row_count = 0
+        
+        # Duplicate detection spans chunks
+        seen = {'emails': set(), 'names': set()}
+        date_parsers = None
+        
+        for chunk in self._split_into_chunks(records, VALIDATION_CHUNK_SIZE):
+            if date_parsers is None:
+                # Date formats are inferred from the first chunk and kept for creation
+                date_parsers = self._get_date_parsers(chunk, use_stored=False)
+                self._store_date_formats(date_parsers)
+            columns = _ValidationColumns(chunk)
+            row_errors, row_warnings = self._validate_chunk(columns, seen, date_parsers)
+            
+            for offset, record in enumerate(chunk):
+                if not row_errors[offset] and not row_warnings[offset]:
+                    continue
+                i = row_count + offset + 1
+                errors.extend(f'Row {i}: {message}' for message in row_errors[offset])
+                warnings.extend(f'Row {i}: {message}' for message in row_warnings[offset])
+                
+                # Store failed record if it has errors
+                if row_errors[offset]:
+                    failed_records.append({
+                        'row_number': i,
+                        'data': record,
+                        'errors': row_errors[offset],
+                        'warnings': row_warnings[offset],
+                        'status': 'failed'
+                    })
+            
+            row_count += len(chunk)
+        
+        # Ambiguous dates are reported once per column, not once per row
+        for column, parser in (date_parsers or {}).items():
+            if parser.ambiguous:
+                examples = ', '.join(f'"{value}"' for value in sorted(parser.ambiguous)[:3])
+                used_formats = ' or '.join(parser.label(fmt) for fmt in parser.ordered_formats
+                                           if fmt in parser.ambiguous.values())
+                warnings.append(
+                    f'Column "{column}": {len(parser.ambiguous)} value(s) such as {examples} '
+                    f'match several date formats and were read as {used_formats}'
+                )
+        
+        return {
+            'errors': errors,
+            'warnings': warnings,
+            'failed_records': failed_records,
+            'row_count': row_count,
+        }
+    
+    def _validate_chunk(self, columns, seen, date_parsers):
+        """Run every validation rule over the columns of one chunk.
+
+        Returns per-row lists of error and warning messages, in rule order.
+        """
+        row_errors = [[] for _i in range(columns.size)]
+        row_warnings = [[] for _i in range(columns.size)]
+        
+        def report(target, mask, message, column=None):
+            for position in columns.positions(mask):
+                target[position].append(message(column[position] if column is not None else None))
+        
+        # Required fields (updated for Phase 1.1 enhancements)
+        required_fields = ['name', 'name_arabic', 'name_english', 'email']
+        for field in required_fields:
+            report(row_errors, columns.is_empty(columns.strip(columns.raw(field))),
+                   lambda value: f'Missing required field "{field}"')
+        
+        # Validate email format and uniqueness
+        email = columns.strip(columns.raw('email'))
+        invalid_email = columns.invalid_email(email)
+        report(row_errors, invalid_email, lambda value: f'Invalid email format "{value}"', email)
+        valid_email = columns.both(columns.negate(columns.is_empty(email)), columns.negate(invalid_email))
+        report(row_errors, columns.duplicated(columns.lower(email), valid_email, seen['emails']),
+               lambda value: f'Duplicate email address "{value}"', email)
+        
+        # Validate name uniqueness (warning, not error)
+        name = columns.strip(columns.raw('name'))
+        report(row_warnings, columns.duplicated(name, columns.negate(columns.is_empty(name)), seen['names']),
+               lambda value: f'Duplicate name "{value}" (may be intentional)', name)
+        
+        # Validate birth_date format if provided (each distinct value is parsed once)
+        birth_date = columns.strip(columns.raw('birth_date'))
+        parsed_birth_date = columns.map(birth_date, date_parsers['birth_date'])
+        invalid_birth_date = columns.both(columns.negate(columns.is_empty(birth_date)),
+                                          columns.is_empty(parsed_birth_date))
+        report(row_errors, invalid_birth_date,
+               lambda value: f'Invalid date format for birth_date "{value}". Use YYYY-MM-DD format.', birth_date)
+        
+        # Validate gender if provided
+        gender = columns.raw('gender')
+        report(row_errors, columns.not_in(columns.lower(columns.strip(gender)), ['male', 'female', 'm', 'f']),
+               lambda value: f'Invalid gender "{value}". Use "male", "female", "m", or "f".', gender)
+        
+        # Validate english_level if provided
+        english_level = columns.raw('english_level')
+        valid_levels = ['beginner', 'elementary', 'intermediate', 'upper_intermediate', 'advanced']
+        report(row_errors, columns.not_in(columns.lower(columns.strip(english_level)), valid_levels),
+               lambda value: f'Invalid english_level "{value}". Valid options: {", ".join(valid_levels)}', english_level)
+        
+        # Validate has_certificate if provided
+        has_cert_raw = columns.raw('has_certificate')
+        has_cert = columns.lower(columns.strip(has_cert_raw))
+        report(row_errors, columns.not_in(has_cert, ['true', 'false', 'yes', 'no', '1', '0']),
+               lambda value: f'Invalid has_certificate value "{value}". Use "true"/"false" or "yes"/"no".', has_cert_raw)
+        
+        # Validate certificate consistency
+        with_cert = columns.is_in(has_cert, ['true', 'yes', '1'])
+        cert_type_empty = columns.is_empty(columns.strip(columns.raw('certificate_type')))
+        cert_date = columns.strip(columns.raw('certificate_date'))
+        cert_date_empty = columns.is_empty(cert_date)
+        report(row_warnings, columns.both(with_cert, columns.both(cert_type_empty, cert_date_empty)),
+               lambda value: 'Has certificate is true but no certificate details provided')
+        invalid_cert_date = columns.is_empty(columns.map(cert_date, date_parsers['certificate_date']))
+        report(row_errors, columns.both(with_cert, columns.both(columns.negate(cert_date_empty), invalid_cert_date)),
+               lambda value: f'Invalid certificate_date format "{value}". Use YYYY-MM-DD format.', cert_date)
+        
+        # Validate birth date reasonableness (warning)
+        current_year = datetime.now().year
+        report(row_warnings, columns.map(parsed_birth_date,
+                                         lambda value: bool(value) and not 1900 <= value.year <= current_year),
+               lambda value: f'Birth date "{value}" seems unusual', birth_date)
+        
+        return row_errors, row_warnings
+    
+    def _get_date_parsers(self, records, use_stored=True):
+        """Return a ``_DateColumnParser`` for each date column.
+
+        Formats stored by a previous validation are reused so that students
+        are created with the dates that were validated; missing ones are
+        inferred from the distinct values of ``records``.
+        """
+        stored = json.loads(self.date_formats) if use_stored and self.date_formats else {}
+        parsers = {}
+        for column, formats in DATE_COLUMN_FORMATS.items():
+            sample = []
+            if not stored.get(column):
+                for value in (str(record.get(column) or '').strip() for record in records):
+                    if value and value not in sample:
+                        sample.append(value)
+                        if len(sample) >= DATE_SAMPLE_SIZE:
+                            break
+            parsers[column] = _DateColumnParser(formats, sample, stored.get(column))
+        return parsers
+    
+    def _store_date_formats(self, date_parsers):
+        """Store the formats of ``date_parsers`` on the batch."""
+        self.date_formats = json.dumps({column: parser.date_format for column, parser in date_parsers.items()})
     
     def action_download_template(self):
         """Download a sample Excel template for student data import with validation rules."""
@@ -1210,126 +1650,263 @@ class IntakeBatch(models.Model):
             _logger.error('Error creating template: %s', str(e))
             raise UserError(_('Error creating template file: %s') % str(e))
     
-    def _create_students(self, records):
-        """Create student records from validated data with duplicate detection and statistics."""
+    def _create_students(self, records, row_offset=0, accumulate=False):
+        """Create student records from validated data with duplicate detection and statistics.
+
+        ``records`` may be any iterable, including a stream of file rows. It is
+        consumed in chunks. Every row of a chunk is matched against a
+        ``_DuplicateIndex`` of the file rows seen so far and of the existing
+        students (fetched with one query per chunk) before anything is
+        written:
+
+        * a row with a known email updates that student, or is merged into
+          the row of the same file queued for creation;
+        * a row matching another student only by phone or by name and birth
+          date is imported and reported as a possible duplicate;
+        * the other rows are inserted with a single ``create()`` per chunk.
+
+        A failing chunk is replayed row by row so errors stay attributed to
+        rows. Eligibility is assessed once for all the created and updated
+        students, after the last chunk.
+
+        ``row_offset`` is the file position of the first record, and
+        ``accumulate`` adds the statistics to the stored ones; both are used
+        when the background job imports the file chunk by chunk.
+
+        Progress is reported through an ``_ImportTelemetry``: one log line per
+        chunk, with row-level details only at DEBUG level.
+        """
         created_students = []
         updated_students = []
         skipped_students = []
+        possible_duplicates = []
         errors = []
+        row_count = 0
+        telemetry = _ImportTelemetry(self.name)
+        duplicate_index = _DuplicateIndex()
         
-        _logger.info('Starting to create students from %d records', len(records))
+        date_parsers = None
         
-        for i, record in enumerate(records, 1):
-            try:
-                # Parse birth_date if provided
-                birth_date = None
-                if record.get('birth_date'):
-                    try:
-                        birth_date = datetime.strptime(record.get('birth_date'), '%Y-%m-%d').date()
-                    except ValueError:
-                        _logger.warning('Invalid birth_date format for student %d: %s', i, record.get('birth_date'))
-                
-                # Parse certificate_date if provided
-                certificate_date = None
-                if record.get('certificate_date'):
-                    try:
-                        certificate_date = datetime.strptime(record.get('certificate_date'), '%Y-%m-%d').date()
-                    except ValueError:
-                        _logger.warning('Invalid certificate_date format for student %d: %s', i, record.get('certificate_date'))
-                
-                # Parse has_certificate boolean
-                has_certificate = False
-                if record.get('has_certificate'):
-                    has_cert_str = record.get('has_certificate').lower().strip()
-                    has_certificate = has_cert_str in ['true', '1', 'yes', 'y']
+        for chunk in telemetry.iterate('read', self._split_into_chunks(records, IMPORT_CHUNK_SIZE)):
+            if date_parsers is None:
+                date_parsers = self._get_date_parsers(chunk)
+                if not self.date_formats:
+                    self._store_date_formats(date_parsers)
+            
+            # Prepare the values and identity keys of every row of the chunk
+            prepared = []
+            for i, record in enumerate(chunk, row_offset + row_count + 1):
+                try:
+                    student_vals = self._prepare_student_vals(record, date_parsers)
+                except Exception as e:
+                    errors.append(f'Row {i}: Error creating student "{record.get("name", "Unknown")}": {str(e)}')
+                    telemetry.count('errors')
+                    telemetry.event('error', i, str(e), record)
+                    continue
+                keys = duplicate_index.keys(student_vals['email'], student_vals['phone'],
+                                            student_vals['name'], student_vals['birth_date'])
+                prepared.append((i, record, student_vals, keys))
+            
+            # Index the existing students sharing a key with the chunk (one query)
+            with telemetry.stage('prefetch'):
+                unknown_keys = {key for _i, _record, _vals, keys in prepared for key in keys
+                                if key not in duplicate_index}
+                self._index_existing_students(duplicate_index, unknown_keys)
+            
+            # Rows waiting to be created: list of (row_number, record, student_vals)
+            pending_creates = []
+            
+            for i, record, student_vals, keys in prepared:
+                kind, target = duplicate_index.match(keys)
                 
-                # Parse birth_date with multiple format support
-                birth_date = None
-                if record.get('birth_date'):
-                    birth_date_str = record.get('birth_date').strip()
-                    try:
-                        birth_date = datetime.strptime(birth_date_str, '%Y-%m-%d').date()
-                    except ValueError:
-                        try:
-                            birth_date = datetime.strptime(birth_date_str, '%d/%m/%Y').date()
-                        except ValueError:
-                            try:
-                                birth_date = datetime.strptime(birth_date_str, '%m/%d/%Y').date()
-                            except ValueError:
-                                _logger.warning('Invalid birth_date format for student %d: %s', i, birth_date_str)
+                if target is not None and kind != 'email':
+                    # Same phone or same name and birth date under another email:
+                    # import the row and flag it for review
+                    if isinstance(target, tuple):
+                        duplicate_of = f'row {target[0]}'
+                    else:
+                        duplicate_of = f'existing student "{target.name}" ({target.email})'
+                    message = f'Row {i}: Possible duplicate of {duplicate_of} (same {duplicate_index.labels[kind]})'
+                    possible_duplicates.append(message)
+                    telemetry.event('duplicate', i, message, record)
+                    target = None
                 
-                # Check for existing student by email (duplicate detection)
-                email = record.get('email')
-                existing_student = None
-                if email:
-                    existing_student = self.env['gr.student'].search([
-                        ('email', '=', email)
-                    ], limit=1)
+                if target is None:
+                    pending = (i, record, student_vals)
+                    pending_creates.append(pending)
+                    duplicate_index.add(keys, pending)
+                    continue
                 
-                # Prepare student values
-                student_vals = {
-                    'name': record.get('name'),
-                    'name_arabic': record.get('name_arabic'),
-                    'name_english': record.get('name_english'),
-                    'email': email,
-                    'phone': record.get('phone'),
-                    'birth_date': birth_date,
-                    'gender': record.get('gender'),
-                    'nationality': record.get('nationality'),
-                    'native_language': record.get('native_language'),
-                    'english_level': record.get('english_level'),
-                    'has_certificate': has_certificate,
-                    'certificate_type': record.get('certificate_type'),
-                    'certificate_date': certificate_date,
-                    'intake_batch_id': self.id,
-                    'state': 'draft',
-                }
+                if isinstance(target, tuple):
+                    # Same email earlier in the file: the later row wins, one student is created
+                    target[2].update(student_vals)
+                    duplicate_index.add(keys, target)
+                    message = f'Row {i}: Merged into row {target[0]} (same email)'
+                    skipped_students.append(message)
+                    telemetry.count('skipped')
+                    telemetry.event('duplicate', i, message, record)
+                    continue
                 
-                if existing_student:
-                    # Update existing student with new data
-                    _logger.info('Updating existing student %d: %s (ID: %s)', i, student_vals['name'], existing_student.id)
-                    
-                    # Remove intake_batch_id from update (keep original batch)
+                try:
+                    # Update existing student with new data (keep original batch)
                     update_vals = student_vals.copy()
                     del update_vals['intake_batch_id']
                     
-                    existing_student.write(update_vals)
-                    updated_students.append(existing_student)
-                    _logger.info('Student %d updated successfully', i)
-                else:
-                    # Create new student
-                    _logger.info('Creating new student %d: %s with birth_date=%s, has_certificate=%s, english_level=%s', 
-                               i, student_vals['name'], birth_date, has_certificate, record.get('english_level'))
-                    student = self.env['gr.student'].create(student_vals)
-                    created_students.append(student)
-                    _logger.info('Student %d created successfully with ID: %s', i, student.id)
-                
-            except Exception as e:
-                error_msg = f'Row {i}: Error creating student "{record.get("name", "Unknown")}": {str(e)}'
-                errors.append(error_msg)
-                _logger.error('Error creating student %d from record %s: %s', i, record, str(e))
-                continue
-        
-        # Generate import summary
-        total_processed = len(created_students) + len(updated_students)
-        total_errors = len(errors)
-        total_skipped = len(skipped_students)
-        
-        _logger.info('Student import completed: %d created, %d updated, %d errors, %d skipped out of %d records', 
-                    len(created_students), len(updated_students), total_errors, total_skipped, len(records))
+                    with telemetry.stage('update'):
+                        target.write(update_vals)
+                    updated_students.append(target)
+                    telemetry.count('updated')
+                except Exception as e:
+                    errors.append(f'Row {i}: Error creating student "{record.get("name", "Unknown")}": {str(e)}')
+                    telemetry.count('errors')
+                    telemetry.event('error', i, str(e), record)
+            
+            self._flush_student_creates(pending_creates, duplicate_index, created_students, errors, telemetry)
+            row_count += len(chunk)
+            telemetry.count('rows', len(chunk))
+            telemetry.flush_chunk()
+        
+        # One set-based eligibility pass for every student touched by the import
+        imported_ids = {student.id for student in created_students + updated_students}
+        with telemetry.stage('eligibility'):
+            self.env['gr.student'].browse(sorted(imported_ids))._assess_eligibility_batch()
+        
+        # Unparsable dates are left empty and logged once per column
+        for column, parser in (date_parsers or {}).items():
+            if parser.invalid:
+                _logger.warning('Batch %s: %d invalid %s value(s) left empty, e.g. %s',
+                                self.name, len(parser.invalid), column, sorted(parser.invalid)[:3])
         
         # Store import statistics in the batch
-        self._store_import_statistics(created_students, updated_students, errors, skipped_students)
+        with telemetry.stage('statistics'):
+            self._store_import_statistics(created_students, updated_students, errors, skipped_students,
+                                          accumulate=accumulate, possible_duplicates=possible_duplicates)
+        telemetry.log_summary()
         
         return created_students
     
-    def _store_import_statistics(self, created_students, updated_students, errors, skipped_students):
-        """Store import statistics in the batch record."""
+    def _prepare_student_vals(self, record, date_parsers):
+        """Convert one parsed file row into ``gr.student`` values.
+
+        Dates are read with the column parsers of ``_get_date_parsers()``.
+        """
+        # Parse has_certificate boolean
+        has_certificate = False
+        if record.get('has_certificate'):
+            has_cert_str = record.get('has_certificate').lower().strip()
+            has_certificate = has_cert_str in ['true', '1', 'yes', 'y']
+        
+        birth_date = date_parsers['birth_date'](str(record.get('birth_date') or '').strip())
+        certificate_date = date_parsers['certificate_date'](str(record.get('certificate_date') or '').strip())
+        
+        return {
+            'name': record.get('name'),
+            'name_arabic': record.get('name_arabic'),
+            'name_english': record.get('name_english'),
+            'email': record.get('email'),
+            'phone': record.get('phone'),
+            'birth_date': birth_date,
+            'gender': record.get('gender'),
+            'nationality': record.get('nationality'),
+            'native_language': record.get('native_language'),
+            'english_level': record.get('english_level'),
+            'has_certificate': has_certificate,
+            'certificate_type': record.get('certificate_type'),
+            'certificate_date': certificate_date,
+            'intake_batch_id': self.id,
+            'state': 'draft',
+        }
+    
+    def _flush_student_creates(self, pending_creates, duplicate_index, created_students, errors, telemetry):
+        """Create the pending students with one ``create()`` call.
+
+        If the chunk fails, it is rolled back to a savepoint and replayed row by
+        row so that only the offending rows are reported as errors.
+        """
+        if not pending_creates:
+            return
+        
+        # Eligibility is assessed by _create_students() once the import is done
+        Student = self.env['gr.student'].with_context(defer_eligibility_assessment=True)
+        with telemetry.stage('create'):
+            try:
+                with self.env.cr.savepoint():
+                    students = Student.create([vals for _row, _record, vals in pending_creates])
+                new_students = list(zip(pending_creates, students))
+            except Exception as e:
+                _logger.warning('Bulk creation of %d students failed, retrying row by row: %s', len(pending_creates), str(e))
+                new_students = []
+                for pending in pending_creates:
+                    row_number, record, vals = pending
+                    try:
+                        with self.env.cr.savepoint():
+                            new_students.append((pending, Student.create(vals)))
+                    except Exception as row_error:
+                        errors.append(f'Row {row_number}: Error creating student "{record.get("name", "Unknown")}": {str(row_error)}')
+                        telemetry.count('errors')
+                        telemetry.event('error', row_number, str(row_error), record)
+        
+        # Later chunks match the created students instead of the queued rows
+        created_by_pending = {id(pending): student for pending, student in new_students}
+        for pending in pending_creates:
+            duplicate_index.replace(pending, created_by_pending.get(id(pending)))
+        created_students.extend(student for _pending, student in new_students)
+        telemetry.count('created', len(new_students))
+        
+        pending_creates.clear()
+    
+    def _index_existing_students(self, duplicate_index, keys):
+        """Add the existing students matching any of ``keys`` to ``duplicate_index``.
+
+        Students store their keys normalized like ``_DuplicateIndex.keys()``
+        in indexed fields, so all kinds of keys are looked up with a single
+        search. The most recently created student wins when several share a
+        key.
+        """
+        if not keys:
+            return
+        
+        values = {}
+        for kind, value in keys:
+            values.setdefault(kind, []).append(value)
+        domain = [(f'{kind}_key', 'in', kind_values) for kind, kind_values in values.items()]
+        domain = ['|'] * (len(domain) - 1) + domain
+        
+        # search() applies access rules and the default order (newest first)
+        Student = self.env['gr.student'].with_context(defer_eligibility_assessment=True)
+        for student in Student.search(domain):
+            duplicate_index.add(duplicate_index.keys(student.email, student.phone, student.name, student.birth_date),
+                                student)
+    
+    def _store_import_statistics(self, created_students, updated_students, errors, skipped_students, accumulate=False,
+                                 possible_duplicates=None):
+        """Store import statistics in the batch record.
+
+        With ``accumulate`` the counts, errors and possible duplicates are
+        added to the ones already stored (chunked background processing)
+        instead of replacing them. ``possible_duplicates`` lists the imported
+        rows to review.
+        """
+        possible_duplicates = possible_duplicates or []
         self.ensure_one()
         
+        created_count = len(created_students)
+        updated_count = len(updated_students)
+        skipped_count = len(skipped_students)
+        if accumulate:
+            created_count += self.created_students_count
+            updated_count += self.updated_students_count
+            skipped_count += self.skipped_students_count
+            if self.import_errors:
+                errors = self.import_errors.split('\n') + errors
+            if self.possible_duplicates:
+                possible_duplicates = self.possible_duplicates.split('\n') + possible_duplicates
+        
         # Update counts
-        self.created_students_count = len(created_students)
-        self.updated_students_count = len(updated_students)
+        self.created_students_count = created_count
+        self.updated_students_count = updated_count
+        self.skipped_students_count = skipped_count
+        self.possible_duplicates = '\n'.join(possible_duplicates) or False
         
         # Store errors
         if errors:
@@ -1341,27 +1918,44 @@ class IntakeBatch(models.Model):
         summary_lines = []
         summary_lines.append(f"IMPORT SUMMARY - {fields.Datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         summary_lines.append("=" * 60)
-        summary_lines.append(f"Total Records Processed: {len(created_students) + len(updated_students) + len(errors) + len(skipped_students)}")
-        summary_lines.append(f"✅ Students Created: {len(created_students)}")
-        summary_lines.append(f"🔄 Students Updated: {len(updated_students)}")
+        summary_lines.append(f"Total Records Processed: {created_count + updated_count + len(errors) + skipped_count}")
+        summary_lines.append(f"✅ Students Created: {created_count}")
+        summary_lines.append(f"🔄 Students Updated: {updated_count}")
         summary_lines.append(f"❌ Errors: {len(errors)}")
-        summary_lines.append(f"⏭️ Skipped: {len(skipped_students)}")
+        summary_lines.append(f"⏭️ Skipped: {skipped_count}")
+        summary_lines.append(f"⚠️ Possible Duplicates: {len(possible_duplicates)}")
         summary_lines.append("")
         
         if created_students:
             summary_lines.append("NEW STUDENTS CREATED:")
             for student in created_students[:10]:  # Show first 10
                 summary_lines.append(f"  • {student.name} ({student.email})")
-            if len(created_students) > 10:
-                summary_lines.append(f"  ... and {len(created_students) - 10} more")
+            if created_count > 10:
+                summary_lines.append(f"  ... and {created_count - len(created_students[:10])} more")
             summary_lines.append("")
         
         if updated_students:
             summary_lines.append("EXISTING STUDENTS UPDATED:")
             for student in updated_students[:10]:  # Show first 10
                 summary_lines.append(f"  • {student.name} ({student.email})")
-            if len(updated_students) > 10:
-                summary_lines.append(f"  ... and {len(updated_students) - 10} more")
+            if updated_count > 10:
+                summary_lines.append(f"  ... and {updated_count - len(updated_students[:10])} more")
+            summary_lines.append("")
+        
+        if possible_duplicates:
+            summary_lines.append("POSSIBLE DUPLICATES IMPORTED (PLEASE REVIEW):")
+            for duplicate in possible_duplicates[:10]:  # Show first 10
+                summary_lines.append(f"  • {duplicate}")
+            if len(possible_duplicates) > 10:
+                summary_lines.append(f"  ... and {len(possible_duplicates) - 10} more")
+            summary_lines.append("")
+        
+        if skipped_students:
+            summary_lines.append("DUPLICATES MERGED:")
+            for skipped in skipped_students[:5]:  # Show first 5 duplicates
+                summary_lines.append(f"  • {skipped}")
+            if skipped_count > 5:
+                summary_lines.append(f"  ... and {skipped_count - len(skipped_students[:5])} more")
             summary_lines.append("")
         
         if errors:
@@ -1543,8 +2137,10 @@ class IntakeBatch(models.Model):
         message += f"• openpyxl: {'✅ Available' if libs['openpyxl'] else '❌ Not installed'}\n"
         message += f"• xlrd: {'✅ Available' if libs['xlrd'] else '❌ Not installed'}\n\n"
         
-        if not libs['pandas'] or not libs['openpyxl']:
-            message += "⚠️ For .xlsx files, install: pip install pandas openpyxl\n"
+        if not libs['openpyxl']:
+            message += "⚠️ For .xlsx files, install: pip install openpyxl\n"
+        if not libs['pandas']:
+            message += "⚠️ For the Excel import template, install: pip install pandas\n"
         if not libs['xlrd']:
             message += "⚠️ For .xls files, install: pip install xlrd\n"
             
@@ -1606,29 +2202,160 @@ class IntakeBatch(models.Model):
         }
     
     def action_process_large_batch(self):
-        """Process large datasets in batches to avoid memory issues."""
+        """Process large datasets in chunks through the background job to avoid timeouts."""
         self.ensure_one()
         
         if self.state != 'validated':
             raise UserError(_('Please validate the file first.'))
         
-        # Check if this is a large batch (>1000 records)
-        if self.total_records <= 1000:
+        # Small batches are processed synchronously
+        if self.total_records <= LARGE_BATCH_THRESHOLD:
             return self.action_process_file()
         
-        # For large batches, show confirmation dialog
+        return self.action_queue_processing()
+    
+    # ===== BACKGROUND PROCESSING METHODS =====
+    
+    def action_queue_processing(self):
+        """Queue the batch for chunked processing by the background job."""
+        self.ensure_one()
+        
+        if self.state != 'validated':
+            raise UserError(_('Please validate the file first.'))
+        
+        if self.processing_job_state in ['queued', 'running']:
+            raise UserError(_('This batch is already queued for processing.'))
+        
+        self.write({
+            'processing_job_state': 'queued',
+            'processing_progress': 'in_progress',
+            'processing_checkpoint': 0,
+            'processed_records': 0,
+            'created_students_count': 0,
+            'updated_students_count': 0,
+            'skipped_students_count': 0,
+            'possible_duplicates': False,
+            'import_errors': False,
+            'import_summary': False,
+        })
+        
+        cron = self.env.ref('grants_training_suite_v19.ir_cron_process_intake_batches', raise_if_not_found=False)
+        if cron:
+            cron._trigger()
+        
+        _logger.info('Batch %s queued for background processing (%d records, chunks of %d)',
+                    self.name, self.total_records, self.processing_chunk_size)
+        
         return {
-            'name': _('Process Large Batch'),
-            'type': 'ir.actions.act_window',
-            'res_model': 'gr.intake.batch.large.process.wizard',
-            'view_mode': 'form',
-            'target': 'new',
-            'context': {
-                'default_intake_batch_id': self.id,
-                'default_total_records': self.total_records,
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': _('Processing Queued'),
+                'message': _('Batch "%s" (%d records) will be processed in the background. Progress is updated after each chunk.') % (self.name, self.total_records),
+                'type': 'info',
             }
         }
     
+    @api.model
+    def _cron_process_queued_batches(self, time_budget=240):
+        """Process queued batches chunk by chunk, committing after each chunk.
+
+        The run stops when ``time_budget`` seconds are spent; the cron is then
+        re-triggered and the next run resumes at the last committed checkpoint.
+        Batches left in ``running`` by a crashed worker are resumed the same way.
+        """
+        deadline = time.monotonic() + time_budget
+        batches = self.search([('processing_job_state', 'in', ['queued', 'running'])], order='id')
+        
+        for batch in batches:
+            if time.monotonic() >= deadline:
+                break
+            batch._process_queued_chunks(deadline)
+        
+        if self.search_count([('processing_job_state', 'in', ['queued', 'running'])]):
+            self.env.ref('grants_training_suite_v19.ir_cron_process_intake_batches')._trigger()
+    
+    def _process_queued_chunks(self, deadline):
+        """Import committed chunks of the file until done or ``deadline`` is reached."""
+        self.ensure_one()
+        
+        self.processing_job_state = 'running'
+        self.env.cr.commit()
+        
+        try:
+            # Stream the file and skip the rows committed by previous runs
+            rows = self._iter_import_rows()
+            for _record in itertools.islice(rows, self.processing_checkpoint):
+                pass
+            chunk_size = max(self.processing_chunk_size, 1)
+            finished = False
+            
+            while time.monotonic() < deadline:
+                chunk = list(itertools.islice(rows, chunk_size))
+                if not chunk:
+                    finished = True
+                    break
+                
+                start = self.processing_checkpoint
+                self._create_students(chunk, row_offset=start, accumulate=True)
+                self.processing_checkpoint = start + len(chunk)
+                self.processed_records = self.created_students_count + self.updated_students_count
+                # Students of the chunk and the checkpoint are committed together
+                self.env.cr.commit()
+                
+                _logger.debug('Batch %s: committed rows %d-%d of %d',
+                              self.name, start + 1, self.processing_checkpoint, self.total_records)
+            
+            if finished:
+                self._finish_background_processing()
+                self.env.cr.commit()
+        
+        except Exception as e:
+            self.env.cr.rollback()
+            _logger.error('Background processing of batch %s failed at row %d: %s',
+                         self.name, self.processing_checkpoint + 1, str(e))
+            self.write({
+                'state': 'error',
+                'processing_progress': 'failed',
+                'processing_job_state': 'failed',
+                'validation_errors': str(e),
+            })
+            self._send_batch_notification('error', f"Batch '{self.name}' background processing failed with error: {str(e)}", {
+                'error_type': 'Processing Error',
+                'error_message': str(e),
+                'rows_committed': self.processing_checkpoint,
+                'total_records': self.total_records,
+            })
+            self.env.cr.commit()
+    
+    def _finish_background_processing(self):
+        """Mark a fully imported batch as processed and notify recipients."""
+        self.ensure_one()
+        
+        self.write({
+            'state': 'processed',
+            'processing_progress': 'completed',
+            'processing_job_state': 'done',
+            'processing_date': fields.Datetime.now(),
+        })
+        
+        _logger.info('File processed in background for batch %s: %d created, %d updated',
+                    self.name, self.created_students_count, self.updated_students_count)
+        
+        error_count = len(self.import_errors.split(chr(10))) if self.import_errors else 0
+        message = f"Batch '{self.name}' has been successfully processed. " \
+                  f"{self.created_students_count} students created, {self.updated_students_count} updated."
+        if error_count > 0:
+            message += f" {error_count} errors encountered."
+        
+        self._send_batch_notification('warning' if error_count > 0 else 'success', message, {
+            'total_records': self.total_records,
+            'students_created': self.created_students_count,
+            'students_updated': self.updated_students_count,
+            'errors': error_count,
+            'processing_time': str(fields.Datetime.now() - self.upload_date) if self.upload_date else 'Unknown'
+        })
+    
     # ===== NOTIFICATION METHODS (Phase 3.1.3) =====
     
     def _get_notification_recipients(self):
@@ -2129,12 +2856,8 @@ class IntakeBatch(models.Model):
             # Set validation progress to in_progress
             self.validation_progress = 'in_progress'
             
-            # Parse file
-            records = self._parse_file()
-            self.total_records = len(records)
-            
-            # Validate with detailed tracking
-            errors = self._validate_records_with_details(records)
+            # Validate the streamed rows with detailed tracking
+            errors = self._validate_records_with_details(self._iter_file_rows())
             
             if errors:
                 self.validation_errors = '\n'.join(errors)
@@ -2181,20 +2904,14 @@ class IntakeBatch(models.Model):
             raise UserError(_('Please upload a file first.'))
         
         try:
-            # Parse file
-            if self.file_type == 'csv':
-                records = self._parse_csv(self.file_data)
-            else:
-                records = self._parse_excel(self.file_data)
+            # Validate the streamed rows (this will populate warnings and the record count)
+            errors = self._validate_records(self._iter_file_rows())
             
-            if not records:
+            if not self.total_records:
                 raise UserError(_('No data found in the uploaded file.'))
             
-            # Validate records (this will populate warnings)
-            errors = self._validate_records(records)
-            
             # Prepare feedback message
-            total_records = len(records)
+            total_records = self.total_records
             error_count = len(errors)
             warning_count = len(self.validation_warnings.split('\n')) if self.validation_warnings else 0
             
@@ -2353,20 +3070,15 @@ class IntakeBatch(models.Model):
         
         # Parse file to get available columns
         try:
-            if self.file_type == 'csv':
-                records = self._parse_csv(self.file_data)
-            else:
-                records = self._parse_excel(self.file_data)
+            # Only the first rows are read for the preview (first 3 records)
+            preview_data = list(itertools.islice(self._iter_file_rows(), 3))
             
-            if not records:
+            if not preview_data:
                 self.mapping_progress = 'failed'
                 raise UserError(_('No data found in the uploaded file.'))
             
             # Get available columns from the first record
-            available_columns = list(records[0].keys()) if records else []
-            
-            # Get sample data (first 3 records)
-            preview_data = records[:3] if len(records) >= 3 else records
+            available_columns = list(preview_data[0].keys())
             
             # Auto-detect mapping based on column names
             auto_mapping = self._auto_detect_column_mapping(available_columns)
@@ -2480,30 +3192,14 @@ class IntakeBatch(models.Model):
         try:
             mapping = json.loads(self.column_mapping)
             
-            # Parse file
-            if self.file_type == 'csv':
-                raw_records = self._parse_csv(self.file_data)
-            else:
-                raw_records = self._parse_excel(self.file_data)
+            # Validate the mapped rows as a stream (this also updates the record count)
+            validation_errors = self._validate_records(
+                self._apply_column_mapping(record, mapping) for record in self._iter_file_rows()
+            )
             
-            if not raw_records:
+            if not self.total_records:
                 raise UserError(_('No data found in the uploaded file.'))
             
-            # Apply mapping to transform records
-            mapped_records = []
-            for record in raw_records:
-                mapped_record = {}
-                for field, column in mapping.items():
-                    if column and column in record:
-                        mapped_record[field] = record[column]
-                mapped_records.append(mapped_record)
-            
-            # Update total records count
-            self.total_records = len(mapped_records)
-            
-            # Validate mapped records
-            validation_errors = self._validate_records(mapped_records)
-            
             if validation_errors:
                 self.state = 'error'
                 self.validation_errors = '\n'.join(validation_errors)
@@ -2517,15 +3213,18 @@ class IntakeBatch(models.Model):
                 self.error_records = 0
                 self.validation_date = fields.Datetime.now()
                 
-                # Store mapped records for processing
-                self.mapping_preview_data = json.dumps(mapped_records[:10])  # Store first 10 for reference
+                # Store the first 10 mapped records for reference
+                self.mapping_preview_data = json.dumps([
+                    self._apply_column_mapping(record, mapping)
+                    for record in itertools.islice(self._iter_file_rows(), 10)
+                ])
             
             return {
                 'type': 'ir.actions.client',
                 'tag': 'display_notification',
                 'params': {
                     'title': _('Success'),
-                    'message': _('File validation completed successfully. %d records ready for processing.') % len(mapped_records),
+                    'message': _('File validation completed successfully. %d records ready for processing.') % self.total_records,
                     'type': 'success',
                     'sticky': False,
                 }
@@ -2556,6 +3255,8 @@ class IntakeBatch(models.Model):
         # Reset import statistics fields (Phase 2.4)
         self.created_students_count = 0
         self.updated_students_count = 0
+        self.skipped_students_count = 0
+        self.possible_duplicates = False
         self.import_errors = False
         self.import_summary = False
         
@@ -2565,6 +3266,11 @@ class IntakeBatch(models.Model):
         self.validation_progress = 'pending'
         self.processing_progress = 'pending'
         
+        # Reset background processing fields
+        self.processing_job_state = 'none'
+        self.processing_checkpoint = 0
+        self.date_formats = False
+        
         # Reset failed records fields (Phase 3.1.2)
         self.failed_records_data = False
         
@@ -2,11 +2,34 @@
 
 from odoo import models, fields, api, _
 from odoo.exceptions import UserError
+from odoo.tools import html_escape, str2bool
 import logging
+import time
 from datetime import datetime, timedelta
 
 _logger = logging.getLogger(__name__)
 
+# Queued notifications delivered per batch by the delivery worker
+DELIVERY_BATCH_SIZE = 100
+
+# Failed deliveries are retried after 5, 10, 20... minutes, up to this many attempts
+DELIVERY_RETRY_MINUTES = 5
+MAX_DELIVERY_ATTEMPTS = 5
+
+# System parameter enabling the digest mode of the automatic notifications:
+# they are then delivered by the digest cron, whose interval is the digest
+# window, with one summary per recipient
+DIGEST_MODE_PARAM = 'grants_training_suite_v19.progress_notification_digest'
+
+# Progress milestones notified to the students, by threshold (%)
+PROGRESS_MILESTONES = [
+    {'threshold': 25, 'type': '25_percent', 'message': 'Congratulations! You\'ve reached 25% completion.'},
+    {'threshold': 50, 'type': '50_percent', 'message': 'Great progress! You\'re halfway through the course.'},
+    {'threshold': 75, 'type': '75_percent', 'message': 'Excellent work! You\'ve completed 75% of the course.'},
+    {'threshold': 90, 'type': '90_percent', 'message': 'Almost there! You\'re at 90% completion.'},
+    {'threshold': 100, 'type': '100_percent', 'message': 'Congratulations! You\'ve completed the course!'},
+]
+
 
 class ProgressNotification(models.Model):
     _name = 'gr.progress.notification'
@@ -65,8 +88,10 @@ class ProgressNotification(models.Model):
 
     status = fields.Selection([
         ('draft', 'Draft'),
+        ('queued', 'Queued'),
         ('sent', 'Sent'),
         ('read', 'Read'),
+        ('failed', 'Failed'),
         ('archived', 'Archived')
     ], string='Status', default='draft')
 
@@ -94,6 +119,29 @@ class ProgressNotification(models.Model):
         default=True
     )
 
+    in_app_sent = fields.Boolean(
+        string='In-App Notification Sent',
+        default=False
+    )
+
+    # Delivery Queue
+    delivery_attempts = fields.Integer(
+        string='Delivery Attempts',
+        default=0,
+        copy=False
+    )
+
+    next_delivery_date = fields.Datetime(
+        string='Next Delivery Attempt',
+        index=True,
+        copy=False
+    )
+
+    delivery_error = fields.Text(
+        string='Delivery Error',
+        copy=False
+    )
+
     # Recipients
     recipient_user_id = fields.Many2one(
         'res.users',
@@ -129,80 +177,341 @@ class ProgressNotification(models.Model):
         help='Condition that triggered this notification'
     )
 
+    digest_mode = fields.Boolean(
+        string='Digest',
+        default=False,
+        help='Delivered in the periodic digest of its recipients instead of on its own'
+    )
+
     def action_send_notification(self):
-        """Send the notification through configured channels."""
+        """Queue the notification for delivery through its configured channels."""
+        self.write({
+            'status': 'queued',
+            'next_delivery_date': fields.Datetime.now(),
+            'delivery_attempts': 0,
+            'delivery_error': False,
+        })
+        if not all(self.mapped('digest_mode')):
+            self._trigger_delivery()
+
+    @api.model
+    def _trigger_delivery(self, at=None):
+        """Schedule the delivery worker."""
+        cron = self.env.ref('grants_training_suite_v19.ir_cron_notification_delivery', raise_if_not_found=False)
+        if cron:
+            cron.sudo()._trigger(at=at)
+
+    @api.model
+    def _cron_process_delivery_queue(self, time_budget=240):
+        """Deliver the queued notifications batch by batch, committing after each batch.
+
+        The run stops when ``time_budget`` seconds are spent; the worker is
+        then scheduled again for the next queued notification, including
+        the retries waiting for their backoff delay.
+        """
+        sent_count, retry_count = self._process_queue(self._iter_due_batches(), False, time_budget)
+        
+        if sent_count or retry_count:
+            _logger.info('Notification delivery: %d sent, %d failed', sent_count, retry_count)
+        
+        next_notification = self.search([
+            ('status', '=', 'queued'),
+            ('digest_mode', '=', False)
+        ], order='next_delivery_date', limit=1)
+        if next_notification:
+            self._trigger_delivery(max(next_notification.next_delivery_date, fields.Datetime.now()))
+
+    @api.model
+    def _cron_send_digests(self, time_budget=240):
+        """Send the queued digest notifications, one summary per recipient and channel.
+
+        Delivered batch by batch like the queue worker, each recipient's
+        notifications in the same batch. The digest cron runs again right
+        away when ``time_budget`` seconds were not enough, and for the failed
+        digests when their backoff delay is over.
+        """
+        due = self.search(self._get_due_queue_domain(True), order='id')
+        sent_count, retry_count = self._process_queue(due._split_digest_batches(), True, time_budget)
+        
+        if sent_count or retry_count:
+            _logger.info('Notification digests: %d notifications sent, %d failed', sent_count, retry_count)
+        
+        cron = self.env.ref('grants_training_suite_v19.ir_cron_notification_digests', raise_if_not_found=False)
+        if not cron:
+            return
+        if self.search_count(self._get_due_queue_domain(True), limit=1):
+            cron.sudo()._trigger()
+            return
+        # The other queued digests wait for the next digest window
+        next_retry = self.search([
+            ('status', '=', 'queued'),
+            ('digest_mode', '=', True),
+            ('delivery_attempts', '>', 0)
+        ], order='next_delivery_date', limit=1)
+        if next_retry:
+            cron.sudo()._trigger(at=max(next_retry.next_delivery_date, fields.Datetime.now()))
+
+    @api.model
+    def _get_due_queue_domain(self, digest):
+        """Domain of the queued notifications due for delivery."""
+        return [
+            ('status', '=', 'queued'),
+            ('digest_mode', '=', digest),
+            ('next_delivery_date', '<=', fields.Datetime.now())
+        ]
+
+    @api.model
+    def _iter_due_batches(self):
+        """Yield the due queued notifications by batches of DELIVERY_BATCH_SIZE, oldest first."""
+        while True:
+            notifications = self.search(self._get_due_queue_domain(False), order='next_delivery_date, id',
+                                        limit=DELIVERY_BATCH_SIZE)
+            if not notifications:
+                return
+            yield notifications
+
+    def _split_digest_batches(self):
+        """Split the notifications into batches of about DELIVERY_BATCH_SIZE.
+
+        Notifications sharing a recipient on a pending channel are kept in the
+        same batch, so each recipient gets a single digest per channel.
+        """
+        # Union-find of the notifications and their recipients
+        parents = {}
+        
+        def find(key):
+            while parents.setdefault(key, key) != key:
+                parents[key] = parents[parents[key]]
+                key = parents[key]
+            return key
+        
         for notification in self:
+            keys = [('notification', notification.id)]
+            if notification.in_app_notification and not notification.in_app_sent:
+                keys.append(('user', notification._get_in_app_user_id()))
+            if notification.recipient_phone and not notification.sms_sent:
+                keys.append(('phone', notification.recipient_phone))
+            if notification.recipient_email and not notification.email_sent:
+                keys.append(('email', notification.recipient_email))
+            for key in keys[1:]:
+                parents[find(key)] = find(keys[0])
+        
+        ids_by_recipients = {}
+        for notification in self:
+            ids_by_recipients.setdefault(find(('notification', notification.id)), []).append(notification.id)
+        
+        batch_ids = []
+        for notification_ids in ids_by_recipients.values():
+            batch_ids.extend(notification_ids)
+            if len(batch_ids) >= DELIVERY_BATCH_SIZE:
+                yield self.browse(batch_ids)
+                batch_ids = []
+        if batch_ids:
+            yield self.browse(batch_ids)
+
+    @api.model
+    def _process_queue(self, batches, digest, time_budget):
+        """Deliver the ``batches`` of notifications, in digests or not, committing
+        after each batch, until ``time_budget`` seconds are spent.
+
+        Returns the number of notifications sent and of those to retry.
+        """
+        deadline = time.monotonic() + time_budget
+        sent_count = retry_count = 0
+        
+        for notifications in batches:
+            notifications._deliver(digest=digest)
+            self.env.cr.commit()
+            
+            sent = notifications.filtered(lambda n: n.status == 'sent')
+            sent_count += len(sent)
+            retry_count += len(notifications - sent)
+            
+            if time.monotonic() >= deadline:
+                break
+        
+        return sent_count, retry_count
+
+    @api.model
+    def _is_digest_mode(self):
+        """Whether the automatic notifications are delivered in digests."""
+        return str2bool(self.env['ir.config_parameter'].sudo().get_param(DIGEST_MODE_PARAM, 'False'))
+
+    def _deliver(self, digest=False):
+        """Deliver a batch of queued notifications, one channel at a time.
+
+        Each channel is sent for the whole batch, or summarized per recipient
+        with ``digest``; notifications failing on a channel are retried later
+        with an exponential backoff, without sending again the channels
+        already delivered.
+        """
+        pending_by_channel = [
+            ('_send_in_app_digests' if digest else '_send_in_app_notifications',
+             self.filtered(lambda n: n.in_app_notification and not n.in_app_sent)),
+            ('_send_sms_digests' if digest else '_send_sms_notifications',
+             self.filtered(lambda n: n.recipient_phone and not n.sms_sent)),
+            ('_send_email_digests' if digest else '_send_email_notifications',
+             self.filtered(lambda n: n.recipient_email and not n.email_sent)),
+        ]
+        
+        errors = {}
+        for method, notifications in pending_by_channel:
+            if not notifications:
+                continue
             try:
-                # Send in-app notification
-                if notification.in_app_notification:
-                    notification._send_in_app_notification()
-                
-                # Send email notification
-                if notification.email_sent or notification.recipient_email:
-                    notification._send_email_notification()
-                
-                # Send SMS notification
-                if notification.sms_sent or notification.recipient_phone:
-                    notification._send_sms_notification()
-                
-                notification.status = 'sent'
-                notification.sent_date = fields.Datetime.now()
-                
-                _logger.info('Notification sent successfully: %s', notification.name)
-                
+                with self.env.cr.savepoint():
+                    errors.update(getattr(notifications, method)())
             except Exception as e:
-                _logger.error('Failed to send notification %s: %s', notification.name, str(e))
-                raise UserError(_('Failed to send notification: %s') % str(e))
-
-    def _send_in_app_notification(self):
-        """Send in-app notification."""
-        # Create mail.activity for in-app notification
-        self.env['mail.activity'].create({
-            'activity_type_id': self._get_activity_type_id(),
-            'res_id': self.id,
+                _logger.error('Failed to deliver %d notifications (%s): %s', len(notifications), method, str(e))
+                errors.update(dict.fromkeys(notifications.ids, str(e)))
+        
+        now = fields.Datetime.now()
+        failed = self.browse(list(errors))
+        (self - failed).write({'status': 'sent', 'sent_date': now, 'delivery_error': False})
+        
+        for notification in failed:
+            attempts = notification.delivery_attempts + 1
+            vals = {'delivery_attempts': attempts, 'delivery_error': errors[notification.id]}
+            if attempts >= MAX_DELIVERY_ATTEMPTS:
+                vals['status'] = 'failed'
+                _logger.error('Notification %s failed after %d attempts: %s', notification.name, attempts, errors[notification.id])
+            else:
+                vals['next_delivery_date'] = now + timedelta(minutes=DELIVERY_RETRY_MINUTES * 2 ** (attempts - 1))
+            notification.write(vals)
+
+    def _send_in_app_notifications(self):
+        """Send in-app notifications."""
+        # Create mail.activity for in-app notifications
+        self.env['mail.activity'].create([{
+            'activity_type_id': notification._get_activity_type_id(),
+            'res_id': notification.id,
             'res_model': 'gr.progress.notification',
-            'user_id': self.recipient_user_id.id or self.student_id.assigned_agent_id.user_id.id or 1,
-            'summary': self.name,
-            'note': self.message,
+            'user_id': notification._get_in_app_user_id(),
+            'summary': notification.name,
+            'note': notification.message,
             'date_deadline': fields.Date.today(),
-        })
+        } for notification in self])
+        self.write({'in_app_sent': True})
+        return {}
 
-    def _send_email_notification(self):
-        """Send email notification."""
-        if not self.recipient_email:
-            return
-        
-        # Create mail.message for email notification
+    def _send_email_notifications(self):
+        """Send email notifications, returning the delivery errors by notification id."""
         mail_template = self.env.ref('grants_training_suite_v19.email_template_progress_notification', False)
         
         if mail_template:
-            mail_template.send_mail(self.id, force_send=True)
+            # Rendered in one batch, mails are created in the order of the notifications
+            mails = mail_template.send_mail_batch(self.ids, force_send=False)
         else:
-            # Fallback: create simple email
-            self.env['mail.mail'].create({
-                'subject': self.name,
-                'body_html': f'<p>{self.message}</p>',
-                'email_to': self.recipient_email,
+            # Fallback: create simple emails
+            mails = self.env['mail.mail'].sudo().create([{
+                'subject': notification.name,
+                'body_html': f'<p>{notification.message}</p>',
+                'email_to': notification.recipient_email,
                 'auto_delete': True,
-            }).send()
+            } for notification in self])
+        return self._send_mails(mails, [notification.ids for notification in self])
+
+    def _send_mails(self, mails, notification_ids):
+        """Send the mails and return the delivery errors by notification id.
+
+        ``notification_ids`` lists the notifications of each mail; the
+        notifications whose mail was delivered are marked as emailed.
+        """
+        notification_ids_by_mail = dict(zip(mails.ids, notification_ids))
+        
+        # One SMTP connection per mail server for the whole batch
+        mails.send(raise_exception=False)
+        
+        # Sent mails are auto-deleted, failed ones are kept in exception
+        failed_mails = mails.exists().filtered(lambda m: m.state == 'exception')
+        errors = {}
+        for mail in failed_mails:
+            errors.update(dict.fromkeys(notification_ids_by_mail[mail.id], mail.failure_reason or _('Email delivery failed')))
+        failed_mails.unlink()
+        
+        (self - self.browse(list(errors))).write({'email_sent': True})
+        return errors
 
-    def _send_sms_notification(self):
-        """Send SMS notification."""
+    def _send_sms_notifications(self):
+        """Send SMS notifications."""
         # SMS functionality would require additional SMS gateway integration
-        # For now, just log the SMS notification
-        _logger.info('SMS notification would be sent to: %s - %s', self.recipient_phone, self.message)
+        # For now, just log the SMS notifications
+        for notification in self:
+            _logger.info('SMS notification would be sent to: %s - %s', notification.recipient_phone, notification.message)
+        self.write({'sms_sent': True})
+        return {}
+
+    def _send_in_app_digests(self):
+        """Send one in-app activity per recipient summarizing the notifications."""
+        notification_ids_by_user = {}
+        for notification in self:
+            notification_ids_by_user.setdefault(notification._get_in_app_user_id(), []).append(notification.id)
+        
+        activity_type_id = self.env.ref('mail.mail_activity_data_todo').id
+        self.env['mail.activity'].create([{
+            'activity_type_id': activity_type_id,
+            'res_id': notification_ids[0],
+            'res_model': 'gr.progress.notification',
+            'user_id': user_id,
+            'summary': _('Progress digest: %d notifications') % len(notification_ids),
+            'note': self.browse(notification_ids)._get_digest_html(),
+            'date_deadline': fields.Date.today(),
+        } for user_id, notification_ids in notification_ids_by_user.items()])
+        self.write({'in_app_sent': True})
+        return {}
+
+    def _send_email_digests(self):
+        """Send one email per recipient summarizing the notifications."""
+        notification_ids_by_email = {}
+        for notification in self:
+            notification_ids_by_email.setdefault(notification.recipient_email, []).append(notification.id)
+        
+        mails = self.env['mail.mail'].sudo().create([{
+            'subject': _('Progress digest: %d notifications') % len(notification_ids),
+            'body_html': self.browse(notification_ids)._get_digest_html(),
+            'email_to': email,
+            'auto_delete': True,
+        } for email, notification_ids in notification_ids_by_email.items()])
+        return self._send_mails(mails, list(notification_ids_by_email.values()))
+
+    def _send_sms_digests(self):
+        """Send one SMS per recipient summarizing the notifications."""
+        # SMS functionality would require additional SMS gateway integration
+        # For now, just log the SMS digests
+        messages_by_phone = {}
+        for notification in self:
+            messages_by_phone.setdefault(notification.recipient_phone, []).append(notification.message)
+        for phone, messages in messages_by_phone.items():
+            _logger.info('SMS digest would be sent to: %s - %d notifications', phone, len(messages))
+        self.write({'sms_sent': True})
+        return {}
+
+    def _get_digest_html(self):
+        """Summarize the notifications as an HTML list."""
+        items = ''.join(
+            '<li><strong>%s</strong>: %s</li>' % (html_escape(notification.name), html_escape(notification.message))
+            for notification in self
+        )
+        return '<ul>%s</ul>' % items
+
+    def _get_in_app_user_id(self):
+        """Get the user receiving the in-app notification."""
+        self.ensure_one()
+        return self.recipient_user_id.id or self.student_id.assigned_agent_id.user_id.id or 1
 
     def _get_activity_type_id(self):
         """Get appropriate activity type based on notification type."""
         activity_type_mapping = {
-            'milestone': 1,  # To Do
-            'completion': 2,  # Call
-            'stalled': 3,    # Email
-            'achievement': 1,  # To Do
-            'reminder': 3,   # Email
-            'alert': 3,      # Email
+            'milestone': 'mail.mail_activity_data_todo',
+            'completion': 'mail.mail_activity_data_call',
+            'stalled': 'mail.mail_activity_data_email',
+            'achievement': 'mail.mail_activity_data_todo',
+            'reminder': 'mail.mail_activity_data_email',
+            'alert': 'mail.mail_activity_data_email',
         }
-        return activity_type_mapping.get(self.notification_type, 1)
+        xmlid = activity_type_mapping.get(self.notification_type, 'mail.mail_activity_data_todo')
+        activity_type = self.env.ref(xmlid, raise_if_not_found=False) or self.env.ref('mail.mail_activity_data_todo')
+        return activity_type.id
 
     def action_mark_as_read(self):
         """Mark notification as read."""
@@ -224,74 +533,50 @@ class ProgressNotification(models.Model):
             ('write_date', '>=', (datetime.now() - timedelta(hours=1)).strftime('%Y-%m-%d %H:%M:%S'))
         ])
         
-        created_count = 0
-        
+        # New milestone crossings of all trackers in one pass
+        vals_list = []
         for tracker in recent_trackers:
-            # Check for milestone achievements
             milestone = self._check_milestone_achievement(tracker)
             if milestone:
-                notification = self._create_milestone_notification(tracker, milestone)
-                if notification:
-                    created_count += 1
+                vals_list.append(self._prepare_milestone_notification_vals(tracker, milestone))
         
-        _logger.info('Created %d milestone notifications', created_count)
-        return created_count
+        notifications = self.create(vals_list)
+        # Auto-send the notifications
+        notifications.action_send_notification()
+        
+        _logger.info('Created %d milestone notifications', len(notifications))
+        return len(notifications)
 
     def _check_milestone_achievement(self, tracker):
-        """Check if tracker has achieved any new milestones."""
+        """Return the highest milestone reached by the tracker above the one already notified."""
         progress = tracker.overall_progress
         
-        # Define milestone thresholds
-        milestones = [
-            {'threshold': 25, 'type': '25_percent', 'message': 'Congratulations! You\'ve reached 25% completion.'},
-            {'threshold': 50, 'type': '50_percent', 'message': 'Great progress! You\'re halfway through the course.'},
-            {'threshold': 75, 'type': '75_percent', 'message': 'Excellent work! You\'ve completed 75% of the course.'},
-            {'threshold': 90, 'type': '90_percent', 'message': 'Almost there! You\'re at 90% completion.'},
-            {'threshold': 100, 'type': '100_percent', 'message': 'Congratulations! You\'ve completed the course!'},
-        ]
-        
-        # Check if any milestone was just achieved
-        for milestone in milestones:
+        for milestone in reversed(PROGRESS_MILESTONES):
+            if milestone['threshold'] <= tracker.notified_milestone:
+                break
             if progress >= milestone['threshold']:
-                # Check if we already sent this milestone notification
-                existing_notification = self.search([
-                    ('progress_tracker_id', '=', tracker.id),
-                    ('milestone_type', '=', milestone['type']),
-                    ('status', 'in', ['sent', 'read'])
-                ])
-                
-                if not existing_notification:
-                    return milestone
+                return milestone
         
         return None
 
-    def _create_milestone_notification(self, tracker, milestone):
-        """Create a milestone notification for the tracker."""
-        try:
-            notification = self.create({
-                'name': f'Progress Milestone - {tracker.student_id.name}',
-                'student_id': tracker.student_id.id,
-                'progress_tracker_id': tracker.id,
-                'notification_type': 'milestone',
-                'milestone_type': milestone['type'],
-                'message': milestone['message'],
-                'progress_value': tracker.overall_progress,
-                'recipient_user_id': tracker.student_id.assigned_agent_id.user_id.id if tracker.student_id.assigned_agent_id else None,
-                'recipient_email': tracker.student_id.email,
-                'priority': 'normal',
-                'auto_generated': True,
-                'trigger_condition': f'Progress reached {milestone["threshold"]}%',
-                'status': 'draft'
-            })
-            
-            # Auto-send the notification
-            notification.action_send_notification()
-            
-            return notification
-            
-        except Exception as e:
-            _logger.error('Failed to create milestone notification: %s', str(e))
-            return None
+    def _prepare_milestone_notification_vals(self, tracker, milestone):
+        """Prepare the values of a milestone notification for the tracker."""
+        return {
+            'name': f'Progress Milestone - {tracker.student_id.name}',
+            'student_id': tracker.student_id.id,
+            'progress_tracker_id': tracker.id,
+            'notification_type': 'milestone',
+            'milestone_type': milestone['type'],
+            'message': milestone['message'],
+            'progress_value': tracker.overall_progress,
+            'recipient_user_id': tracker.student_id.assigned_agent_id.user_id.id if tracker.student_id.assigned_agent_id else None,
+            'recipient_email': tracker.student_id.email,
+            'priority': 'normal',
+            'auto_generated': True,
+            'trigger_condition': f'Progress reached {milestone["threshold"]}%',
+            'digest_mode': self._is_digest_mode(),
+            'status': 'draft'
+        }
 
     @api.model
     def create_stalled_progress_alerts(self):
@@ -308,7 +593,8 @@ class ProgressNotification(models.Model):
             ('overall_progress', '<', 100)  # Not completed
         ])
         
-        created_count = 0
+        notifications = self.browse()
+        digest_mode = self._is_digest_mode()
         
         for tracker in stalled_trackers:
             # Check if we already sent a stalled notification recently
@@ -331,15 +617,16 @@ class ProgressNotification(models.Model):
                     'priority': 'high',
                     'auto_generated': True,
                     'trigger_condition': 'No progress for 7 days',
+                    'digest_mode': digest_mode,
                     'status': 'draft'
                 })
-                
-                # Auto-send the notification
-                notification.action_send_notification()
-                created_count += 1
+                notifications |= notification
         
-        _logger.info('Created %d stalled progress alerts', created_count)
-        return created_count
+        # Auto-send the notifications
+        notifications.action_send_notification()
+        
+        _logger.info('Created %d stalled progress alerts', len(notifications))
+        return len(notifications)
 
     @api.model
     def create_completion_notifications(self):
@@ -352,14 +639,15 @@ class ProgressNotification(models.Model):
             ('write_date', '>=', (datetime.now() - timedelta(hours=24)).strftime('%Y-%m-%d %H:%M:%S'))
         ])
         
-        created_count = 0
+        notifications = self.browse()
+        digest_mode = self._is_digest_mode()
         
         for tracker in recent_completions:
             # Check if we already sent a completion notification
             existing_notification = self.search([
                 ('progress_tracker_id', '=', tracker.id),
                 ('notification_type', '=', 'completion'),
-                ('status', 'in', ['sent', 'read']
+                ('status', 'in', ['queued', 'sent', 'read']
                 )
             ])
             
@@ -377,15 +665,16 @@ class ProgressNotification(models.Model):
                     'priority': 'normal',
                     'auto_generated': True,
                     'trigger_condition': 'Course completion detected',
+                    'digest_mode': digest_mode,
                     'status': 'draft'
                 })
-                
-                # Auto-send the notification
-                notification.action_send_notification()
-                created_count += 1
+                notifications |= notification
+        
+        # Auto-send the notifications
+        notifications.action_send_notification()
         
-        _logger.info('Created %d completion notifications', created_count)
-        return created_count
+        _logger.info('Created %d completion notifications', len(notifications))
+        return len(notifications)
 
     @api.model
     def cleanup_old_notifications(self):
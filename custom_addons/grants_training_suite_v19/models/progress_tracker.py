@@ -4,6 +4,8 @@ from odoo import models, fields, api, _
 from odoo.exceptions import ValidationError
 import logging
 
+from .notification_system import PROGRESS_MILESTONES
+
 _logger = logging.getLogger(__name__)
 
 
@@ -84,6 +86,21 @@ class ProgressTracker(models.Model):
         help='When the student completed the course'
     )
     
+    # Notifications
+    notification_ids = fields.One2many(
+        'gr.progress.notification',
+        'progress_tracker_id',
+        string='Notifications'
+    )
+    
+    # Read from the notifications rather than stored, so notifying a milestone
+    # does not touch the tracker write_date used to detect stalled progress
+    notified_milestone = fields.Integer(
+        string='Notified Milestone (%)',
+        compute='_compute_notified_milestone',
+        help='Highest progress milestone already notified for this tracker'
+    )
+    
     # Computed fields
     days_to_complete = fields.Integer(
         string='Days to Complete',
@@ -110,6 +127,21 @@ class ProgressTracker(models.Model):
             # Calculate overall progress
             record.overall_progress = (elearning_score * elearning_weight) + (custom_score * custom_weight)
     
+    @api.depends('notification_ids.notification_type', 'notification_ids.milestone_type', 'notification_ids.status')
+    def _compute_notified_milestone(self):
+        """Compute the notified milestone from the milestone notifications already sent."""
+        thresholds = {milestone['type']: milestone['threshold'] for milestone in PROGRESS_MILESTONES}
+        notified = {}
+        for tracker, milestone_type in self.env['gr.progress.notification']._read_group([
+            ('progress_tracker_id', 'in', self._origin.ids),
+            ('notification_type', '=', 'milestone'),
+            ('milestone_type', 'in', list(thresholds)),
+            ('status', 'in', ['queued', 'sent', 'read'])
+        ], ['progress_tracker_id', 'milestone_type']):
+            notified[tracker.id] = max(notified.get(tracker.id, 0), thresholds[milestone_type])
+        for record in self:
+            record.notified_milestone = notified.get(record._origin.id, 0)
+    
     @api.depends('start_date', 'completion_date')
     def _compute_days_to_complete(self):
         """Compute days taken to complete the course."""
@@ -204,27 +236,58 @@ class ProgressTracker(models.Model):
             ('status', 'in', ['not_started', 'in_progress'])
         ])
         
-        sync_count = 0
-        error_count = 0
+        result = trackers._sync_elearning_progress()
+        
+        _logger.info('Batch synchronization completed: %d updated, %d started, %d completed, %d errors',
+                     result['sync_count'], result['started_count'], result['completed_count'], result['error_count'])
+        return result
+    
+    def _sync_elearning_progress(self):
+        """Synchronize the trackers with their eLearning enrollments, set-wise.
+
+        Completions are read in one query and only trackers whose progress
+        changed are written, grouped by value. Start and completion
+        transitions are then applied with one write each.
+        """
+        trackers = self.filtered('elearning_enrollment_id')
+        completions = {
+            enrollment['id']: enrollment['completion']
+            for enrollment in trackers.elearning_enrollment_id.read(['completion'])
+        }
         
+        trackers_by_progress = {}
+        error_count = 0
         for tracker in trackers:
-            try:
-                old_progress = tracker.elearning_progress
-                tracker.action_sync_with_elearning()
-                
-                if old_progress != tracker.elearning_progress:
-                    sync_count += 1
-                    
-            except Exception as e:
+            progress = completions.get(tracker.elearning_enrollment_id.id) or 0.0
+            if not 0 <= progress <= 100:
                 error_count += 1
-                _logger.error('Failed to sync progress for tracker %s: %s', tracker.id, str(e))
+                _logger.error('Failed to sync progress for tracker %s: invalid progress value %s', tracker.id, progress)
                 continue
+            if progress != tracker.elearning_progress:
+                trackers_by_progress.setdefault(progress, []).append(tracker.id)
+        
+        for progress, tracker_ids in trackers_by_progress.items():
+            self.browse(tracker_ids).write({'elearning_progress': progress})
+            _logger.debug('Synchronized progress of %d trackers: %s%%', len(tracker_ids), progress)
+        
+        # Auto-start if not started and progress > 0
+        now = fields.Datetime.now()
+        to_start = trackers.filtered(lambda t: t.status == 'not_started' and t.elearning_progress > 0)
+        to_start.write({'status': 'in_progress', 'start_date': now})
+        
+        # Auto-complete if threshold met
+        to_complete = trackers.filtered(
+            lambda t: t.status == 'in_progress'
+            and t.overall_progress >= t.course_integration_id.completion_threshold
+        )
+        to_complete.write({'status': 'completed', 'completion_date': now})
         
-        _logger.info('Batch synchronization completed: %d updated, %d errors', sync_count, error_count)
         return {
-            'sync_count': sync_count,
+            'sync_count': sum(len(tracker_ids) for tracker_ids in trackers_by_progress.values()),
+            'started_count': len(to_start),
+            'completed_count': len(to_complete),
             'error_count': error_count,
-            'total_processed': len(trackers)
+            'total_processed': len(self),
         }
     
     @api.model
@@ -290,6 +353,34 @@ class ProgressTracker(models.Model):
             'total_processed': len(eligible_students)
         }
     
+    @api.model
+    def get_course_statistics(self, domain=None):
+        """Aggregate the trackers matching ``domain`` per course with one grouped query.
+
+        Returns a dict mapping each ``gr.course.integration`` to its
+        ``enrollments``, ``completed`` count, ``avg_progress`` and
+        ``completion_rate`` (in %). Courses without trackers are not included.
+        """
+        statistics = {}
+        groups = self._read_group(
+            domain or [],
+            ['course_integration_id', 'status'],
+            ['__count', 'overall_progress:sum'],
+        )
+        for course, status, count, progress_sum in groups:
+            course_stats = statistics.setdefault(course, {'enrollments': 0, 'completed': 0, 'progress_sum': 0.0})
+            course_stats['enrollments'] += count
+            course_stats['progress_sum'] += progress_sum or 0.0
+            if status == 'completed':
+                course_stats['completed'] += count
+        
+        for course_stats in statistics.values():
+            progress_sum = course_stats.pop('progress_sum')
+            course_stats['avg_progress'] = progress_sum / course_stats['enrollments']
+            course_stats['completion_rate'] = (course_stats['completed'] / course_stats['enrollments']) * 100
+        
+        return statistics
+    
     def name_get(self):
         """Custom name display."""
         result = []
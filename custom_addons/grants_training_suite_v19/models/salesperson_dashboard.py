@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 import logging
+from datetime import timedelta
 from odoo import models, fields, api, _
 
 _logger = logging.getLogger(__name__)
@@ -57,75 +58,71 @@ class SalespersonDashboard(models.TransientModel):
 
     def _compute_kpis(self):
         """Compute all KPI values for the logged-in salesperson"""
+        # The KPIs only depend on the user: compute them once with grouped queries
+        values = self._get_kpi_values(self.env.user)
         for dashboard in self:
-            user = self.env.user
-            
-            # Get pools assigned to this salesperson
-            pools = self.env['contact.pool'].search([
-                ('sales_person_id', '=', user.id)
-            ])
-            
-            if not pools:
-                dashboard.total_contacts = 0
-                dashboard.total_leads = 0
-                dashboard.active_leads = 0
-                dashboard.won_leads = 0
-                dashboard.recent_activities = 0
-                dashboard.idle_contacts = 0
-                continue
-            
-            # Get all contacts from assigned pools
-            contacts = self.env['res.partner'].search([
-                ('pool_id', 'in', pools.ids)
-            ])
-            
-            dashboard.total_contacts = len(contacts)
-            
-            # Get all leads linked to pool contacts
-            leads = self.env['crm.lead'].search([
-                ('partner_id', 'in', contacts.ids)
-            ])
-            
-            dashboard.total_leads = len(leads)
-            
+            dashboard.update(values)
+
+    def _get_kpi_values(self, user):
+        """Return the KPI values of the pools assigned to ``user``"""
+        # Get all contacts from assigned pools
+        contact_ids = self.env['res.partner'].search([
+            ('pool_id.sales_person_id', '=', user.id)
+        ]).ids
+        
+        if not contact_ids:
+            return dict.fromkeys([
+                'total_contacts', 'total_leads', 'active_leads',
+                'won_leads', 'recent_activities', 'idle_contacts',
+            ], 0)
+        
+        # Leads linked to pool contacts, counted per stage and probability
+        active_stages = self.env['crm.stage'].search([
+            ('is_won', '=', False),
+            ('is_lost', '=', False)
+        ])
+        lead_ids = []
+        total_leads = active_leads = won_leads = 0
+        for stage, probability, count, ids in self.env['crm.lead']._read_group(
+                [('partner_id', 'in', contact_ids)],
+                ['stage_id', 'probability'],
+                ['__count', 'id:array_agg']):
+            lead_ids += ids
+            total_leads += count
             # Active leads (not won, not lost)
-            active_stages = self.env['crm.stage'].search([
-                ('is_won', '=', False),
-                ('is_lost', '=', False)
-            ])
-            active_leads = leads.filtered(lambda l: l.stage_id in active_stages)
-            dashboard.active_leads = len(active_leads)
-            
+            if stage in active_stages:
+                active_leads += count
             # Won leads
-            won_leads = leads.filtered(lambda l: l.probability == 100 or getattr(l, 'is_won', False))
-            dashboard.won_leads = len(won_leads)
-            
-            # Recent activities (last 7 days)
-            from datetime import datetime, timedelta
-            cutoff_date = datetime.now() - timedelta(days=7)
-            recent_activities = self.env['mail.activity'].search_count([
-                '|',
-                ('res_model', '=', 'res.partner'),
-                ('res_model', '=', 'crm.lead'),
-                '|',
-                ('res_id', 'in', contacts.ids),
-                ('res_id', 'in', leads.ids),
-                ('date_deadline', '>=', cutoff_date)
-            ])
-            dashboard.recent_activities = recent_activities
-            
-            # Idle contacts (no activity in last 30 days)
-            idle_cutoff = datetime.now() - timedelta(days=30)
-            idle_count = 0
-            for contact in contacts:
-                has_recent_activity = self.env['mail.activity'].search_count([
-                    ('res_model', '=', 'res.partner'),
-                    ('res_id', '=', contact.id),
-                    ('date_deadline', '>=', idle_cutoff)
-                ])
-                if not has_recent_activity:
-                    idle_count += 1
-            dashboard.idle_contacts = idle_count
+            if probability == 100:
+                won_leads += count
+        
+        Activity = self.env['mail.activity']
+        
+        # Recent activities (last 7 days) on pool contacts and their leads
+        cutoff_date = fields.Date.today() - timedelta(days=7)
+        recent_activities = Activity.search_count([
+            ('date_deadline', '>=', cutoff_date),
+            '|',
+            '&', ('res_model', '=', 'res.partner'), ('res_id', 'in', contact_ids),
+            '&', ('res_model', '=', 'crm.lead'), ('res_id', 'in', lead_ids),
+        ])
+        
+        # Idle contacts (no activity in last 30 days), from one count over all contacts
+        idle_cutoff = fields.Date.today() - timedelta(days=30)
+        [(active_contacts,)] = Activity._read_group([
+            ('res_model', '=', 'res.partner'),
+            ('res_id', 'in', contact_ids),
+            ('date_deadline', '>=', idle_cutoff)
+        ], [], ['res_id:count_distinct'])
+        
+        return {
+            'total_contacts': len(contact_ids),
+            'total_leads': total_leads,
+            'active_leads': active_leads,
+            'won_leads': won_leads,
+            'recent_activities': recent_activities,
+            'idle_contacts': len(contact_ids) - active_contacts,
+        }
 
     def action_view_my_contacts(self):
         """Open my contacts view"""
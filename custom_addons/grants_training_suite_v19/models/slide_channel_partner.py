@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models
+
+
+class SlideChannelPartner(models.Model):
+    _inherit = 'slide.channel.partner'
+
+    def write(self, vals):
+        """Queue the completion changes for the progress trackers"""
+        if 'completion' not in vals:
+            return super(SlideChannelPartner, self).write(vals)
+        
+        changed = self.filtered(lambda enrollment: enrollment.completion != vals['completion'])
+        result = super(SlideChannelPartner, self).write(vals)
+        if changed:
+            self.env['gr.elearning.progress.change']._log_changes(changed)
+        return result
@@ -5,6 +5,8 @@ from datetime import datetime, date
 from odoo import models, fields, api, _
 from odoo.exceptions import UserError, ValidationError
 
+from .intake_batch import _DuplicateIndex
+
 _logger = logging.getLogger(__name__)
 
 class Student(models.Model):
@@ -55,6 +57,28 @@ class Student(models.Model):
         help='Student birth date'
     )
     
+    # Normalized identity keys, indexed for the duplicate detection of imports
+    email_key = fields.Char(
+        string='Email Key',
+        compute='_compute_identity_keys',
+        store=True,
+        index=True
+    )
+    
+    phone_key = fields.Char(
+        string='Phone Key',
+        compute='_compute_identity_keys',
+        store=True,
+        index=True
+    )
+    
+    name_birth_date_key = fields.Char(
+        string='Name and Birth Date Key',
+        compute='_compute_identity_keys',
+        store=True,
+        index=True
+    )
+    
     age = fields.Integer(
         string='Age',
         compute='_compute_age',
@@ -265,6 +289,15 @@ class Student(models.Model):
         help='Reason for eligibility or rejection'
     )
     
+    @api.depends('email', 'phone', 'name', 'birth_date')
+    def _compute_identity_keys(self):
+        """Compute the identity keys matched by the intake imports."""
+        for record in self:
+            keys = dict(_DuplicateIndex.keys(record.email, record.phone, record.name, record.birth_date))
+            record.email_key = keys.get('email', False)
+            record.phone_key = keys.get('phone', False)
+            record.name_birth_date_key = keys.get('name_birth_date', False)
+    
     @api.depends('birth_date')
     def _compute_age(self):
         """Compute age from birth date."""
@@ -512,14 +545,26 @@ class Student(models.Model):
     
     @api.model_create_multi
     def create(self, vals_list):
-        """Override create to set intake date and assess eligibility."""
+        """Override create to set intake date and assess eligibility.
+
+        With ``defer_eligibility_assessment`` in the context the assessment is
+        left to the caller, which runs ``_assess_eligibility_batch()`` once for
+        all the students it created (e.g. an intake batch import).
+        """
         students = super(Student, self).create(vals_list)
         
         # Assess eligibility after creation
-        for student in students:
-            student._assess_eligibility()
-            # Log creation
-            _logger.info('Student created: %s (%s)', student.name, student.email)
+        if not self.env.context.get('defer_eligibility_assessment'):
+            students._assess_eligibility_batch()
+        
+        # Log creation: one line per student only for single creations or at DEBUG level
+        if len(students) == 1:
+            _logger.info('Student created: %s (%s)', students.name, students.email)
+        else:
+            _logger.info('%d students created', len(students))
+            if _logger.isEnabledFor(logging.DEBUG):
+                for student in students:
+                    _logger.debug('Student created: %s (%s)', student.name, student.email)
         
         return students
     
@@ -529,24 +574,41 @@ class Student(models.Model):
         
         # Reassess eligibility if relevant fields changed
         relevant_fields = ['age', 'english_level', 'has_certificate', 'birth_date']
-        if any(field in vals for field in relevant_fields):
-            for record in self:
-                record._assess_eligibility()
+        if any(field in vals for field in relevant_fields) and not self.env.context.get('defer_eligibility_assessment'):
+            self._assess_eligibility_batch()
         
         return result
     
     def _assess_eligibility(self):
         """Assess student eligibility and update state."""
         self.ensure_one()
-        
-        if self.is_eligible:
-            if self.state == 'draft':
-                self.state = 'eligible'
+        self._assess_eligibility_batch()
+    
+    def _assess_eligibility_batch(self):
+        """Assess the eligibility of all students of the recordset at once.
+
+        ``is_eligible`` and ``eligibility_reason`` are computed for the whole
+        recordset in one pass, then the state changes are applied with one
+        write per target state.
+        """
+        to_eligible = self.filtered(lambda student: student.is_eligible and student.state == 'draft')
+        to_reject = self.filtered(
+            lambda student: not student.is_eligible and student.state in ['draft', 'eligible']
+        )
+        
+        if to_eligible:
+            to_eligible.write({'state': 'eligible'})
+        if to_reject:
+            to_reject.write({'state': 'rejected'})
+        
+        if len(self) == 1 and (to_eligible or to_reject):
+            if to_eligible:
                 _logger.info('Student %s marked as eligible', self.name)
-        else:
-            if self.state in ['draft', 'eligible']:
-                self.state = 'rejected'
+            else:
                 _logger.info('Student %s marked as rejected: %s', self.name, self.eligibility_reason)
+        elif to_eligible or to_reject:
+            _logger.info('Eligibility assessed for %d students: %d marked as eligible, %d marked as rejected',
+                         len(self), len(to_eligible), len(to_reject))
     
     def action_assign_agent(self):
         """Action to assign an agent to the student."""
@@ -0,0 +1,279 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, api, _
+import logging
+from datetime import timedelta
+
+_logger = logging.getLogger(__name__)
+
+# Days holding students or trackers changed since the last refresh are
+# rebuilt incrementally; all days are rebuilt at least this often so deleted
+# records, which leave no write_date, are dropped
+SNAPSHOT_MAX_AGE_MINUTES = 24 * 60
+
+# write_date is the start time of the writing transaction, which may commit
+# after a refresh read past it: changes this recent are read again by the
+# next refresh. Must exceed the longest transaction writing source records.
+WRITE_DATE_MARGIN_MINUTES = 15
+
+SNAPSHOT_REFRESH_PARAM = 'grants_training_suite_v19.analytics_snapshot_refreshed_at'
+
+SNAPSHOT_AGGREGATES = ['record_count:sum', 'progress_sum:sum', 'completion_days_sum:sum', 'completion_days_count:sum']
+
+
+class _SnapshotWindow:
+    """Daily snapshot buckets of a date range, loaded once and summed in memory.
+
+    Answers ``aggregate()`` like the snapshot model for any range inside the
+    window, so dashboards sharing a refresh cycle do not query the buckets
+    again for each date range.
+    """
+
+    def __init__(self, rows):
+        # rows: (day, source, status, progress_range, *sums)
+        self.rows = rows
+
+    def aggregate(self, source, date_from, date_to, groupby, statuses=None):
+        sums = {}
+        for day, row_source, status, progress_range, *values in self.rows:
+            if row_source != source or day < date_from or day > date_to:
+                continue
+            if statuses is not None and status not in statuses:
+                continue
+            key = tuple(self._group_value(spec, day, status, progress_range) for spec in groupby)
+            totals = sums.setdefault(key, [0] * len(values))
+            for index, value in enumerate(values):
+                totals[index] += value or 0
+        if not groupby:
+            # Like _read_group, an ungrouped aggregate always returns one row
+            return [tuple(sums.get((), [None] * len(SNAPSHOT_AGGREGATES)))]
+        return [key + tuple(totals) for key, totals in sorted(sums.items(), key=lambda item: str(item[0]))]
+
+    @staticmethod
+    def _group_value(spec, day, status, progress_range):
+        if spec == 'status':
+            return status
+        if spec == 'progress_range':
+            return progress_range
+        if spec == 'bucket_date:month':
+            return day.replace(day=1)
+        raise ValueError('Unsupported snapshot grouping: %s' % spec)
+
+
+class TrainingAnalyticsSnapshot(models.Model):
+    """Pre-aggregated students and progress trackers per date bucket.
+
+    Backed by a summary table maintained per day: one row per day, source
+    model, course, status and progress range. Dashboards answer any date range
+    by summing buckets instead of scanning the raw records, and a refresh only
+    rebuilds the days holding records changed since the previous one.
+    """
+    _name = 'gr.training.analytics.snapshot'
+    _description = 'Training Analytics Snapshot'
+    _auto = False
+    _order = 'bucket_date desc'
+
+    bucket_date = fields.Date(
+        string='Bucket Date',
+        readonly=True
+    )
+
+    source = fields.Selection([
+        ('student', 'Students'),
+        ('tracker', 'Progress Trackers')
+    ], string='Source', readonly=True)
+
+    course_integration_id = fields.Many2one(
+        'gr.course.integration',
+        string='Course Integration',
+        readonly=True
+    )
+
+    status = fields.Char(
+        string='Status',
+        readonly=True,
+        help='Integration status of the students or status of the progress trackers'
+    )
+
+    progress_range = fields.Char(
+        string='Progress Range',
+        readonly=True
+    )
+
+    record_count = fields.Integer(
+        string='Records',
+        readonly=True
+    )
+
+    progress_sum = fields.Float(
+        string='Progress Sum',
+        readonly=True
+    )
+
+    completion_days_sum = fields.Integer(
+        string='Completion Days Sum',
+        readonly=True,
+        help='Sum of the days between intake and creation of the students'
+    )
+
+    completion_days_count = fields.Integer(
+        string='Completion Days Count',
+        readonly=True,
+        help='Number of students counted in the completion days sum'
+    )
+
+    def init(self):
+        """Create the summary table holding the snapshots and fill it."""
+        # Earlier versions stored the snapshots in a materialized view
+        self.env.cr.execute('SELECT 1 FROM pg_matviews WHERE matviewname = %s', [self._table])
+        if self.env.cr.fetchone():
+            self.env.cr.execute('DROP MATERIALIZED VIEW %s' % self._table)
+        self.env.cr.execute("""
+            CREATE TABLE IF NOT EXISTS %s (
+                id serial PRIMARY KEY,
+                bucket_date date NOT NULL,
+                source varchar NOT NULL,
+                course_integration_id integer,
+                status varchar,
+                progress_range varchar,
+                record_count integer,
+                progress_sum double precision,
+                completion_days_sum integer,
+                completion_days_count integer
+            )
+        """ % self._table)
+        self.env.cr.execute('CREATE INDEX IF NOT EXISTS %s_bucket_date_source_index ON %s (bucket_date, source)'
+                            % (self._table, self._table))
+        self.refresh_snapshots()
+
+    def _mark_refreshed(self, refreshed_at):
+        self.env['ir.config_parameter'].sudo().set_param(SNAPSHOT_REFRESH_PARAM, fields.Datetime.to_string(refreshed_at))
+
+    def _rebuild_buckets(self, days=None):
+        """Recompute the buckets of ``days`` from the raw records, or of all days when None."""
+        self.env['gr.student'].flush_model()
+        self.env['gr.progress.tracker'].flush_model()
+        params = {
+            'days': days,
+            'first_day': days and min(days),
+            'last_day': days and max(days),
+        }
+        # Serialize the rebuilds without blocking the readers
+        self.env.cr.execute('LOCK TABLE %s IN SHARE ROW EXCLUSIVE MODE' % self._table)
+        self.env.cr.execute("""
+            DELETE FROM %s WHERE %%(days)s::date[] IS NULL OR bucket_date = ANY(%%(days)s)
+        """ % self._table, params)
+        # The create_date range lets the indexes narrow the scan down to the rebuilt days
+        self.env.cr.execute("""
+            INSERT INTO %s (bucket_date, source, course_integration_id, status, progress_range,
+                            record_count, progress_sum, completion_days_sum, completion_days_count)
+            SELECT s.create_date::date AS bucket_date,
+                   'student' AS source,
+                   NULL AS course_integration_id,
+                   s.integration_status AS status,
+                   NULL AS progress_range,
+                   count(*) AS record_count,
+                   0.0 AS progress_sum,
+                   coalesce(sum(s.create_date::date - s.intake_date::date), 0) AS completion_days_sum,
+                   count(s.intake_date) AS completion_days_count
+              FROM gr_student s
+             WHERE %%(days)s::date[] IS NULL
+                OR (s.create_date >= %%(first_day)s AND s.create_date < %%(last_day)s::date + 1
+                    AND s.create_date::date = ANY(%%(days)s))
+             GROUP BY 1, 4
+            UNION ALL
+            SELECT t.create_date::date AS bucket_date,
+                   'tracker' AS source,
+                   t.course_integration_id,
+                   t.status,
+                   CASE WHEN coalesce(t.overall_progress, 0) < 25 THEN '0-25%%%%'
+                        WHEN t.overall_progress < 50 THEN '25-50%%%%'
+                        WHEN t.overall_progress < 75 THEN '50-75%%%%'
+                        ELSE '75-100%%%%'
+                   END AS progress_range,
+                   count(*) AS record_count,
+                   coalesce(sum(t.overall_progress), 0.0) AS progress_sum,
+                   0 AS completion_days_sum,
+                   0 AS completion_days_count
+              FROM gr_progress_tracker t
+             WHERE %%(days)s::date[] IS NULL
+                OR (t.create_date >= %%(first_day)s AND t.create_date < %%(last_day)s::date + 1
+                    AND t.create_date::date = ANY(%%(days)s))
+             GROUP BY 1, 3, 4, 5
+        """ % self._table, params)
+        self.invalidate_model()
+
+    def _get_changed_days(self, since):
+        """Return the days holding students or trackers changed after ``since``."""
+        self.env['gr.student'].flush_model(['write_date'])
+        self.env['gr.progress.tracker'].flush_model(['write_date'])
+        self.env.cr.execute("""
+            SELECT create_date::date FROM gr_student WHERE write_date > %(since)s
+             UNION
+            SELECT create_date::date FROM gr_progress_tracker WHERE write_date > %(since)s
+        """, {'since': since})
+        return [day for day, in self.env.cr.fetchall()]
+
+    @api.model
+    def refresh_snapshots(self):
+        """Rebuild all snapshot buckets from the raw records."""
+        refreshed_at = fields.Datetime.now()
+        self._rebuild_buckets()
+        self._mark_refreshed(refreshed_at)
+        _logger.info('Training analytics snapshots refreshed')
+
+    @api.model
+    def refresh_if_stale(self, last_change=None, max_age=SNAPSHOT_MAX_AGE_MINUTES):
+        """Bring the snapshots up to date with the source records.
+
+        All buckets are rebuilt when the snapshots are older than ``max_age``
+        minutes. Otherwise, when ``last_change``, the latest write_date of the
+        source records, is after the last refresh minus
+        WRITE_DATE_MARGIN_MINUTES, only the days holding the records changed
+        since are rebuilt.
+        """
+        refreshed_at = self.env['ir.config_parameter'].sudo().get_param(SNAPSHOT_REFRESH_PARAM)
+        refreshed_at = refreshed_at and fields.Datetime.to_datetime(refreshed_at)
+        now = fields.Datetime.now()
+        if not refreshed_at or refreshed_at < now - timedelta(minutes=max_age):
+            self.refresh_snapshots()
+            return
+        since = refreshed_at - timedelta(minutes=WRITE_DATE_MARGIN_MINUTES)
+        if last_change and last_change > since:
+            days = self._get_changed_days(since)
+            if days:
+                self._rebuild_buckets(days)
+            self._mark_refreshed(now)
+            _logger.info('Training analytics snapshots refreshed for %d days', len(days))
+
+    @api.model
+    def aggregate(self, source, date_from, date_to, groupby, statuses=None):
+        """Sum the daily buckets of ``source`` between two dates, inclusive.
+
+        Returns the ``_read_group`` rows: the ``groupby`` values followed by
+        the record count, progress sum, completion days sum and count.
+        """
+        domain = [
+            ('source', '=', source),
+            ('bucket_date', '>=', date_from),
+            ('bucket_date', '<=', date_to),
+        ]
+        if statuses is not None:
+            domain.append(('status', 'in', list(statuses)))
+        return self._read_group(domain, groupby, SNAPSHOT_AGGREGATES)
+
+    @api.model
+    def load_window(self, date_from, date_to):
+        """Load the daily buckets between two dates, inclusive, with one query.
+
+        The returned window answers ``aggregate()`` for any range inside it.
+        """
+        rows = self._read_group(
+            [
+                ('bucket_date', '>=', date_from),
+                ('bucket_date', '<=', date_to),
+            ],
+            ['bucket_date:day', 'source', 'status', 'progress_range'],
+            SNAPSHOT_AGGREGATES,
+        )
+        return _SnapshotWindow(rows)
@@ -2,11 +2,59 @@
 
 from odoo import models, fields, api, _
 from odoo.exceptions import UserError
+import ast
+import json
 import logging
 from datetime import datetime, timedelta
 
+from .training_analytics_snapshot import WRITE_DATE_MARGIN_MINUTES
+
 _logger = logging.getLogger(__name__)
 
+# Analytics fields holding JSON payloads, with their empty value
+ANALYTICS_JSON_FIELDS = {
+    'progress_distribution': {},
+    'monthly_enrollments': {},
+    'completion_trends': {},
+    'top_performers': [],
+    'struggling_students': [],
+    'engagement_metrics': {},
+    'course_performance': [],
+    'popular_courses': [],
+    'integration_status_summary': {},
+}
+
+# Student integration statuses counted as enrolled and as completed
+ENROLLED_STATUSES = ['enrolled', 'in_progress', 'completed', 'certified']
+COMPLETED_STATUSES = ['completed', 'certified']
+
+# Source models of the analytics, with the dashboard field holding the
+# latest write_date seen by the last refresh
+WATERMARK_FIELDS = {
+    'gr.student': 'student_watermark',
+    'gr.progress.tracker': 'tracker_watermark',
+    'gr.course.integration': 'course_watermark',
+}
+
+# Watermark of a source model without records, so an empty model compares
+# like any other instead of looking never refreshed
+EMPTY_WATERMARK = datetime(1970, 1, 1)
+
+# Source models read by each metric group: changes to the first set only
+# matter for records created inside the dashboard date range, changes to the
+# second set always do
+METRIC_GROUP_SOURCES = {
+    'kpi': ({'gr.student', 'gr.progress.tracker'}, {'gr.course.integration'}),
+    'progress': ({'gr.student', 'gr.progress.tracker'}, set()),
+    'student': (set(), {'gr.student'}),
+    'course': ({'gr.progress.tracker'}, {'gr.course.integration'}),
+    'integration': ({'gr.student'}, set()),
+}
+
+# Deleted records leave no write_date behind: dashboards are fully
+# recomputed when their last update is older than this
+FULL_REFRESH_HOURS = 24
+
 
 class TrainingDashboard(models.Model):
     _name = 'gr.training.dashboard'
@@ -155,6 +203,32 @@ class TrainingDashboard(models.Model):
         default=fields.Datetime.now
     )
 
+    analytics_payload = fields.Json(
+        string='Analytics Payload',
+        compute='_compute_analytics_payload',
+        store=True,
+        help='Precomputed dashboard data served to API/JavaScript clients'
+    )
+
+    # Change Tracking
+    student_watermark = fields.Datetime(
+        string='Students Watermark',
+        readonly=True,
+        help='Latest student change included in the dashboard'
+    )
+
+    tracker_watermark = fields.Datetime(
+        string='Progress Trackers Watermark',
+        readonly=True,
+        help='Latest progress tracker change included in the dashboard'
+    )
+
+    course_watermark = fields.Datetime(
+        string='Course Integrations Watermark',
+        readonly=True,
+        help='Latest course integration change included in the dashboard'
+    )
+
     auto_refresh = fields.Boolean(
         string='Auto Refresh',
         default=True,
@@ -170,255 +244,337 @@ class TrainingDashboard(models.Model):
     @api.depends('date_from', 'date_to')
     def _compute_kpi_metrics(self):
         """Compute key performance indicators."""
+        Snapshot = self._get_fresh_snapshots()
+        active_courses = self.env['gr.course.integration'].search_count([('status', '=', 'active')])
         for dashboard in self:
-            domain = [
-                ('create_date', '>=', dashboard.date_from),
-                ('create_date', '<=', dashboard.date_to)
-            ]
-
-            # Total students in date range
-            dashboard.total_students = self.env['gr.student'].search_count(domain)
-
-            # Enrolled students
-            enrolled_domain = domain + [('integration_status', 'in', ['enrolled', 'in_progress', 'completed', 'certified'])]
-            dashboard.enrolled_students = self.env['gr.student'].search_count(enrolled_domain)
-
-            # Completed students
-            completed_domain = domain + [('integration_status', 'in', ['completed', 'certified'])]
-            dashboard.completed_students = self.env['gr.student'].search_count(completed_domain)
-
-            # Completion rate
-            if dashboard.total_students > 0:
-                dashboard.completion_rate = (dashboard.completed_students / dashboard.total_students) * 100
-            else:
-                dashboard.completion_rate = 0.0
-
-            # Average completion time
-            completed_students = self.env['gr.student'].search(completed_domain)
-            if completed_students:
-                total_days = 0
-                count = 0
-                for student in completed_students:
-                    if student.intake_date and student.create_date:
-                        days = (student.create_date.date() - student.intake_date).days
-                        total_days += days
-                        count += 1
-                
-                if count > 0:
-                    dashboard.avg_completion_time = total_days / count
-                else:
-                    dashboard.avg_completion_time = 0.0
-            else:
-                dashboard.avg_completion_time = 0.0
-
-            # Active courses
-            dashboard.active_courses = self.env['gr.course.integration'].search_count([('status', '=', 'active')])
-
-            # Total enrollments
-            dashboard.total_enrollments = self.env['gr.progress.tracker'].search_count([
-                ('create_date', '>=', dashboard.date_from),
-                ('create_date', '<=', dashboard.date_to)
-            ])
+            dashboard.update(self._get_kpi_values(Snapshot, dashboard.date_from, dashboard.date_to))
+            dashboard.active_courses = active_courses
 
     @api.depends('date_from', 'date_to')
     def _compute_progress_analytics(self):
         """Compute progress analytics and trends."""
+        Snapshot = self._get_fresh_snapshots()
         for dashboard in self:
-            # Progress distribution
-            progress_data = {}
-            trackers = self.env['gr.progress.tracker'].search([
-                ('create_date', '>=', dashboard.date_from),
-                ('create_date', '<=', dashboard.date_to)
-            ])
-
-            for tracker in trackers:
-                progress_range = self._get_progress_range(tracker.overall_progress)
-                progress_data[progress_range] = progress_data.get(progress_range, 0) + 1
-
-            dashboard.progress_distribution = str(progress_data)
-
-            # Monthly enrollments
-            monthly_data = {}
-            enrollments = self.env['gr.progress.tracker'].search([
-                ('create_date', '>=', dashboard.date_from),
-                ('create_date', '<=', dashboard.date_to)
-            ])
-
-            for enrollment in enrollments:
-                month_key = enrollment.create_date.strftime('%Y-%m')
-                monthly_data[month_key] = monthly_data.get(month_key, 0) + 1
-
-            dashboard.monthly_enrollments = str(monthly_data)
-
-            # Completion trends
-            completion_data = {}
-            completions = self.env['gr.student'].search([
-                ('integration_status', 'in', ['completed', 'certified']),
-                ('create_date', '>=', dashboard.date_from),
-                ('create_date', '<=', dashboard.date_to)
-            ])
-
-            for completion in completions:
-                month_key = completion.create_date.strftime('%Y-%m')
-                completion_data[month_key] = completion_data.get(month_key, 0) + 1
-
-            dashboard.completion_trends = str(completion_data)
+            dashboard.update(self._get_progress_values(Snapshot, dashboard.date_from, dashboard.date_to))
 
     @api.depends('date_from', 'date_to')
     def _compute_student_analytics(self):
         """Compute student performance analytics."""
+        # These analytics do not depend on the date range
+        values = self._get_student_values()
         for dashboard in self:
-            # Top performers
-            top_performers = self.env['gr.student'].search([
-                ('integration_status', 'in', ['in_progress', 'completed', 'certified']),
-                ('elearning_progress', '>', 80)
-            ], order='elearning_progress desc', limit=10)
-
-            top_data = []
-            for student in top_performers:
-                top_data.append({
-                    'name': student.name,
-                    'progress': student.elearning_progress,
-                    'courses_completed': student.completed_courses
-                })
+            dashboard.update(values)
 
-            dashboard.top_performers = str(top_data)
+    @api.depends('date_from', 'date_to')
+    def _compute_course_analytics(self):
+        """Compute course performance analytics."""
+        courses = self.env['gr.course.integration'].search([('status', '=', 'active')])
+        for dashboard in self:
+            dashboard.update(self._get_course_values(courses, dashboard.date_from, dashboard.date_to))
 
-            # Struggling students
-            struggling_students = self.env['gr.student'].search([
-                ('integration_status', 'in', ['enrolled', 'in_progress']),
-                ('elearning_progress', '<', 25)
-            ], order='elearning_progress asc', limit=10)
+    @api.depends('date_from', 'date_to')
+    def _compute_integration_analytics(self):
+        """Compute eLearning integration analytics."""
+        Snapshot = self._get_fresh_snapshots()
+        for dashboard in self:
+            dashboard.update(self._get_integration_values(Snapshot, dashboard.date_from, dashboard.date_to))
 
-            struggling_data = []
-            for student in struggling_students:
-                struggling_data.append({
-                    'name': student.name,
-                    'progress': student.elearning_progress,
-                    'last_activity': student.create_date.strftime('%Y-%m-%d')
-                })
+    @api.depends('total_students', 'enrolled_students', 'completed_students', 'completion_rate',
+                 'avg_completion_time', 'active_courses', 'total_enrollments', 'elearning_adoption_rate',
+                 'last_update', *ANALYTICS_JSON_FIELDS)
+    def _compute_analytics_payload(self):
+        """Assemble the dashboard data once, when the analytics change."""
+        for dashboard in self:
+            dashboard.analytics_payload = dashboard._build_analytics_payload()
+
+    # ===== METRIC VALUES =====
+    # ``snapshots`` is the snapshot model or a window of snapshots loaded in
+    # memory; both answer aggregate() the same way.
+
+    def _get_kpi_values(self, snapshots, date_from, date_to):
+        """Return the KPI values of a date range, except active courses."""
+        # Students in date range, per integration status
+        total = enrolled = completed = completion_days = completion_count = 0
+        for status, count, _progress, days_sum, days_count in snapshots.aggregate(
+                'student', date_from, date_to, ['status']):
+            total += count
+            if status in ENROLLED_STATUSES:
+                enrolled += count
+            if status in COMPLETED_STATUSES:
+                completed += count
+                completion_days += days_sum
+                completion_count += days_count
+
+        # Total enrollments
+        tracker_rows = snapshots.aggregate('tracker', date_from, date_to, [])
 
-            dashboard.struggling_students = str(struggling_data)
+        return {
+            'total_students': total,
+            'enrolled_students': enrolled,
+            'completed_students': completed,
+            'completion_rate': (completed / total) * 100 if total > 0 else 0.0,
+            'avg_completion_time': completion_days / completion_count if completion_count > 0 else 0.0,
+            'total_enrollments': (tracker_rows[0][0] or 0) if tracker_rows else 0,
+        }
+
+    def _get_progress_values(self, snapshots, date_from, date_to):
+        """Return the progress distribution, monthly enrollments and completion trends of a date range."""
+        # Progress distribution
+        progress_data = {}
+        for progress_range, count, *_sums in snapshots.aggregate('tracker', date_from, date_to, ['progress_range']):
+            progress_data[progress_range] = count
+
+        # Monthly enrollments
+        monthly_data = {}
+        for month, count, *_sums in snapshots.aggregate('tracker', date_from, date_to, ['bucket_date:month']):
+            monthly_data[month.strftime('%Y-%m')] = count
+
+        # Completion trends
+        completion_data = {}
+        for month, count, *_sums in snapshots.aggregate('student', date_from, date_to, ['bucket_date:month'],
+                                                        statuses=COMPLETED_STATUSES):
+            completion_data[month.strftime('%Y-%m')] = count
+
+        return {
+            'progress_distribution': json.dumps(progress_data),
+            'monthly_enrollments': json.dumps(monthly_data),
+            'completion_trends': json.dumps(completion_data),
+        }
+
+    def _get_student_values(self):
+        """Return the student performance analytics, which do not depend on the date range."""
+        # Top performers
+        top_performers = self.env['gr.student'].search([
+            ('integration_status', 'in', ['in_progress', 'completed', 'certified']),
+            ('elearning_progress', '>', 80)
+        ], order='elearning_progress desc', limit=10)
+
+        top_data = []
+        for student in top_performers:
+            top_data.append({
+                'name': student.name,
+                'progress': student.elearning_progress,
+                'courses_completed': student.completed_courses
+            })
+
+        # Struggling students
+        struggling_students = self.env['gr.student'].search([
+            ('integration_status', 'in', ['enrolled', 'in_progress']),
+            ('elearning_progress', '<', 25)
+        ], order='elearning_progress asc', limit=10)
+
+        struggling_data = []
+        for student in struggling_students:
+            struggling_data.append({
+                'name': student.name,
+                'progress': student.elearning_progress,
+                'last_activity': student.create_date.strftime('%Y-%m-%d')
+            })
 
-            # Engagement metrics
-            total_active = self.env['gr.student'].search_count([
-                ('integration_status', 'in', ['enrolled', 'in_progress'])
-            ])
+        # Engagement metrics
+        total_active = self.env['gr.student'].search_count([
+            ('integration_status', 'in', ['enrolled', 'in_progress'])
+        ])
 
-            highly_engaged = self.env['gr.student'].search_count([
-                ('integration_status', 'in', ['enrolled', 'in_progress']),
-                ('elearning_progress', '>', 50)
-            ])
+        highly_engaged = self.env['gr.student'].search_count([
+            ('integration_status', 'in', ['enrolled', 'in_progress']),
+            ('elearning_progress', '>', 50)
+        ])
 
-            engagement_rate = (highly_engaged / total_active * 100) if total_active > 0 else 0
+        engagement_rate = (highly_engaged / total_active * 100) if total_active > 0 else 0
 
-            dashboard.engagement_metrics = str({
+        return {
+            'top_performers': json.dumps(top_data),
+            'struggling_students': json.dumps(struggling_data),
+            'engagement_metrics': json.dumps({
                 'total_active': total_active,
                 'highly_engaged': highly_engaged,
                 'engagement_rate': engagement_rate
-            })
+            }),
+        }
 
-    @api.depends('date_from', 'date_to')
-    def _compute_course_analytics(self):
-        """Compute course performance analytics."""
-        for dashboard in self:
-            # Course performance
-            courses = self.env['gr.course.integration'].search([('status', '=', 'active')])
-            course_data = []
-
-            for course in courses:
-                trackers = self.env['gr.progress.tracker'].search([
-                    ('course_integration_id', '=', course.id),
-                    ('create_date', '>=', dashboard.date_from),
-                    ('create_date', '<=', dashboard.date_to)
-                ])
-
-                if trackers:
-                    avg_progress = sum(tracker.overall_progress for tracker in trackers) / len(trackers)
-                    completion_count = len(trackers.filtered(lambda t: t.status == 'completed'))
-                    completion_rate = (completion_count / len(trackers)) * 100
-
-                    course_data.append({
-                        'name': course.name,
-                        'enrollments': len(trackers),
-                        'avg_progress': avg_progress,
-                        'completion_rate': completion_rate
-                    })
-
-            dashboard.course_performance = str(course_data)
-
-            # Popular courses
-            popular_courses = self.env['gr.course.integration'].search([('status', '=', 'active')])
-            popular_data = []
-
-            for course in popular_courses:
-                enrollment_count = self.env['gr.progress.tracker'].search_count([
-                    ('course_integration_id', '=', course.id),
-                    ('create_date', '>=', dashboard.date_from),
-                    ('create_date', '<=', dashboard.date_to)
-                ])
-
-                popular_data.append({
+    def _get_course_values(self, courses, date_from, date_to):
+        """Return the course performance and popular courses of a date range."""
+        # One grouped query over the trackers serves both analytics
+        statistics = self.env['gr.progress.tracker'].get_course_statistics([
+            ('course_integration_id', 'in', courses.ids),
+            ('create_date', '>=', date_from),
+            ('create_date', '<', date_to + timedelta(days=1)),
+        ])
+
+        # Course performance
+        course_data = []
+        for course in courses:
+            if course in statistics:
+                course_data.append({
                     'name': course.name,
-                    'enrollments': enrollment_count
+                    'enrollments': statistics[course]['enrollments'],
+                    'avg_progress': statistics[course]['avg_progress'],
+                    'completion_rate': statistics[course]['completion_rate']
                 })
 
-            # Sort by enrollments and take top 5
-            popular_data.sort(key=lambda x: x['enrollments'], reverse=True)
-            dashboard.popular_courses = str(popular_data[:5])
+        # Popular courses
+        popular_data = []
+        for course in courses:
+            popular_data.append({
+                'name': course.name,
+                'enrollments': statistics.get(course, {}).get('enrollments', 0)
+            })
 
-    @api.depends('date_from', 'date_to')
-    def _compute_integration_analytics(self):
-        """Compute eLearning integration analytics."""
-        for dashboard in self:
-            # Integration status summary
-            status_counts = {}
-            students = self.env['gr.student'].search([
-                ('create_date', '>=', dashboard.date_from),
-                ('create_date', '<=', dashboard.date_to)
-            ])
-
-            for student in students:
-                status = student.integration_status
-                status_counts[status] = status_counts.get(status, 0) + 1
-
-            dashboard.integration_status_summary = str(status_counts)
-
-            # eLearning adoption rate
-            total_students = len(students)
-            elearning_students = len(students.filtered(lambda s: s.integration_status != 'not_integrated'))
-            
-            if total_students > 0:
-                dashboard.elearning_adoption_rate = (elearning_students / total_students) * 100
-            else:
-                dashboard.elearning_adoption_rate = 0.0
-
-    def _get_progress_range(self, progress):
-        """Get progress range category."""
-        if progress < 25:
-            return '0-25%'
-        elif progress < 50:
-            return '25-50%'
-        elif progress < 75:
-            return '50-75%'
-        else:
-            return '75-100%'
+        # Sort by enrollments and take top 5
+        popular_data.sort(key=lambda x: x['enrollments'], reverse=True)
+
+        return {
+            'course_performance': json.dumps(course_data),
+            'popular_courses': json.dumps(popular_data[:5]),
+        }
+
+    def _get_integration_values(self, snapshots, date_from, date_to):
+        """Return the integration status summary and eLearning adoption rate of a date range."""
+        # Integration status summary
+        status_counts = {}
+        for status, count, *_sums in snapshots.aggregate('student', date_from, date_to, ['status']):
+            status_counts[status] = count
+
+        # eLearning adoption rate
+        total_students = sum(status_counts.values())
+        elearning_students = total_students - status_counts.get('not_integrated', 0)
+
+        return {
+            'integration_status_summary': json.dumps(status_counts),
+            'elearning_adoption_rate': (elearning_students / total_students) * 100 if total_students > 0 else 0.0,
+        }
 
     def action_refresh_dashboard(self):
         """Manually refresh dashboard data."""
-        self._compute_kpi_metrics()
-        self._compute_progress_analytics()
-        self._compute_student_analytics()
-        self._compute_course_analytics()
-        self._compute_integration_analytics()
-        
-        self.last_update = fields.Datetime.now()
+        self._refresh_dashboards()
         
         return {
             'type': 'ir.actions.client',
             'tag': 'reload',
         }
 
+    def _refresh_dashboards(self, force=False):
+        """Refresh the dashboards of the recordset with the changes they have not seen.
+
+        Each dashboard keeps the latest ``write_date`` of every source model
+        it includes. Only the metric groups reading a source changed since
+        then, within the dashboard date range where it matters, are
+        recomputed: idle periods cost one query per source model. Dashboards
+        sharing a date range and watermarks are computed once, and the
+        date-range independent metrics and snapshot buckets once per cycle.
+        """
+        if not self:
+            return 0
+        
+        watermarks = self._get_source_watermarks()
+        # Writes stamped within the margin may still commit: their watermarks
+        # are only stored once settled, so the next refresh reads them again
+        settled_before = fields.Datetime.now() - timedelta(minutes=WRITE_DATE_MARGIN_MINUTES)
+        settled_watermarks = {model: min(mark, settled_before) for model, mark in watermarks.items()}
+        full_refresh_before = fields.Datetime.now() - timedelta(hours=FULL_REFRESH_HOURS)
+        
+        # Group the dashboards by date range and by the changes they have not seen
+        dashboards_by_plan = {}
+        for dashboard in self:
+            full = force or not dashboard.last_update or dashboard.last_update < full_refresh_before
+            marks = tuple(False if full else dashboard[field_name] for field_name in WATERMARK_FIELDS.values())
+            key = (dashboard.date_from, dashboard.date_to, marks)
+            dashboards_by_plan[key] = dashboards_by_plan.get(key, self.browse()) | dashboard
+        
+        plans = {
+            key: self._get_stale_metric_groups(key[0], key[1], dict(zip(WATERMARK_FIELDS, key[2])), settled_watermarks)
+            for key in dashboards_by_plan
+        }
+        stale_groups = set().union(*plans.values())
+        ranged_plans = [key for key, groups in plans.items() if groups & {'kpi', 'progress', 'integration'}]
+        
+        # Shared computations, only for the metric groups some dashboard needs
+        if 'student' in stale_groups:
+            student_values = self._get_student_values()
+        if 'kpi' in stale_groups:
+            active_courses = self.env['gr.course.integration'].search_count([('status', '=', 'active')])
+        if 'course' in stale_groups:
+            courses = self.env['gr.course.integration'].search([('status', '=', 'active')])
+        if ranged_plans:
+            Snapshot = self._get_fresh_snapshots(watermarks)
+            window = Snapshot.load_window(min(key[0] for key in ranged_plans), max(key[1] for key in ranged_plans))
+        
+        watermark_values = {field_name: settled_watermarks[model] for model, field_name in WATERMARK_FIELDS.items()}
+        refreshed = 0
+        for (date_from, date_to, marks), dashboards in dashboards_by_plan.items():
+            groups = plans[(date_from, date_to, marks)]
+            try:
+                values = dict(watermark_values)
+                if groups:
+                    values['last_update'] = fields.Datetime.now()
+                if 'student' in groups:
+                    values.update(student_values)
+                if 'kpi' in groups:
+                    values.update(self._get_kpi_values(window, date_from, date_to))
+                    values['active_courses'] = active_courses
+                if 'progress' in groups:
+                    values.update(self._get_progress_values(window, date_from, date_to))
+                if 'course' in groups:
+                    values.update(self._get_course_values(courses, date_from, date_to))
+                if 'integration' in groups:
+                    values.update(self._get_integration_values(window, date_from, date_to))
+                if groups or any(mark != watermark_values[field_name]
+                                 for mark, field_name in zip(marks, WATERMARK_FIELDS.values())):
+                    dashboards.write(values)
+                if groups:
+                    refreshed += len(dashboards)
+            except Exception as e:
+                _logger.error('Failed to refresh dashboards %s: %s', ', '.join(dashboards.mapped('name')), str(e))
+                continue
+        
+        _logger.info('Refreshed %d of %d dashboards (%s)', refreshed, len(self),
+                     ', '.join(sorted(stale_groups)) or 'no changes')
+        return refreshed
+
+    @api.model
+    def _get_fresh_snapshots(self, watermarks=None):
+        """Return the snapshot model, refreshed with the source changes it has not seen."""
+        watermarks = watermarks or self._get_source_watermarks()
+        Snapshot = self.env['gr.training.analytics.snapshot']
+        Snapshot.refresh_if_stale(last_change=max(watermarks['gr.student'], watermarks['gr.progress.tracker']))
+        return Snapshot
+
+    @api.model
+    def _get_source_watermarks(self):
+        """Return the latest write_date of each source model, EMPTY_WATERMARK when it has no records."""
+        return {
+            model: self.env[model]._read_group([], [], ['write_date:max'])[0][0] or EMPTY_WATERMARK
+            for model in WATERMARK_FIELDS
+        }
+
+    @api.model
+    def _get_stale_metric_groups(self, date_from, date_to, marks, watermarks):
+        """Return the metric groups reading records changed after ``marks``.
+
+        ``marks`` maps each source model to the latest write_date already
+        included, or False when it was never included: every record of the
+        model then counts as changed.
+        """
+        missing = {model for model, mark in marks.items() if not mark}
+        if missing == set(marks):
+            return set(METRIC_GROUP_SOURCES)
+        
+        changed = missing | {model for model, mark in marks.items() if mark and watermarks[model] > mark}
+        ranged_sources = set().union(*(ranged for ranged, _sources in METRIC_GROUP_SOURCES.values()))
+        changed_in_range = missing & ranged_sources | {
+            model for model in (changed - missing) & ranged_sources
+            if self.env[model].search_count([
+                ('write_date', '>', marks[model]),
+                ('create_date', '>=', date_from),
+                ('create_date', '<', date_to + timedelta(days=1)),
+            ], limit=1)
+        }
+        return {
+            group for group, (ranged_sources, sources) in METRIC_GROUP_SOURCES.items()
+            if ranged_sources & changed_in_range or sources & changed
+        }
+
     def action_export_analytics(self):
         """Export analytics data."""
         # This would generate and download analytics reports
@@ -441,50 +597,68 @@ class TrainingDashboard(models.Model):
             if not dashboard:
                 dashboard = self.create({})
 
+        return dashboard.analytics_payload or dashboard._build_analytics_payload()
+
+    def _build_analytics_payload(self):
+        """Return the dashboard data as a JSON-serializable dict."""
+        self.ensure_one()
+        analytics = {
+            field_name: self._load_analytics(self[field_name], default)
+            for field_name, default in ANALYTICS_JSON_FIELDS.items()
+        }
         return {
             'kpi_metrics': {
-                'total_students': dashboard.total_students,
-                'enrolled_students': dashboard.enrolled_students,
-                'completed_students': dashboard.completed_students,
-                'completion_rate': dashboard.completion_rate,
-                'avg_completion_time': dashboard.avg_completion_time,
-                'active_courses': dashboard.active_courses,
-                'total_enrollments': dashboard.total_enrollments,
+                'total_students': self.total_students,
+                'enrolled_students': self.enrolled_students,
+                'completed_students': self.completed_students,
+                'completion_rate': self.completion_rate,
+                'avg_completion_time': self.avg_completion_time,
+                'active_courses': self.active_courses,
+                'total_enrollments': self.total_enrollments,
             },
             'progress_analytics': {
-                'progress_distribution': eval(dashboard.progress_distribution or '{}'),
-                'monthly_enrollments': eval(dashboard.monthly_enrollments or '{}'),
-                'completion_trends': eval(dashboard.completion_trends or '{}'),
+                'progress_distribution': analytics['progress_distribution'],
+                'monthly_enrollments': analytics['monthly_enrollments'],
+                'completion_trends': analytics['completion_trends'],
             },
             'student_analytics': {
-                'top_performers': eval(dashboard.top_performers or '[]'),
-                'struggling_students': eval(dashboard.struggling_students or '[]'),
-                'engagement_metrics': eval(dashboard.engagement_metrics or '{}'),
+                'top_performers': analytics['top_performers'],
+                'struggling_students': analytics['struggling_students'],
+                'engagement_metrics': analytics['engagement_metrics'],
             },
             'course_analytics': {
-                'course_performance': eval(dashboard.course_performance or '[]'),
-                'popular_courses': eval(dashboard.popular_courses or '[]'),
+                'course_performance': analytics['course_performance'],
+                'popular_courses': analytics['popular_courses'],
             },
             'integration_analytics': {
-                'integration_status_summary': eval(dashboard.integration_status_summary or '{}'),
-                'elearning_adoption_rate': dashboard.elearning_adoption_rate,
+                'integration_status_summary': analytics['integration_status_summary'],
+                'elearning_adoption_rate': self.elearning_adoption_rate,
             },
-            'last_update': dashboard.last_update,
+            'last_update': fields.Datetime.to_string(self.last_update),
         }
 
+    @staticmethod
+    def _load_analytics(value, default):
+        """Decode an analytics field, also accepting values stored as Python literals."""
+        if not value:
+            return default
+        try:
+            return json.loads(value)
+        except ValueError:
+            # Dashboards computed before the analytics were stored as JSON
+            try:
+                return ast.literal_eval(value)
+            except (ValueError, SyntaxError):
+                _logger.warning('Could not decode dashboard analytics value: %s', value[:100])
+                return default
+
     @api.model
     def refresh_all_dashboards(self):
         """Refresh all active dashboards."""
         _logger.info('Refreshing all active dashboards...')
         
         active_dashboards = self.search([('auto_refresh', '=', True)])
-        
-        for dashboard in active_dashboards:
-            try:
-                dashboard.action_refresh_dashboard()
-            except Exception as e:
-                _logger.error('Failed to refresh dashboard %s: %s', dashboard.name, str(e))
-                continue
+        active_dashboards._refresh_dashboards()
         
         _logger.info('Dashboard refresh completed for %d dashboards', len(active_dashboards))
         return len(active_dashboards)
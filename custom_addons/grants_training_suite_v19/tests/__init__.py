@@ -3,3 +3,6 @@
 from . import test_student_name_fields
 from . import test_enrollment_fixes
 from . import test_column_mapping
+from . import test_intake_bulk_import
+from . import test_notification_delivery
+from . import test_training_analytics_snapshot
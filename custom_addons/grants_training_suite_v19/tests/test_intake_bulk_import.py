@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+
+import base64
+
+from odoo.tests.common import TransactionCase
+
+
+class TestIntakeBulkImport(TransactionCase):
+    """Test the bulk upsert path used to import intake batch rows."""
+
+    def setUp(self):
+        super(TestIntakeBulkImport, self).setUp()
+        self.Student = self.env['gr.student']
+        self.intake_batch = self.env['gr.intake.batch'].create({
+            'name': 'Test Bulk Import Batch',
+        })
+
+    def _make_record(self, index, **overrides):
+        record = {
+            'name': 'Student %d' % index,
+            'name_arabic': 'Student %d Arabic' % index,
+            'name_english': 'Student %d' % index,
+            'email': 'student%d@example.com' % index,
+            'birth_date': '1995-03-15',
+            'english_level': 'intermediate',
+            'has_certificate': 'true',
+        }
+        record.update(overrides)
+        return record
+
+    def test_bulk_create_and_update_statistics(self):
+        """Test that new rows are created and known emails are updated."""
+        existing = self.Student.create({
+            'name': 'Existing Student',
+            'name_arabic': 'Existing Student Arabic',
+            'name_english': 'Existing Student',
+            'email': 'student1@example.com',
+        })
+        records = [self._make_record(index) for index in range(1, 6)]
+
+        created = self.intake_batch._create_students(records)
+
+        self.assertEqual(len(created), 4)
+        self.assertEqual(self.intake_batch.created_students_count, 4)
+        self.assertEqual(self.intake_batch.updated_students_count, 1)
+        self.assertFalse(self.intake_batch.import_errors)
+        self.assertEqual(existing.name, 'Student 1')
+        self.assertEqual(existing.english_level, 'intermediate')
+
+    def test_repeated_email_in_file_creates_one_student(self):
+        """Test that a repeated email in the same file is merged before insert."""
+        records = [
+            self._make_record(1),
+            self._make_record(1, name='Student 1 Corrected', email='Student1@Example.com'),
+        ]
+
+        created = self.intake_batch._create_students(records)
+
+        self.assertEqual(len(created), 1)
+        self.assertEqual(self.intake_batch.updated_students_count, 0)
+        self.assertEqual(self.Student.search_count([('email', '=ilike', 'student1@example.com')]), 1)
+        self.assertEqual(created[0].name, 'Student 1 Corrected')
+        self.assertIn('Row 2: Merged into row 1', self.intake_batch.import_summary)
+
+    def test_possible_duplicates_are_imported_and_flagged(self):
+        """Test that matches by phone or by name and birth date are created and flagged."""
+        existing = self.Student.create({
+            'name': 'Existing Student',
+            'name_arabic': 'Existing Student Arabic',
+            'name_english': 'Existing Student',
+            'email': 'existing@example.com',
+            'phone': '+966 50 123 4567',
+        })
+        records = [
+            self._make_record(1, phone='0501234567'),
+            self._make_record(2, name='student 3 ', birth_date='1995-03-15'),
+            self._make_record(3),
+        ]
+
+        created = self.intake_batch._create_students(records)
+
+        self.assertEqual([student.email for student in created],
+                         ['student1@example.com', 'student2@example.com', 'student3@example.com'])
+        self.assertEqual(existing.name, 'Existing Student')
+        self.assertEqual(self.intake_batch.created_students_count, 3)
+        self.assertIn('Row 1: Possible duplicate of existing student "Existing Student"', self.intake_batch.import_summary)
+        self.assertIn('(same phone)', self.intake_batch.import_summary)
+        self.assertIn('Row 3: Possible duplicate of row 2 (same name and birth date)', self.intake_batch.import_summary)
+
+    def test_statistics_accumulated_across_chunks(self):
+        """Test that merged rows and possible duplicates add up over background chunks."""
+        self.Student.create({
+            'name': 'Existing Student',
+            'name_arabic': 'Existing Student Arabic',
+            'name_english': 'Existing Student',
+            'email': 'existing@example.com',
+            'phone': '+966 50 123 4567',
+        })
+        first_chunk = [
+            self._make_record(1),
+            self._make_record(1, name='Student 1 Corrected'),
+            self._make_record(2, phone='0501234567'),
+        ]
+        second_chunk = [
+            self._make_record(3),
+            self._make_record(3, name='Student 3 Corrected'),
+            self._make_record(4, phone='966501234567'),
+        ]
+
+        self.intake_batch._create_students(first_chunk, row_offset=0, accumulate=True)
+        self.intake_batch._create_students(second_chunk, row_offset=3, accumulate=True)
+
+        self.assertEqual(self.intake_batch.created_students_count, 4)
+        self.assertEqual(self.intake_batch.skipped_students_count, 2)
+        self.assertEqual(len(self.intake_batch.possible_duplicates.split('\n')), 2)
+        self.assertIn('Row 3: Possible duplicate', self.intake_batch.possible_duplicates)
+        self.assertIn('Row 6: Possible duplicate', self.intake_batch.possible_duplicates)
+        self.assertIn('Total Records Processed: 6', self.intake_batch.import_summary)
+        self.assertIn('Skipped: 2', self.intake_batch.import_summary)
+        self.assertIn('Possible Duplicates: 2', self.intake_batch.import_summary)
+
+    def test_failing_row_does_not_drop_chunk(self):
+        """Test that one invalid row is reported without losing the other rows."""
+        records = [
+            self._make_record(1),
+            self._make_record(2, email='not-an-email'),
+            self._make_record(3),
+        ]
+
+        created = self.intake_batch._create_students(records)
+
+        self.assertEqual(len(created), 2)
+        self.assertEqual(self.intake_batch.created_students_count, 2)
+        self.assertIn('Row 2:', self.intake_batch.import_errors)
+
+    def test_parsed_rows_cache(self):
+        """Test that the first full parse is cached and dropped when the file changes."""
+        csv_data = (
+            b"name,name_arabic,name_english,email\n"
+            b"John Doe,John Doe Arabic,John Doe,john@example.com\n"
+            b"Jane Smith,Jane Smith Arabic,Jane Smith,jane@example.com\n"
+        )
+        self.intake_batch.write({
+            'file_data': base64.b64encode(csv_data),
+            'filename': 'students.csv',
+        })
+
+        self.intake_batch.action_upload_file()
+
+        self.assertEqual(self.intake_batch.total_records, 2)
+        self.assertTrue(self.intake_batch.row_cache_id)
+        cached_rows = list(self.intake_batch._iter_row_cache())
+        self.assertEqual(cached_rows, list(self.intake_batch._iter_source_rows()))
+        self.assertEqual(cached_rows[1]['email'], 'jane@example.com')
+
+        self.intake_batch.write({'file_data': base64.b64encode(csv_data.splitlines(True)[0])})
+
+        self.assertFalse(self.intake_batch.row_cache_id)
+        self.assertFalse(self.intake_batch.row_cache_checksum)
+
+    def test_date_format_detected_once_per_column(self):
+        """Test that the dominant date format is used by validation and creation."""
+        records = [
+            self._make_record(1, birth_date='25/12/1990'),
+            self._make_record(2, birth_date='03/04/1992'),
+            self._make_record(3, birth_date='1993-07-01'),
+            self._make_record(4, birth_date='31/31/1994'),
+        ]
+
+        errors = self.intake_batch._validate_records(records)
+
+        self.assertEqual(len(errors), 1)
+        self.assertIn('Row 4:', errors[0])
+        self.assertIn('"03/04/1992"', self.intake_batch.validation_warnings)
+
+        created = self.intake_batch._create_students(records)
+
+        birth_dates = {student.email: student.birth_date for student in created}
+        self.assertEqual(str(birth_dates['student2@example.com']), '1992-04-03')
+        self.assertEqual(str(birth_dates['student3@example.com']), '1993-07-01')
+        self.assertFalse(birth_dates['student4@example.com'])
+
+    def test_eligibility_assessed_after_import(self):
+        """Test that imported students get their eligibility state after the import."""
+        records = [
+            self._make_record(1),
+            self._make_record(2, english_level='beginner'),
+        ]
+
+        created = self.intake_batch._create_students(records)
+
+        states = {student.email: student.state for student in created}
+        self.assertEqual(states['student1@example.com'], 'eligible')
+        self.assertEqual(states['student2@example.com'], 'rejected')
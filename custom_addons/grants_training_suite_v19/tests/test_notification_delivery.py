@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from odoo import fields
+from odoo.tests.common import TransactionCase
+
+from odoo.addons.grants_training_suite_v19.models.notification_system import (
+    DELIVERY_RETRY_MINUTES,
+    MAX_DELIVERY_ATTEMPTS,
+)
+
+
+class TestNotificationDelivery(TransactionCase):
+    """Test the retries of the notification delivery queue."""
+
+    def setUp(self):
+        super(TestNotificationDelivery, self).setUp()
+        self.Notification = self.env['gr.progress.notification']
+        self.student = self.env['gr.student'].create({
+            'name': 'Notified Student',
+            'name_arabic': 'Notified Student Arabic',
+            'name_english': 'Notified Student',
+            'email': 'notified.student@example.com',
+        })
+        self.bounced_emails = {'bounce@example.com'}
+
+    def _make_notification(self, email, **overrides):
+        vals = {
+            'name': 'Milestone for %s' % email,
+            'message': 'You reached 25% completion.',
+            'student_id': self.student.id,
+            'recipient_user_id': self.env.user.id,
+            'recipient_email': email,
+            'in_app_notification': False,
+            'status': 'queued',
+            'next_delivery_date': fields.Datetime.now(),
+        }
+        vals.update(overrides)
+        return self.Notification.create(vals)
+
+    def _deliver(self, notifications):
+        """Deliver the notifications, failing the mails to a bounced address."""
+        bounced_emails = self.bounced_emails
+
+        def send(mails, raise_exception=False, **kwargs):
+            for mail in mails:
+                if mail.email_to in bounced_emails:
+                    mail.write({'state': 'exception', 'failure_reason': 'SMTP error'})
+                else:
+                    mail.write({'state': 'sent'})
+
+        with patch.object(type(self.env['mail.mail']), 'send', send):
+            notifications._deliver()
+
+    def test_failed_mail_is_retried_later(self):
+        """Test that a mail failing in a batch is retried after a backoff delay."""
+        delivered = self._make_notification('delivered@example.com')
+        bounced = self._make_notification('bounce@example.com')
+        before = fields.Datetime.now()
+
+        self._deliver(delivered | bounced)
+
+        self.assertEqual(delivered.status, 'sent')
+        self.assertTrue(delivered.email_sent)
+        self.assertEqual(bounced.status, 'queued')
+        self.assertFalse(bounced.email_sent)
+        self.assertEqual(bounced.delivery_attempts, 1)
+        self.assertEqual(bounced.delivery_error, 'SMTP error')
+        self.assertGreaterEqual(bounced.next_delivery_date, before + timedelta(minutes=DELIVERY_RETRY_MINUTES))
+
+    def test_notification_fails_after_max_attempts(self):
+        """Test that a notification is marked failed after the last attempt."""
+        bounced = self._make_notification('bounce@example.com', delivery_attempts=MAX_DELIVERY_ATTEMPTS - 1)
+
+        self._deliver(bounced)
+
+        self.assertEqual(bounced.status, 'failed')
+        self.assertEqual(bounced.delivery_attempts, MAX_DELIVERY_ATTEMPTS)
+        self.assertEqual(bounced.delivery_error, 'SMTP error')
+
+    def test_retry_does_not_resend_delivered_channels(self):
+        """Test that a retry only sends the channels which failed."""
+        notification = self._make_notification('bounce@example.com', in_app_notification=True)
+        activity_domain = [
+            ('res_model', '=', 'gr.progress.notification'),
+            ('res_id', '=', notification.id),
+        ]
+
+        self._deliver(notification)
+
+        self.assertTrue(notification.in_app_sent)
+        self.assertFalse(notification.email_sent)
+        self.assertEqual(notification.status, 'queued')
+        self.assertEqual(self.env['mail.activity'].search_count(activity_domain), 1)
+
+        self.bounced_emails.clear()
+        self._deliver(notification)
+
+        self.assertEqual(notification.status, 'sent')
+        self.assertTrue(notification.email_sent)
+        self.assertEqual(notification.delivery_attempts, 1)
+        self.assertEqual(self.env['mail.activity'].search_count(activity_domain), 1)
+
+    def test_digest_batches_keep_recipients_together(self):
+        """Test that the notifications of a recipient are delivered in the same digest batch."""
+        notifications = (
+            self._make_notification('first@example.com', digest_mode=True)
+            | self._make_notification('second@example.com', digest_mode=True)
+            | self._make_notification('first@example.com', digest_mode=True)
+        )
+
+        with patch('odoo.addons.grants_training_suite_v19.models.notification_system.DELIVERY_BATCH_SIZE', 1):
+            batches = list(notifications._split_digest_batches())
+
+        self.assertEqual(len(batches), 2)
+        self.assertEqual(set(batches[0].mapped('recipient_email')), {'first@example.com'})
+        self.assertEqual(len(batches[0]), 2)
+        self.assertEqual(batches[1].mapped('recipient_email'), ['second@example.com'])
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+
+from datetime import timedelta
+
+from odoo import fields
+from odoo.tests.common import TransactionCase
+
+from odoo.addons.grants_training_suite_v19.models.training_analytics_snapshot import SNAPSHOT_REFRESH_PARAM
+
+
+class TestTrainingAnalyticsSnapshot(TransactionCase):
+    """Test the incremental refresh of the analytics snapshots."""
+
+    def setUp(self):
+        super(TestTrainingAnalyticsSnapshot, self).setUp()
+        self.Snapshot = self.env['gr.training.analytics.snapshot']
+        self.Student = self.env['gr.student']
+
+    def _count_students(self, day):
+        return self.Snapshot.aggregate('student', day, day, [])[0][0] or 0
+
+    def test_late_commit_before_refresh_mark_is_included(self):
+        """Test that a write stamped before the refresh mark, but committed
+        after the refresh, is picked up by the next incremental refresh."""
+        self.Snapshot.refresh_snapshots()
+        refreshed_at = fields.Datetime.to_datetime(
+            self.env['ir.config_parameter'].sudo().get_param(SNAPSHOT_REFRESH_PARAM))
+
+        student = self.Student.create({
+            'name': 'Late Student',
+            'name_arabic': 'Late Student Arabic',
+            'name_english': 'Late Student',
+            'email': 'late.student@example.com',
+        })
+        day = student.create_date.date()
+        before = self._count_students(day)
+
+        # Stamped by a transaction started before the refresh, committed after it
+        late_write_date = refreshed_at - timedelta(minutes=1)
+        self.Student.flush_model()
+        self.env.cr.execute('UPDATE gr_student SET write_date = %s WHERE id = %s', [late_write_date, student.id])
+        self.Student.invalidate_model(['write_date'])
+
+        self.Snapshot.refresh_if_stale(last_change=late_write_date)
+
+        self.assertEqual(self._count_students(day), before + 1)